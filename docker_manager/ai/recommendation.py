@@ -11,6 +11,8 @@ import time
 import random
 import logging
 import docker
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Any, Tuple, Optional
 
 # Internal imports
@@ -24,6 +26,9 @@ logger = logging.getLogger(__name__)
 class ContainerRecommendationEngine:
     """AI-powered recommendation engine for Docker containers."""
     
+    # Number of history entries kept for trend analysis
+    HISTORY_LIMIT = 100
+    
     # Pre-defined templates for common application types
     APPLICATION_TEMPLATES = {
         "web_server": {
@@ -112,16 +117,20 @@ class ContainerRecommendationEngine:
         }
     }
     
-    def __init__(self, demo_mode: bool = False):
+    def __init__(self, demo_mode: bool = False, service_manager: Optional[Any] = None):
         """Initialize recommendation engine.
         
         Args:
             demo_mode: Whether to use demo mode with simulated data
+            service_manager: DockerServiceManager whose Docker client is reused;
+                a client is created per analysis if not given
         """
         self.demo_mode = demo_mode
+        self.service_manager = service_manager
         self.health_report = HealthReport(demo_mode=demo_mode)
-        self.container_history = []
-        self.system_metrics_history = []
+        # Only the most recent entries are kept, in memory and on disk
+        self.container_history = deque(maxlen=self.HISTORY_LIMIT)
+        self.system_metrics_history = deque(maxlen=self.HISTORY_LIMIT)
         self.recommendations_cache = {}
         self.last_analysis_time = 0
         
@@ -132,6 +141,13 @@ class ContainerRecommendationEngine:
         # Load historical data if available
         self._load_historical_data()
     
+    def _get_docker_client(self) -> Any:
+        """Get a Docker client, reusing the service manager's when available."""
+        if self.service_manager is not None:
+            return self.service_manager.get_docker_client()
+        import docker
+        return docker.from_env()
+    
     def _load_historical_data(self) -> bool:
         """Load historical container and system metrics data.
         
@@ -143,19 +159,33 @@ class ContainerRecommendationEngine:
             container_history_file = os.path.join(self.data_dir, "container_history.json")
             if os.path.exists(container_history_file):
                 with open(container_history_file, "r") as f:
-                    self.container_history = json.load(f)
+                    self.container_history = deque(json.load(f), maxlen=self.HISTORY_LIMIT)
             
             # Load system metrics history
             system_metrics_file = os.path.join(self.data_dir, "system_metrics.json")
             if os.path.exists(system_metrics_file):
                 with open(system_metrics_file, "r") as f:
-                    self.system_metrics_history = json.load(f)
+                    self.system_metrics_history = deque(json.load(f), maxlen=self.HISTORY_LIMIT)
             
             return True
         except Exception as e:
             logger.error(f"Error loading historical data: {e}")
             return False
     
+    def history_tail(self, count: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Get the most recent history entries.
+        
+        Args:
+            count: Maximum number of entries to return from each history
+            
+        Returns:
+            Tuple of (container history, system metrics history), oldest first
+        """
+        return (
+            list(islice(self.container_history, max(0, len(self.container_history) - count), None)),
+            list(islice(self.system_metrics_history, max(0, len(self.system_metrics_history) - count), None))
+        )
+    
     def _save_historical_data(self) -> bool:
         """Save historical container and system metrics data.
         
@@ -163,15 +193,15 @@ class ContainerRecommendationEngine:
             True if successful, False otherwise
         """
         try:
-            # Save container history (limit to last 100 entries)
+            # Save container history (already limited to HISTORY_LIMIT entries)
             container_history_file = os.path.join(self.data_dir, "container_history.json")
             with open(container_history_file, "w") as f:
-                json.dump(self.container_history[-100:], f, indent=2)
+                json.dump(list(self.container_history), f, indent=2)
             
-            # Save system metrics history (limit to last 100 entries)
+            # Save system metrics history
             system_metrics_file = os.path.join(self.data_dir, "system_metrics.json")
             with open(system_metrics_file, "w") as f:
-                json.dump(self.system_metrics_history[-100:], f, indent=2)
+                json.dump(list(self.system_metrics_history), f, indent=2)
             
             return True
         except Exception as e:
@@ -239,8 +269,7 @@ class ContainerRecommendationEngine:
         else:
             # In real mode, get actual container data from Docker
             try:
-                import docker
-                client = docker.from_env()
+                client = self._get_docker_client()
                 containers = []
                 
                 for container in client.containers.list(all=True):
@@ -330,8 +359,7 @@ class ContainerRecommendationEngine:
                 # Get Docker information
                 docker_info = {}
                 try:
-                    import docker
-                    client = docker.from_env()
+                    client = self._get_docker_client()
                     info = client.info()
                     docker_info = {
                         "docker_containers_running": info.get("ContainersRunning", 0),
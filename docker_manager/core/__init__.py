@@ -5,4 +5,9 @@ This package contains the core modules for Docker service management,
 including service control, container operations, and system health reporting.
 """
 
-from docker_manager.core.health_report import HealthReport
\ No newline at end of file
+def __getattr__(name):
+    # Import HealthReport (and psutil/matplotlib with it) only when requested
+    if name == 'HealthReport':
+        from docker_manager.core.health_report import HealthReport
+        return HealthReport
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,9 +1,10 @@
 """
 Container logs functionality for Docker service manager.
 """
+import codecs
 import sys
 import time
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 
 try:
     import docker
@@ -24,6 +25,27 @@ class ContainerLogs:
         """
         self.demo_mode = demo_mode
         
+    def stream_container_logs(self, container_id: str, tail: int = 100, follow: bool = False) -> Iterator[str]:
+        """Stream logs for a specific container as they arrive.
+        
+        The container is looked up before returning, so connection errors are
+        raised here rather than on the first read.
+        
+        Args:
+            container_id: Container ID or name
+            tail: Number of lines to show from end of logs
+            follow: Whether to keep streaming new log output
+            
+        Returns:
+            Iterator over decoded chunks of log output
+        """
+        client = docker.from_env()
+        container = client.containers.get(container_id)
+        chunks = container.logs(tail=tail, stream=True, follow=follow, timestamps=True)
+        # Chunks may split a multi-byte character, so decode incrementally
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        return (decoder.decode(chunk) for chunk in chunks)
+        
     def get_container_logs(self, container_id: str, tail: int = 100, follow: bool = False) -> bool:
         """Get logs for a specific container.
         
@@ -85,7 +107,7 @@ class ContainerLogs:
                     while follow_count < 10:  # Limit to 10 entries in demo mode
                         time.sleep(2)
                         current_time = int(time.time())
-                        print(f"[{current_time}] [info] New activity at {time.strftime('%H:%M:%S')}")
+                        print(f"[{current_time}] [info] New activity at {time.strftime('%H:%M:%S')}", flush=True)
                         follow_count += 1
                 except KeyboardInterrupt:
                     print("\nStopped following logs")
@@ -101,23 +123,18 @@ class ContainerLogs:
             
         try:
             print(f"Connecting to Docker to get logs for container '{container_id}'...")
-            client = docker.from_env()
-            container = client.containers.get(container_id)
-            
-            # Get container logs
-            logs = container.logs(tail=tail, stream=follow, timestamps=True).decode('utf-8')
+            logs = self.stream_container_logs(container_id, tail=tail, follow=follow)
             
-            if not follow:
-                # Print logs directly
-                print(logs)
-            else:
-                # Stream logs in follow mode
+            if follow:
                 print("\nPress Ctrl+C to stop following logs...\n")
-                try:
-                    for line in logs:
-                        print(line, end='')
-                except KeyboardInterrupt:
-                    print("\nStopped following logs")
+            
+            # Write output as it arrives instead of waiting for the whole log
+            try:
+                for chunk in logs:
+                    sys.stdout.write(chunk)
+                    sys.stdout.flush()
+            except KeyboardInterrupt:
+                print("\nStopped following logs")
             
             return True
         except DockerException as e:
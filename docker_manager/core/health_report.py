@@ -31,6 +31,22 @@ from docker_manager.utils.display import (
     get_terminal_size
 )
 
+# Overall report status keyed by (issues count bucket, has critical issue).
+# Issue counts above 4 all map to "critical", so they share bucket 5.
+_OVERALL_STATUS_BUCKETS = 5
+_OVERALL_STATUS = {(0, False): "excellent", (0, True): "excellent"}
+for _count in range(1, _OVERALL_STATUS_BUCKETS + 1):
+    _OVERALL_STATUS[(_count, False)] = (
+        "good" if _count <= 2 else "warning" if _count <= 4 else "critical"
+    )
+    _OVERALL_STATUS[(_count, True)] = "warning" if _count <= 4 else "critical"
+del _count
+
+# Precompiled recommendation output formatters
+_RECOMMENDATION_LINE = "{index}. [{type}] {title}: {description}".format_map
+_RECOMMENDATION_ACTION = "   - Suggested action: {action}".format_map
+_RECOMMENDATION_DEFAULTS = {"title": "Recommendation", "description": "", "action": ""}
+
 
 class HealthReport:
     """System health report generator with visual metrics."""
@@ -90,6 +106,10 @@ class HealthReport:
         self.metrics_cache = {}
         self.metrics_timestamp = 0
         self.report_data = {}
+        self.collected_at = 0.0
+        self._running_containers = []
+        self._last_rec_key = None
+        self._last_recs = None
         self.chart_files = []
         self.temp_dir = tempfile.mkdtemp(prefix='docker_manager_report_')
 
@@ -488,11 +508,8 @@ class HealthReport:
             return None
         
         try:
-            docker_data = self.report_data.get("docker", {})
-            containers = docker_data.get("containers", {}).get("containers", [])
-            
-            running_containers = [c for c in containers if c.get("status") == "running" 
-                                 and "cpu_percent" in c and "memory_percent" in c]
+            running_containers = [c for c in self._running_containers
+                                 if "cpu_percent" in c and "memory_percent" in c]
             
             if not running_containers:
                 if self.demo_mode:
@@ -617,9 +634,10 @@ class HealthReport:
         print_section("System Health Report")
         print_status("Collecting system information...", "info")
         
-        # Collect data
+        # Collect data, stamping the report with the collection time
+        self.collected_at = time.time()
         self.report_data = {
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": datetime.datetime.fromtimestamp(self.collected_at).isoformat(),
             "system": {
                 "os": platform.system(),
                 "platform": platform.platform(),
@@ -641,6 +659,10 @@ class HealthReport:
         # Add Docker metrics
         print_status("Collecting Docker metrics...", "info")
         self.report_data["docker"] = self._get_docker_metrics()
+        self._running_containers = [
+            c for c in self.report_data["docker"].get("containers", {}).get("containers", [])
+            if c.get("status") == "running"
+        ]
         
         # Generate recommendations based on collected data
         print_status("Generating recommendations...", "info")
@@ -661,6 +683,18 @@ class HealthReport:
         
         return True
     
+    def _collection_time(self) -> datetime.datetime:
+        """Get the time the report data was collected.
+        
+        Stamps the current time if no data has been collected yet.
+        
+        Returns:
+            Collection time as a local datetime
+        """
+        if not self.collected_at:
+            self.collected_at = time.time()
+        return datetime.datetime.fromtimestamp(self.collected_at)
+    
     def _display_report(self, has_charts: bool = False) -> None:
         """Display the health report in the terminal.
         
@@ -673,7 +707,7 @@ class HealthReport:
         # Report Header
         print()
         print_section("Docker Service Manager - System Health Report")
-        print(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Generated: {self._collection_time().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"System: {self.report_data['system']['os']} ({self.report_data['system']['platform']})")
         print(f"Hostname: {self.report_data['system']['hostname']}")
         print(divider)
@@ -762,8 +796,7 @@ class HealthReport:
                 print_section("Running Containers")
                 
                 # Create table of running containers
-                running_containers = [c for c in containers.get("containers", []) 
-                                     if c.get("status") == "running"]
+                running_containers = self._running_containers
                 
                 if running_containers:
                     headers = ["Name", "Image", "CPU %", "Memory Usage", "Memory %"]
@@ -828,22 +861,24 @@ class HealthReport:
         print(divider)
         print("Report completed.\n")
     
-    def _generate_recommendations(self) -> None:
-        """Generate structured recommendations based on collected data."""
-        system = self.report_data.get("system", {})
-        docker = self.report_data.get("docker", {})
-        
-        # Reset recommendations
-        self.report_data["recommendations"] = []
+    def _check_system_metrics(self, system: Dict[str, Any],
+                              recommendations: List[Dict[str, Any]]) -> int:
+        """Append CPU, memory and disk recommendations.
         
-        # Track issues count for status
+        Args:
+            system: System section of the report data
+            recommendations: List to append recommendations to
+            
+        Returns:
+            Number of issues found
+        """
         issues_count = 0
         
         # CPU recommendations
         cpu_data = system.get("cpu", {})
         cpu_percent = cpu_data.get("percent", 0)
         if cpu_percent > 80:
-            self.report_data["recommendations"].append({
+            recommendations.append({
                 "type": "critical",
                 "component": "cpu",
                 "title": "High CPU Usage",
@@ -853,7 +888,7 @@ class HealthReport:
             })
             issues_count += 1
         elif cpu_percent > 70:
-            self.report_data["recommendations"].append({
+            recommendations.append({
                 "type": "warning",
                 "component": "cpu",
                 "title": "Elevated CPU Usage",
@@ -867,7 +902,7 @@ class HealthReport:
         mem_data = system.get("memory", {})
         mem_percent = mem_data.get("percent", 0)
         if mem_percent > 85:
-            self.report_data["recommendations"].append({
+            recommendations.append({
                 "type": "critical",
                 "component": "memory",
                 "title": "High Memory Usage",
@@ -877,7 +912,7 @@ class HealthReport:
             })
             issues_count += 1
         elif mem_percent > 75:
-            self.report_data["recommendations"].append({
+            recommendations.append({
                 "type": "warning",
                 "component": "memory",
                 "title": "Elevated Memory Usage",
@@ -891,7 +926,7 @@ class HealthReport:
         disk_data = system.get("disk", {})
         disk_percent = disk_data.get("percent", 0)
         if disk_percent > 85:
-            self.report_data["recommendations"].append({
+            recommendations.append({
                 "type": "critical",
                 "component": "disk",
                 "title": "High Disk Usage",
@@ -901,7 +936,7 @@ class HealthReport:
             })
             issues_count += 1
         elif disk_percent > 75:
-            self.report_data["recommendations"].append({
+            recommendations.append({
                 "type": "warning",
                 "component": "disk",
                 "title": "Elevated Disk Usage",
@@ -911,9 +946,75 @@ class HealthReport:
             })
             issues_count += 1
         
-        # Docker status recommendations
+        return issues_count
+    
+    def _finalize_recommendations(self, key: Tuple, recommendations: List[Dict[str, Any]],
+                                  issues_count: int) -> None:
+        """Store recommendations and the derived overall status.
+        
+        Args:
+            key: Recommendation input key used for memoization
+            recommendations: Generated recommendations
+            issues_count: Number of issues found
+        """
+        self.report_data["recommendations"] = recommendations
+        
+        # Update overall status based on recommendations
+        has_critical = any(r.get("type") == "critical" for r in recommendations)
+        self.report_data["status"]["overall"] = _OVERALL_STATUS[
+            (min(issues_count, _OVERALL_STATUS_BUCKETS), has_critical)
+        ]
+        self.report_data["status"]["issues_count"] = issues_count
+        
+        self._last_rec_key = key
+        self._last_recs = (list(recommendations), dict(self.report_data["status"]))
+    
+    def _recommendation_key(self) -> Tuple:
+        """Build a hashable key from the inputs that drive recommendations.
+        
+        Returns:
+            Tuple identifying the current recommendation inputs
+        """
+        system = self.report_data.get("system", {})
+        docker = self.report_data.get("docker", {})
+        containers = docker.get("containers", {})
+        
+        return (
+            system.get("cpu", {}).get("percent", 0),
+            system.get("memory", {}).get("percent", 0),
+            system.get("disk", {}).get("percent", 0),
+            docker.get("status"),
+            containers.get("stopped", 0),
+            tuple(
+                (c.get("name", "Unknown"),
+                 c.get("cpu_percent", 0) > 80,
+                 c.get("memory_percent", 0) > 80)
+                for c in self._running_containers
+            )
+        )
+    
+    def _generate_recommendations(self) -> None:
+        """Generate structured recommendations based on collected data.
+        
+        Results are memoized on the recommendation inputs, so repeated
+        reports over unchanged data reuse the previous recommendations.
+        """
+        key = self._recommendation_key()
+        if self._last_recs is not None and key == self._last_rec_key:
+            recommendations, status = self._last_recs
+            self.report_data["recommendations"] = list(recommendations)
+            self.report_data["status"].update(status)
+            return
+        
+        system = self.report_data.get("system", {})
+        docker = self.report_data.get("docker", {})
+        
+        recommendations = []
+        issues_count = self._check_system_metrics(system, recommendations)
+        
+        # Docker status recommendations; container checks only apply to a running daemon
         if docker.get("status") != "running":
-            self.report_data["recommendations"].append({
+            recommendations.append({
                 "type": "critical",
                 "component": "docker",
                 "title": "Docker Daemon Not Running",
@@ -921,62 +1022,53 @@ class HealthReport:
                 "metrics": {"current": "stopped", "expected": "running"},
                 "action": "systemctl start docker (or appropriate command for your system)"
             })
+            self._finalize_recommendations(key, recommendations, issues_count + 1)
+            return
+        
+        # Container recommendations
+        containers = docker.get("containers", {})
+        stopped_count = containers.get("stopped", 0)
+        if stopped_count > 5:
+            recommendations.append({
+                "type": "warning",
+                "component": "containers",
+                "title": "Stopped Containers",
+                "description": f"You have {stopped_count} stopped containers that could be cleaned up.",
+                "metrics": {"current": stopped_count, "threshold": 5},
+                "action": "docker container prune"
+            })
             issues_count += 1
-        else:
-            # Container recommendations
-            containers = docker.get("containers", {})
-            stopped_count = containers.get("stopped", 0)
-            if stopped_count > 5:
-                self.report_data["recommendations"].append({
-                    "type": "warning",
-                    "component": "containers",
-                    "title": "Stopped Containers",
-                    "description": f"You have {stopped_count} stopped containers that could be cleaned up.",
-                    "metrics": {"current": stopped_count, "threshold": 5},
-                    "action": "docker container prune"
-                })
-                issues_count += 1
-            
-            # Performance recommendations for running containers
-            running_containers = [c for c in containers.get("containers", []) if c.get("status") == "running"]
-            high_cpu_containers = [c for c in running_containers if c.get("cpu_percent", 0) > 80]
-            
-            if high_cpu_containers:
-                container_names = ", ".join([c.get("name", "Unknown") for c in high_cpu_containers])
-                self.report_data["recommendations"].append({
-                    "type": "critical",
-                    "component": "container_cpu",
-                    "title": "High Container CPU Usage",
-                    "description": f"High CPU usage detected in containers: {container_names}",
-                    "metrics": {"containers": len(high_cpu_containers), "threshold": 80},
-                    "action": "docker update --cpus=X container_name"
-                })
-                issues_count += 1
-            
-            high_mem_containers = [c for c in running_containers if c.get("memory_percent", 0) > 80]
-            if high_mem_containers:
-                container_names = ", ".join([c.get("name", "Unknown") for c in high_mem_containers])
-                self.report_data["recommendations"].append({
-                    "type": "critical",
-                    "component": "container_memory",
-                    "title": "High Container Memory Usage",
-                    "description": f"High memory usage detected in containers: {container_names}",
-                    "metrics": {"containers": len(high_mem_containers), "threshold": 80},
-                    "action": "docker update --memory=X container_name"
-                })
-                issues_count += 1
         
-        # Update overall status based on recommendations
-        if issues_count == 0:
-            self.report_data["status"]["overall"] = "excellent"
-        elif issues_count <= 2 and not any(r.get("type") == "critical" for r in self.report_data["recommendations"]):
-            self.report_data["status"]["overall"] = "good"
-        elif issues_count <= 4:
-            self.report_data["status"]["overall"] = "warning"
-        else:
-            self.report_data["status"]["overall"] = "critical"
+        # Performance recommendations for running containers
+        running_containers = self._running_containers
+        high_cpu_containers = [c for c in running_containers if c.get("cpu_percent", 0) > 80]
         
-        self.report_data["status"]["issues_count"] = issues_count
+        if high_cpu_containers:
+            container_names = ", ".join([c.get("name", "Unknown") for c in high_cpu_containers])
+            recommendations.append({
+                "type": "critical",
+                "component": "container_cpu",
+                "title": "High Container CPU Usage",
+                "description": f"High CPU usage detected in containers: {container_names}",
+                "metrics": {"containers": len(high_cpu_containers), "threshold": 80},
+                "action": "docker update --cpus=X container_name"
+            })
+            issues_count += 1
+        
+        high_mem_containers = [c for c in running_containers if c.get("memory_percent", 0) > 80]
+        if high_mem_containers:
+            container_names = ", ".join([c.get("name", "Unknown") for c in high_mem_containers])
+            recommendations.append({
+                "type": "critical",
+                "component": "container_memory",
+                "title": "High Container Memory Usage",
+                "description": f"High memory usage detected in containers: {container_names}",
+                "metrics": {"containers": len(high_mem_containers), "threshold": 80},
+                "action": "docker update --memory=X container_name"
+            })
+            issues_count += 1
+        
+        self._finalize_recommendations(key, recommendations, issues_count)
     
     def _display_recommendations(self) -> None:
         """Display system and Docker health recommendations."""
@@ -986,15 +1078,18 @@ class HealthReport:
         
         # Display recommendations
         if recommendations:
+            lines = []
             for i, recommendation in enumerate(recommendations, 1):
-                rec_type = recommendation.get("type", "info").upper()
-                title = recommendation.get("title", "Recommendation")
-                description = recommendation.get("description", "")
-                action = recommendation.get("action", "")
-                
-                print(f"{i}. [{rec_type}] {title}: {description}")
-                if action:
-                    print(f"   - Suggested action: {action}")
+                fields = {
+                    **_RECOMMENDATION_DEFAULTS,
+                    **recommendation,
+                    "index": i,
+                    "type": recommendation.get("type", "info").upper()
+                }
+                lines.append(_RECOMMENDATION_LINE(fields))
+                if fields["action"]:
+                    lines.append(_RECOMMENDATION_ACTION(fields))
+            print("\n".join(lines))
         else:
             print("No specific recommendations at this time. System appears to be healthy.")
     
@@ -1010,7 +1105,7 @@ class HealthReport:
         try:
             # Create a serializable version of the report data
             serializable_data = {
-                "timestamp": self.report_data.get("timestamp", datetime.datetime.now().isoformat()),
+                "timestamp": self.report_data.get("timestamp") or self._collection_time().isoformat(),
                 "system": self.report_data.get("system", {}),
                 "docker": self.report_data.get("docker", {}),
                 "recommendations": self.report_data.get("recommendations", []),
@@ -6,378 +6,684 @@ import os
 import platform
 import time
 import subprocess
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any, Union
-
-try:
-    import docker
-    from docker.errors import DockerException
-    DOCKER_AVAILABLE = True
-except ImportError:
-    DOCKER_AVAILABLE = False
-
-try:
-    from tabulate import tabulate
-    TABULATE_AVAILABLE = True
-except ImportError:
-    TABULATE_AVAILABLE = False
+import logging
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Any, Union, Sequence, Callable
+
+logger = logging.getLogger(__name__)
+
+# The Docker SDK and tabulate are imported on first use, keeping module import
+# cheap for demo mode, --help and other paths that never touch Docker.
+# The availability flags stay None until the first load attempt.
+_docker = None
+DOCKER_AVAILABLE = None
+_tabulate = None
+TABULATE_AVAILABLE = None
+
+
+class DockerException(Exception):
+    """Placeholder replaced by docker.errors.DockerException once the SDK is loaded."""
+
+
+def _load_docker() -> Any:
+    """Import the Docker SDK on first use.
+
+    Returns:
+        The docker module, or None if it is not installed
+    """
+    global _docker, DockerException, DOCKER_AVAILABLE
+    if DOCKER_AVAILABLE is None:
+        try:
+            import docker
+            from docker.errors import DockerException as _DockerException
+        except ImportError:
+            DOCKER_AVAILABLE = False
+        else:
+            _docker = docker
+            DockerException = _DockerException
+            DOCKER_AVAILABLE = True
+    return _docker
+
+
+def _load_tabulate() -> Optional[Callable[..., str]]:
+    """Import tabulate on first use.
+
+    Returns:
+        The tabulate function, or None if it is not installed
+    """
+    global _tabulate, TABULATE_AVAILABLE
+    if TABULATE_AVAILABLE is None:
+        try:
+            from tabulate import tabulate
+        except ImportError:
+            TABULATE_AVAILABLE = False
+        else:
+            _tabulate = tabulate
+            TABULATE_AVAILABLE = True
+    return _tabulate
+
+if platform.system().lower() == 'windows':
+    try:
+        import ctypes
+        _IsUserAnAdmin = ctypes.windll.shell32.IsUserAnAdmin
+    except Exception:
+        _IsUserAnAdmin = None
+
+_SOCKET_COMMAND_KEYS = ('socket_status', 'socket_start', 'socket_stop', 'socket_enable', 'socket_disable')
+_SERVICE_COMMAND_KEYS = ('status', 'start', 'stop', 'restart', 'enable', 'disable') + _SOCKET_COMMAND_KEYS
+
+
+def _echo_commands(message: str, keys: Tuple[str, ...] = _SERVICE_COMMAND_KEYS) -> Dict[str, Tuple[str, ...]]:
+    """Build a command table where each command just echoes a message."""
+    return {key: ('echo', message) for key in keys}
+
+
+# Status output skips the journal tail; is-active prints just the unit state
+# and is used for readiness checks
+_SYSTEMD_COMMANDS = {
+    'status': ('systemctl', 'status', 'docker', '--no-pager', '--lines=0'),
+    'start': ('systemctl', 'start', 'docker'),
+    'stop': ('systemctl', 'stop', 'docker'),
+    'restart': ('systemctl', 'restart', 'docker'),
+    'enable': ('systemctl', 'enable', 'docker'),
+    'disable': ('systemctl', 'disable', 'docker'),
+    'socket_status': ('systemctl', 'status', 'docker.socket', '--no-pager', '--lines=0'),
+    'socket_start': ('systemctl', 'start', 'docker.socket'),
+    'socket_stop': ('systemctl', 'stop', 'docker.socket'),
+    'socket_enable': ('systemctl', 'enable', 'docker.socket'),
+    'socket_disable': ('systemctl', 'disable', 'docker.socket'),
+    'is_active': ('systemctl', 'is-active', 'docker'),
+    'socket_is_active': ('systemctl', 'is-active', 'docker.socket')
+}
+
+_SYSVINIT_COMMANDS = {
+    **_echo_commands('Socket management not supported with SysVinit', _SOCKET_COMMAND_KEYS),
+    'status': ('service', 'docker', 'status'),
+    'start': ('service', 'docker', 'start'),
+    'stop': ('service', 'docker', 'stop'),
+    'restart': ('service', 'docker', 'restart'),
+    'enable': ('update-rc.d', 'docker', 'defaults'),
+    'disable': ('update-rc.d', 'docker', 'remove')
+}
+
+# Dedicated readiness check for each status command, where the init system has one
+_PROBE_KEYS = {'status': 'is_active', 'socket_status': 'socket_is_active'}
+
+# Neither systemd nor SysVinit detected
+_UNDETECTED_LINUX_COMMANDS = _echo_commands('Docker service not detected (NixOS or container environment)')
+
+# launchctl has no restart command, so restarts run stop and start separately
+_DARWIN_COMMANDS = {
+    **_echo_commands('Socket management not applicable on macOS', _SOCKET_COMMAND_KEYS),
+    'status': ('launchctl', 'list', 'com.docker.docker'),
+    'start': ('launchctl', 'start', 'com.docker.docker'),
+    'stop': ('launchctl', 'stop', 'com.docker.docker'),
+    'enable': ('launchctl', 'load', '-w', '/Library/LaunchDaemons/com.docker.docker.plist'),
+    'disable': ('launchctl', 'unload', '-w', '/Library/LaunchDaemons/com.docker.docker.plist')
+}
+
+# Windows uses named pipes instead of sockets. As on macOS there is no
+# restart command, so restarts run stop and start separately.
+_WINDOWS_COMMANDS = {
+    **_echo_commands('Socket management not applicable on Windows', _SOCKET_COMMAND_KEYS),
+    'status': ('sc', 'query', 'docker'),
+    'start': ('net', 'start', 'docker'),
+    'stop': ('net', 'stop', 'docker'),
+    'enable': ('sc', 'config', 'docker', 'start=', 'auto'),
+    'disable': ('sc', 'config', 'docker', 'start=', 'disabled')
+}
+
+_COMMANDS_BY_KEY = {
+    ('linux', 'systemd'): _SYSTEMD_COMMANDS,
+    ('linux', 'sysvinit'): _SYSVINIT_COMMANDS,
+    ('darwin', None): _DARWIN_COMMANDS,
+    ('windows', None): _WINDOWS_COMMANDS
+}
+
+
+@lru_cache(maxsize=8)
+def _default_commands(system: str) -> Dict[str, Tuple[str, ...]]:
+    """Get fallback commands for systems without a dedicated command table."""
+    if system == 'linux':
+        return _UNDETECTED_LINUX_COMMANDS
+
+    # Default to commands that will show helpful error
+    return {
+        **_echo_commands(f'Service management not implemented for {system}'),
+        **_echo_commands(f'Socket management not implemented for {system}', _SOCKET_COMMAND_KEYS)
+    }
+
+
+def _print_container_table(table_data: Sequence[Sequence[str]]) -> None:
+    """Print container rows as a table with a single write."""
+    headers = ["ID", "Name", "Status", "Created", "Image"]
+    tabulate = _load_tabulate()
+    if tabulate:
+        print(tabulate(table_data, headers=headers, tablefmt="pretty"))
+    else:
+        lines = ["CONTAINER ID | NAME | STATUS | CREATED | IMAGE", "-" * 80]
+        lines.extend(" | ".join(row) for row in table_data)
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+_GIB = 1 << 30
+
+
+def _format_gib(num_bytes: int) -> str:
+    """Format a byte count as gigabytes with two decimals using integer math."""
+    hundredths = (num_bytes * 100 + _GIB // 2) // _GIB
+    whole, fraction = divmod(hundredths, 100)
+    return f"{whole}.{fraction:02d} GB"
+
+
+def _docker_info_sections(info: Dict[str, Any]) -> Tuple[Tuple[str, List[List[str]]], ...]:
+    """Extract the titled key/value sections shown by check_docker_info.
+
+    Args:
+        info: Result of the Docker client's info() call
+
+    Returns:
+        Tuple of (title, rows) pairs
+    """
+    return (
+        ("Docker System Information", [
+            ["Docker Version", info.get('ServerVersion', 'Unknown')],
+            ["OS/Arch", f"{info.get('OperatingSystem', 'Unknown')}/{info.get('Architecture', 'Unknown')}"],
+            ["Kernel Version", info.get('KernelVersion', 'Unknown')],
+            ["Containers", str(info.get('Containers', 'Unknown'))],
+            ["Images", str(info.get('Images', 'Unknown'))],
+            ["CPUs", str(info.get('NCPU', 'Unknown'))],
+            ["Memory", _format_gib(info.get('MemTotal') or 0)]
+        ]),
+        ("Storage Driver", [
+            ["Driver", info.get('Driver', 'Unknown')],
+            ["Root Dir", info.get('DockerRootDir', 'Unknown')]
+        ]),
+        ("Network", _network_rows(info))
+    )
+
+
+def _network_rows(info: Dict[str, Any]) -> List[List[str]]:
+    """Extract network plugin rows from Docker info in a single pass.
+
+    The Engine API reports network plugins as a list of driver names; a
+    mapping of name to details is accepted as well.
+    """
+    network = (info.get('Plugins') or {}).get('Network') or ()
+    if isinstance(network, dict):
+        return [[name, str(details)] for name, details in network.items()]
+    return [[name, f"{name.capitalize()} network driver"] for name in network]
+
+
+def _format_key_values(rows: Sequence[Sequence[str]], width: int) -> List[str]:
+    """Format key/value rows as lines with keys padded to a common width."""
+    return [f"{key:<{width}}  {value}" for key, value in rows]
+
+
+def _print_info_sections(sections: Sequence[Tuple[str, Sequence[Sequence[str]]]]) -> None:
+    """Print titled key/value sections with a single write.
+
+    Two-column tables are simple enough to pad by hand, so tabulate is not used.
+    """
+    width = max((len(row[0]) for _, rows in sections for row in rows), default=0)
+    parts = []
+    for title, rows in sections:
+        parts.append(f"\n=== {title} ===")
+        parts.extend(_format_key_values(rows, width))
+    sys.stdout.write("\n".join(parts) + "\n")
+
+
+@lru_cache(maxsize=1)
+def _check_admin_privileges(system: str) -> bool:
+    """Check if script is running with administrative privileges.
+
+    Privileges cannot change during the process lifetime, so the result is cached.
+    """
+    try:
+        if system == 'windows':
+            return _IsUserAnAdmin() != 0
+        else:  # Linux, macOS, etc.
+            return os.geteuid() == 0
+    except Exception:
+        # If we can't determine, assume not admin
+        return False
+
+
+# Paths whose presence identifies the Linux init system
+_INIT_SYSTEM_MARKERS = (
+    ('/run/systemd/system', 'systemd'),
+    ('/etc/init.d', 'sysvinit'),
+    ('/sbin/initctl', 'upstart')
+)
+
+
+@lru_cache(maxsize=1)
+def _detect_init_system() -> Optional[str]:
+    """Detect which init system is used on Linux.
+
+    The init system cannot change during the process lifetime, so the result is cached.
+    """
+    # Probe marker paths in order of real-world frequency; a single stat
+    # settles the common systemd case
+    for path, init_system in _INIT_SYSTEM_MARKERS:
+        try:
+            os.stat(path)
+        except OSError:
+            continue
+        return init_system
+
+    # Couldn't determine
+    return None
+
+
+# Suggested ways to gain administrative privileges, per OS
+_PRIVILEGE_HINTS = {
+    'linux': "Try running with 'sudo' or as root",
+    'darwin': "Try running with 'sudo' or as root",
+    'windows': "Try running as Administrator"
+}
+
+# Colored container status labels: green for running, red for exited,
+# yellow for everything else
+_STATUS_COLORS = {
+    'running': "\033[92mrunning\033[0m",
+    'exited': "\033[91mexited\033[0m",
+    'paused': "\033[93mpaused\033[0m",
+    'restarting': "\033[93mrestarting\033[0m",
+    'created': "\033[93mcreated\033[0m",
+    'dead': "\033[93mdead\033[0m",
+    'removing': "\033[93mremoving\033[0m"
+}
+
+_DEMO_STATUS_BANNER = (
+    "\033[93mDEMO MODE\033[0m: Simulating Docker service status\n"
+    "Docker service is \033[92mrunning\033[0m\n"
+    "Status: Active\n"
+    "Docker version: 20.10.12\n"
+    "Containers: 4 (3 Running, 1 Stopped)\n"
+    "Images: 12\n"
+)
+
+_DEMO_SOCKET_STATUS_BANNER = (
+    "\033[93mDEMO MODE\033[0m: Simulating Docker socket status\n"
+    "Docker socket is \033[92mactive\033[0m\n"
+    "Socket listening at: /var/run/docker.sock\n"
+)
+
+_DEMO_INFO_SECTIONS = (
+    ("Docker System Information (Demo Mode)", (
+        ("Docker Version", "20.10.12"),
+        ("OS/Arch", "Linux/x86_64"),
+        ("Kernel Version", "5.4.0-81-generic"),
+        ("Containers", "4"),
+        ("Images", "12"),
+        ("CPUs", "8"),
+        ("Memory", "16.00 GB")
+    )),
+    ("Storage Driver", (
+        ("Driver", "overlay2"),
+        ("Root Dir", "/var/lib/docker")
+    )),
+    ("Network", (
+        ("bridge", "Bridge network driver"),
+        ("host", "Host network driver"),
+        ("overlay", "Overlay network driver"),
+        ("macvlan", "Macvlan network driver")
+    ))
+)
+
+_DEMO_CONTAINERS = (
+    ("abc123", "demo-webserver", _STATUS_COLORS['running'], "2023-01-01 09:00:00", "nginx:latest"),
+    ("def456", "demo-database", _STATUS_COLORS['running'], "2023-01-01 09:01:15", "mysql:8.0"),
+    ("ghi789", "demo-redis", _STATUS_COLORS['restarting'], "2023-01-01 09:02:30", "redis:alpine"),
+    ("jkl012", "demo-backup", _STATUS_COLORS['exited'], "2023-01-01 09:03:45", "alpine:latest")
+)
+
+# Substrings of the status command output that indicate a running service
+# or socket, per OS. Systems without an entry are not checked.
+_ACTIVE_TOKENS = {
+    'status': {
+        'linux': ('active',),
+        'darwin': ('running', 'active'),
+        'windows': ('running',)
+    },
+    'socket_status': {
+        'linux': ('active',)
+    }
+}
+
+
+@lru_cache(maxsize=256)
+def _format_timestamp(timestamp: int) -> str:
+    """Format a Unix timestamp as local time; containers started together share one entry."""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+
+# Service and socket actions:
+# method name -> (command key, target, verb, gerund, past tense, progress suffix, verify)
+# When verify is set, the action waits for the target to become active and shows its status.
+_SERVICE_ACTIONS = {
+    'start_service': ('start', 'service', 'start', 'Starting', 'started', '', True),
+    'stop_service': ('stop', 'service', 'stop', 'Stopping', 'stopped', '', False),
+    'restart_service': ('restart', 'service', 'restart', 'Restarting', 'restarted', '', True),
+    'enable_service': ('enable', 'service', 'enable', 'Enabling', 'enabled', ' to start at boot', False),
+    'disable_service': ('disable', 'service', 'disable', 'Disabling', 'disabled', ' from starting at boot', False),
+    'start_socket': ('socket_start', 'socket', 'start', 'Starting', 'started', '', True),
+    'stop_socket': ('socket_stop', 'socket', 'stop', 'Stopping', 'stopped', '', False),
+    'enable_socket': ('socket_enable', 'socket', 'enable', 'Enabling', 'enabled', ' to start at boot', False),
+    'disable_socket': ('socket_disable', 'socket', 'disable', 'Disabling', 'disabled', ' from starting at boot', False)
+}
+
 
 class DockerServiceManager:
     """Manage Docker daemon and service operations."""
 
-    def __init__(self, demo_mode=False):
+    def __init__(self, demo_mode=False, cache_ttl=1.5, quiet=False):
         """Initialize service manager with system detection.
 
+        Progress and error messages go to the module logger; results such as
+        status output and action summaries are printed unless quiet is set.
+
         Args:
             demo_mode (bool): If True, enables demo mode with simulated responses
+            cache_ttl (float): Seconds to reuse status and Docker query results, 0 to disable
+            quiet (bool): If True, suppresses printed status output and action summaries
         """
         self.demo_mode = demo_mode
+        self.quiet = quiet
+        self.cache_ttl = cache_ttl
+        self._status_cache: Dict[str, Tuple[float, Any]] = {}
+        self._docker_client = None
         self.system = platform.system().lower()
 
         # Check for administrative privileges
-        self.is_admin = self._check_admin_privileges()
+        self.is_admin = _check_admin_privileges(self.system)
 
         # Detect init system for Linux
         if self.system == 'linux':
-            self.init_system = self._detect_init_system()
+            self.init_system = _detect_init_system()
         else:
             self.init_system = None
 
-    def _check_admin_privileges(self) -> bool:
-        """Check if script is running with administrative privileges."""
-        try:
-            if self.system == 'windows':
-                import ctypes
-                return ctypes.windll.shell32.IsUserAnAdmin() != 0
-            else:  # Linux, macOS, etc.
-                return os.geteuid() == 0
-        except Exception:
-            # If we can't determine, assume not admin
-            return False
-
-    def _detect_init_system(self) -> Optional[str]:
-        """Detect which init system is used on Linux."""
-        # Check for systemd
-        if os.path.exists('/run/systemd/system'):
-            return 'systemd'
-
-        # Check for SysVinit
-        elif os.path.exists('/etc/init.d'):
-            return 'sysvinit'
+        # Service commands depend only on the OS and init system, so build them once
+        self._commands = self._get_service_commands()
 
-        # Check for Upstart
-        elif os.path.exists('/sbin/initctl'):
-            return 'upstart'
-
-        # Couldn't determine
-        return None
-
-    def _run_command(self, command: List[str]) -> Tuple[bool, str]:
+    def _run_command(self, command: Sequence[str]) -> Tuple[bool, str]:
         """Run system command and return result."""
         try:
+            # Capture raw bytes and decode only the stream that is returned
             result = subprocess.run(
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 check=False
             )
 
             # Check if command was successful
             if result.returncode == 0:
-                return True, result.stdout
+                return True, result.stdout.decode('utf-8', errors='replace')
             else:
-                return False, result.stderr
+                return False, result.stderr.decode('utf-8', errors='replace')
         except Exception as e:
             return False, str(e)
 
-    def _get_service_commands(self) -> Dict[str, List[str]]:
-        """Get appropriate commands based on OS."""
-        if self.system == 'linux':
-            if self.init_system == 'systemd':
-                return {
-                    'status': ['systemctl', 'status', 'docker'],
-                    'start': ['systemctl', 'start', 'docker'],
-                    'stop': ['systemctl', 'stop', 'docker'],
-                    'restart': ['systemctl', 'restart', 'docker'],
-                    'enable': ['systemctl', 'enable', 'docker'],
-                    'disable': ['systemctl', 'disable', 'docker'],
-                    'socket_status': ['systemctl', 'status', 'docker.socket'],
-                    'socket_start': ['systemctl', 'start', 'docker.socket'],
-                    'socket_stop': ['systemctl', 'stop', 'docker.socket'],
-                    'socket_enable': ['systemctl', 'enable', 'docker.socket'],
-                    'socket_disable': ['systemctl', 'disable', 'docker.socket']
-                }
-            elif self.init_system == 'sysvinit':
-                return {
-                    'status': ['service', 'docker', 'status'],
-                    'start': ['service', 'docker', 'start'],
-                    'stop': ['service', 'docker', 'stop'],
-                    'restart': ['service', 'docker', 'restart'],
-                    'enable': ['update-rc.d', 'docker', 'defaults'],
-                    'disable': ['update-rc.d', 'docker', 'remove'],
-                    'socket_status': ['echo', 'Socket management not supported with SysVinit'],
-                    'socket_start': ['echo', 'Socket management not supported with SysVinit'],
-                    'socket_stop': ['echo', 'Socket management not supported with SysVinit'],
-                    'socket_enable': ['echo', 'Socket management not supported with SysVinit'],
-                    'socket_disable': ['echo', 'Socket management not supported with SysVinit']
-                }
-            else:
-                # Neither systemd nor SysVinit detected
-                return {
-                    'status': ['echo', 'Docker service not detected (NixOS or container environment)'],
-                    'start': ['echo', 'Docker service not detected (NixOS or container environment)'],
-                    'stop': ['echo', 'Docker service not detected (NixOS or container environment)'],
-                    'restart': ['echo', 'Docker service not detected (NixOS or container environment)'],
-                    'enable': ['echo', 'Docker service not detected (NixOS or container environment)'],
-                    'disable': ['echo', 'Docker service not detected (NixOS or container environment)'],
-                    'socket_status': ['echo', 'Docker service not detected (NixOS or container environment)'],
-                    'socket_start': ['echo', 'Docker service not detected (NixOS or container environment)'],
-                    'socket_stop': ['echo', 'Docker service not detected (NixOS or container environment)'],
-                    'socket_enable': ['echo', 'Docker service not detected (NixOS or container environment)'],
-                    'socket_disable': ['echo', 'Docker service not detected (NixOS or container environment)']
-                }
-        elif self.system == 'darwin':  # macOS
-            return {
-                'status': ['launchctl', 'list', 'com.docker.docker'],
-                'start': ['launchctl', 'start', 'com.docker.docker'],
-                'stop': ['launchctl', 'stop', 'com.docker.docker'],
-                'restart': ['launchctl', 'stop', 'com.docker.docker', '&&', 'launchctl', 'start', 'com.docker.docker'],
-                'enable': ['launchctl', 'load', '-w', '/Library/LaunchDaemons/com.docker.docker.plist'],
-                'disable': ['launchctl', 'unload', '-w', '/Library/LaunchDaemons/com.docker.docker.plist'],
-                'socket_status': ['echo', 'Socket management not applicable on macOS'],
-                'socket_start': ['echo', 'Socket management not applicable on macOS'],
-                'socket_stop': ['echo', 'Socket management not applicable on macOS'],
-                'socket_enable': ['echo', 'Socket management not applicable on macOS'],
-                'socket_disable': ['echo', 'Socket management not applicable on macOS']
-            }
-        elif self.system == 'windows':
-            return {
-                'status': ['sc', 'query', 'docker'],
-                'start': ['net', 'start', 'docker'],
-                'stop': ['net', 'stop', 'docker'],
-                'restart': ['net', 'stop', 'docker', '&&', 'net', 'start', 'docker'],
-                'enable': ['sc', 'config', 'docker', 'start=', 'auto'],
-                'disable': ['sc', 'config', 'docker', 'start=', 'disabled'],
-                # Windows uses named pipes instead of sockets
-                'socket_status': ['echo', 'Socket management not applicable on Windows'],
-                'socket_start': ['echo', 'Socket management not applicable on Windows'],
-                'socket_stop': ['echo', 'Socket management not applicable on Windows'],
-                'socket_enable': ['echo', 'Socket management not applicable on Windows'],
-                'socket_disable': ['echo', 'Socket management not applicable on Windows']
-            }
-        else:
-            # Default to commands that will show helpful error
-            return {
-                'status': ['echo', f'Service management not implemented for {self.system}'],
-                'start': ['echo', f'Service management not implemented for {self.system}'],
-                'stop': ['echo', f'Service management not implemented for {self.system}'],
-                'restart': ['echo', f'Service management not implemented for {self.system}'],
-                'enable': ['echo', f'Service management not implemented for {self.system}'],
-                'disable': ['echo', f'Service management not implemented for {self.system}'],
-                'socket_status': ['echo', f'Socket management not implemented for {self.system}'],
-                'socket_start': ['echo', f'Socket management not implemented for {self.system}'],
-                'socket_stop': ['echo', f'Socket management not implemented for {self.system}'],
-                'socket_enable': ['echo', f'Socket management not implemented for {self.system}'],
-                'socket_disable': ['echo', f'Socket management not implemented for {self.system}']
-            }
-
-    def check_privileges(self) -> bool:
-        """Check and inform about admin privileges."""
-        if not self.is_admin:
-            print("⚠️  Warning: Administrative privileges required for service management")
-            print("   Some operations may fail without proper permissions")
-            if self.system == 'linux' or self.system == 'darwin':
-                print("   Try running with 'sudo' or as root")
-            elif self.system == 'windows':
-                print("   Try running as Administrator")
-            return False
-        return True
+    def _cached(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Return a cached query result, refreshing it once it is older than the TTL.
 
-    def get_status(self) -> Tuple[bool, Optional[str]]:
-        """Get Docker service status.
+        Args:
+            key: Cache key for the query
+            fn: Function performing the query
 
         Returns:
-            Tuple of (success, error_code) where error_code is None on success
+            The cached or freshly computed result
         """
-        print("Checking Docker service status...")
+        now = time.monotonic()
+        entry = self._status_cache.get(key)
+        if entry is not None and now - entry[0] < self.cache_ttl:
+            return entry[1]
 
-        # If in demo mode, show simulated service status
-        if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating Docker service status")
-            print("Docker service is \033[92mrunning\033[0m")
-            print("Status: Active")
-            print("Docker version: 20.10.12")
-            print("Containers: 4 (3 Running, 1 Stopped)")
-            print("Images: 12")
-            return True, None
+        result = fn()
+        self._status_cache[key] = (now, result)
+        return result
 
-        # Normal mode
-        if not self.check_privileges():
-            print("Attempting to check status anyway...")
+    def invalidate_cache(self) -> None:
+        """Drop cached status and Docker query results."""
+        self._status_cache.clear()
 
-        commands = self._get_service_commands()
-        success, output = self._run_command(commands['status'])
+    def get_docker_client(self) -> Any:
+        """Get the Docker client shared with other components, connecting on first use.
 
-        if success:
-            print("Docker service status:")
-            print(output)
+        Connection errors propagate to the caller and are retried on the next call.
 
-            # Check if service is actually running
-            if self.system == 'linux' and 'active' not in output.lower():
-                return False, "service_not_running" 
-            elif self.system == 'darwin' and not any(status in output.lower() for status in ['running', 'active']):
-                return False, "service_not_running"
-            elif self.system == 'windows' and 'running' not in output.lower():
-                return False, "service_not_running"
+        Raises:
+            ImportError: If the Docker SDK for Python is not installed
+        """
+        if self._docker_client is None:
+            docker = _load_docker()
+            if docker is None:
+                raise ImportError("Docker SDK for Python is not installed")
+            self._docker_client = docker.from_env()
+        return self._docker_client
+
+    def _ping(self) -> bool:
+        """Check whether the Docker daemon responds, using the lightweight ping endpoint."""
+        if _load_docker() is None:
+            return False
+        try:
+            return bool(self.get_docker_client().ping())
+        except Exception:
+            return False
 
-            return True, None
-        else:
-            print(f"Error checking Docker service status: {output}")
-            print("You can use --demo mode to see simulated output")
+    def _get_service_commands(self) -> Dict[str, Tuple[str, ...]]:
+        """Get appropriate commands based on OS."""
+        return _COMMANDS_BY_KEY.get((self.system, self.init_system)) or _default_commands(self.system)
 
-            if 'permission denied' in output.lower() or 'access is denied' in output.lower():
-                return False, "permission_denied"
+    def check_privileges(self) -> bool:
+        """Check and inform about admin privileges."""
+        if not self.is_admin:
+            hint = _PRIVILEGE_HINTS.get(self.system)
+            logger.warning(
+                "⚠️  Warning: Administrative privileges required for service management\n"
+                "   Some operations may fail without proper permissions%s",
+                f"\n   {hint}" if hint else ""
+            )
+            return False
+        return True
 
-            return False, "docker_not_installed"
+    def _do_action(self, command_key: str, target: str, verb: str, gerund: str,
+                   past: str, suffix: str, verify: bool) -> bool:
+        """Run a service or socket action and report its outcome.
 
-    def start_service(self) -> bool:
-        """Start Docker service."""
-        print("Starting Docker service...")
+        Args:
+            command_key: Key of the command to run in the command table
+            target: Either 'service' or 'socket'
+            verb: Action verb, e.g. 'start'
+            gerund: Capitalized progressive form of the verb, e.g. 'Starting'
+            past: Past tense of the verb, e.g. 'started'
+            suffix: Extra text appended to the progress message
+            verify: Whether to wait for the target to become active and show its status
 
-        # If in demo mode, simulate starting the service
+        Returns:
+            True if the action succeeded, False otherwise
+        """
+        subject = f"Docker {target}"
+        status_key, show_status = (
+            ('socket_status', self.get_socket_status) if target == 'socket'
+            else ('status', self.get_status)
+        )
+        logger.info("%s %s%s...", gerund, subject, suffix)
+
+        # If in demo mode, simulate the action
         if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating Docker service start")
-            print("✓ Docker service started successfully")
-            time.sleep(1)  # Simulate startup time
-            self.get_status()  # Will show demo status
+            logger.info("\033[93mDEMO MODE\033[0m: Simulating %s %s", subject, verb)
+            time.sleep(1)  # Simulate action time
+            if not self.quiet:
+                print(f"✓ {subject} {past} successfully")
+            if verify:
+                show_status()  # Will show demo status
             return True
 
         # Normal mode
         if not self.check_privileges():
-            print("Attempting to start service anyway...")
+            logger.info("Attempting to %s %s anyway...", verb, target)
 
-        commands = self._get_service_commands()
-        success, output = self._run_command(commands['start'])
+        if command_key == 'restart' and 'restart' not in self._commands:
+            success, output = self._restart_by_stop_start()
+        else:
+            success, output = self._run_command(self._commands[command_key])
+        self.invalidate_cache()
 
         if success:
-            print("✓ Docker service started successfully")
-            # Verify service is running
-            time.sleep(2)  # Give it time to start
-            self.get_status()
+            if not self.quiet:
+                print(f"✓ {subject} {past} successfully")
+            if verify:
+                # Wait until it reports active, then show its status
+                self._wait_until_active(status_key)
+                show_status()
         else:
-            print(f"Error starting Docker service: {output}")
-            print("You can use --demo mode to see simulated output")
+            logger.error("Error %s %s: %s", gerund.lower(), subject, output)
+            logger.info("You can use --demo mode to see simulated output")
 
         return success
 
-    def stop_service(self) -> bool:
-        """Stop Docker service."""
-        print("Stopping Docker service...")
+    def _is_active(self, status_key: str, output: str) -> bool:
+        """Check whether status command output reports the target as active.
 
-        # If in demo mode, simulate stopping the service
-        if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating Docker service stop")
-            time.sleep(1)  # Simulate shutdown time
-            print("✓ Docker service stopped successfully")
+        Args:
+            status_key: Either 'status' or 'socket_status'
+            output: Output of the status command
+
+        Returns:
+            True if active, or if the OS has no known active marker
+        """
+        tokens = _ACTIVE_TOKENS[status_key].get(self.system)
+        if not tokens:
             return True
+        lower = output.lower()
+        return any(token in lower for token in tokens)
 
-        # Normal mode
-        if not self.check_privileges():
-            print("Attempting to stop service anyway...")
+    def _probe_active(self, status_key: str) -> bool:
+        """Run a quiet liveness probe for the service or socket.
 
-        commands = self._get_service_commands()
-        success, output = self._run_command(commands['stop'])
+        Uses the dedicated is-active command where the init system has one,
+        falling back to the full status command otherwise.
 
-        if success:
-            print("✓ Docker service stopped successfully")
-        else:
-            print(f"Error stopping Docker service: {output}")
-            print("You can use --demo mode to see simulated output")
+        Args:
+            status_key: Either 'status' or 'socket_status'
 
-        return success
+        Returns:
+            True if the target is active, False otherwise
+        """
+        probe_key = _PROBE_KEYS[status_key]
+        if probe_key in self._commands:
+            success, output = self._run_command(self._commands[probe_key])
+            return success and output.strip() == 'active'
 
-    def restart_service(self) -> bool:
-        """Restart Docker service."""
-        print("Restarting Docker service...")
+        success, output = self._run_command(self._commands[status_key])
+        return success and self._is_active(status_key, output)
 
-        # If in demo mode, simulate restarting the service
-        if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating Docker service restart")
-            time.sleep(1)  # Simulate restart time
-            print("✓ Docker service restarted successfully")
-            self.get_status()  # Will show demo status
-            return True
+    def _wait_until_active(self, status_key: str, timeout: float = 5.0, initial: float = 0.05) -> bool:
+        """Poll a status command with exponential backoff until it reports active.
 
-        # Normal mode
-        if not self.check_privileges():
-            print("Attempting to restart service anyway...")
+        Args:
+            status_key: Either 'status' or 'socket_status'
+            timeout: Maximum number of seconds to wait
+            initial: First delay between polls in seconds
 
-        commands = self._get_service_commands()
-        success, output = self._run_command(commands['restart'])
+        Returns:
+            True if the target became active before the timeout, False otherwise.
+            Placeholder commands that only echo a message cannot report the
+            state, so False is returned without waiting.
+        """
+        command = self._commands.get(_PROBE_KEYS[status_key], self._commands[status_key])
+        if command[0] == 'echo':
+            return False
 
-        if success:
-            print("✓ Docker service restarted successfully")
-            # Verify service is running
-            time.sleep(3)  # Give it time to restart
-            self.get_status()
-        else:
-            print(f"Error restarting Docker service: {output}")
-            print("You can use --demo mode to see simulated output")
+        deadline = time.monotonic() + timeout
+        delay = initial
+        while True:
+            if self._probe_active(status_key):
+                return True
 
-        return success
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.5)
 
-    def enable_service(self) -> bool:
-        """Enable Docker service to start at boot."""
-        print("Enabling Docker service to start at boot...")
+    def _restart_by_stop_start(self) -> Tuple[bool, str]:
+        """Restart the service with separate stop and start commands.
 
-        # If in demo mode, simulate enabling the service
+        Returns:
+            Tuple of (success, output) from the start command
+        """
+        # Stopping fails when the service is not running; start it regardless
+        self._run_command(self._commands['stop'])
+        return self._run_command(self._commands['start'])
+
+    def get_status(self) -> Tuple[bool, Optional[str]]:
+        """Get Docker service status.
+
+        Returns:
+            Tuple of (success, error_code) where error_code is None on success
+        """
+        logger.info("Checking Docker service status...")
+
+        # If in demo mode, show simulated service status
         if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating Docker service enable")
-            time.sleep(1)  # Simulate enable time
-            print("✓ Docker service enabled successfully")
-            return True
+            if not self.quiet:
+                sys.stdout.write(_DEMO_STATUS_BANNER)
+            return True, None
 
         # Normal mode
         if not self.check_privileges():
-            print("Attempting to enable service anyway...")
+            logger.info("Attempting to check status anyway...")
 
-        commands = self._get_service_commands()
-        success, output = self._run_command(commands['enable'])
+        success, output = self._cached('status', lambda: self._run_command(self._commands['status']))
 
         if success:
-            print("✓ Docker service enabled successfully")
+            if not self.quiet:
+                print("Docker service status:")
+                print(output)
+
+            # Check if service is actually running; with no output to go on,
+            # ask the daemon directly
+            if not output.strip():
+                if not self._ping():
+                    return False, "service_not_running"
+            elif not self._is_active('status', output):
+                return False, "service_not_running"
+
+            return True, None
         else:
-            print(f"Error enabling Docker service: {output}")
-            print("You can use --demo mode to see simulated output")
+            logger.error("Error checking Docker service status: %s", output)
+            logger.info("You can use --demo mode to see simulated output")
 
-        return success
+            lower = output.lower()
+            if 'permission denied' in lower or 'access is denied' in lower:
+                return False, "permission_denied"
 
-    def disable_service(self) -> bool:
-        """Disable Docker service from starting at boot."""
-        print("Disabling Docker service from starting at boot...")
+            return False, "docker_not_installed"
 
-        # If in demo mode, simulate disabling the service
-        if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating Docker service disable")
-            time.sleep(1)  # Simulate disable time
-            print("✓ Docker service disabled successfully")
-            return True
+    def start_service(self) -> bool:
+        """Start Docker service."""
+        return self._do_action(*_SERVICE_ACTIONS['start_service'])
 
-        # Normal mode
-        if not self.check_privileges():
-            print("Attempting to disable service anyway...")
+    def stop_service(self) -> bool:
+        """Stop Docker service."""
+        return self._do_action(*_SERVICE_ACTIONS['stop_service'])
 
-        commands = self._get_service_commands()
-        success, output = self._run_command(commands['disable'])
+    def restart_service(self) -> bool:
+        """Restart Docker service."""
+        return self._do_action(*_SERVICE_ACTIONS['restart_service'])
 
-        if success:
-            print("✓ Docker service disabled successfully")
-        else:
-            print(f"Error disabling Docker service: {output}")
-            print("You can use --demo mode to see simulated output")
+    def enable_service(self) -> bool:
+        """Enable Docker service to start at boot."""
+        return self._do_action(*_SERVICE_ACTIONS['enable_service'])
 
-        return success
+    def disable_service(self) -> bool:
+        """Disable Docker service from starting at boot."""
+        return self._do_action(*_SERVICE_ACTIONS['disable_service'])
 
     def get_socket_status(self) -> Tuple[bool, Optional[str]]:
         """Get Docker socket status.
@@ -385,147 +691,56 @@ class DockerServiceManager:
         Returns:
             Tuple of (success, error_code) where error_code is None on success
         """
-        print("Checking Docker socket status...")
+        logger.info("Checking Docker socket status...")
 
         # If in demo mode, simulate socket status
         if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating Docker socket status")
-            print("Docker socket is \033[92mactive\033[0m")
-            print("Socket listening at: /var/run/docker.sock")
+            if not self.quiet:
+                sys.stdout.write(_DEMO_SOCKET_STATUS_BANNER)
             return True, None
 
         # Normal mode
         if not self.check_privileges():
-            print("Attempting to check socket status anyway...")
+            logger.info("Attempting to check socket status anyway...")
 
-        commands = self._get_service_commands()
-        success, output = self._run_command(commands['socket_status'])
+        success, output = self._cached(
+            'socket_status', lambda: self._run_command(self._commands['socket_status']))
 
         if success:
-            print("Docker socket status:")
-            print(output)
+            if not self.quiet:
+                print("Docker socket status:")
+                print(output)
 
             # Check if socket is actually available
-            if self.system == 'linux' and 'active' not in output.lower():
+            if not self._is_active('socket_status', output):
                 return False, "socket_not_available"
 
             return True, None
         else:
-            print(f"Error checking Docker socket status: {output}")
-            print("You can use --demo mode to see simulated output")
+            logger.error("Error checking Docker socket status: %s", output)
+            logger.info("You can use --demo mode to see simulated output")
 
-            if 'permission denied' in output.lower() or 'access is denied' in output.lower():
+            lower = output.lower()
+            if 'permission denied' in lower or 'access is denied' in lower:
                 return False, "permission_denied"
 
             return False, "socket_not_available"
 
     def start_socket(self) -> bool:
         """Start Docker socket."""
-        print("Starting Docker socket...")
-
-        # If in demo mode, simulate starting the socket
-        if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating Docker socket start")
-            time.sleep(1)  # Simulate socket startup time
-            print("✓ Docker socket started successfully")
-            self.get_socket_status()  # Will show demo status
-            return True
-
-        # Normal mode
-        if not self.check_privileges():
-            print("Attempting to start socket anyway...")
-
-        commands = self._get_service_commands()
-        success, output = self._run_command(commands['socket_start'])
-
-        if success:
-            print("✓ Docker socket started successfully")
-            # Verify socket is running
-            time.sleep(2)  # Give it time to start
-            self.get_socket_status()
-        else:
-            print(f"Error starting Docker socket: {output}")
-            print("You can use --demo mode to see simulated output")
-
-        return success
+        return self._do_action(*_SERVICE_ACTIONS['start_socket'])
 
     def stop_socket(self) -> bool:
         """Stop Docker socket."""
-        print("Stopping Docker socket...")
-
-        # If in demo mode, simulate stopping the socket
-        if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating Docker socket stop")
-            time.sleep(1)  # Simulate socket shutdown time
-            print("✓ Docker socket stopped successfully")
-            return True
-
-        # Normal mode
-        if not self.check_privileges():
-            print("Attempting to stop socket anyway...")
-
-        commands = self._get_service_commands()
-        success, output = self._run_command(commands['socket_stop'])
-
-        if success:
-            print("✓ Docker socket stopped successfully")
-        else:
-            print(f"Error stopping Docker socket: {output}")
-            print("You can use --demo mode to see simulated output")
-
-        return success
+        return self._do_action(*_SERVICE_ACTIONS['stop_socket'])
 
     def enable_socket(self) -> bool:
         """Enable Docker socket to start at boot."""
-        print("Enabling Docker socket to start at boot...")
-
-        # If in demo mode, simulate enabling the socket
-        if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating Docker socket enable")
-            time.sleep(1)  # Simulate enable time
-            print("✓ Docker socket enabled successfully")
-            return True
-
-        # Normal mode
-        if not self.check_privileges():
-            print("Attempting to enable socket anyway...")
-
-        commands = self._get_service_commands()
-        success, output = self._run_command(commands['socket_enable'])
-
-        if success:
-            print("✓ Docker socket enabled successfully")
-        else:
-            print(f"Error enabling Docker socket: {output}")
-            print("You can use --demo mode to see simulated output")
-
-        return success
+        return self._do_action(*_SERVICE_ACTIONS['enable_socket'])
 
     def disable_socket(self) -> bool:
         """Disable Docker socket from starting at boot."""
-        print("Disabling Docker socket from starting at boot...")
-
-        # If in demo mode, simulate disabling the socket
-        if self.demo_mode:
-            print("\033[93mDEMO MODE\033[0m: Simulating Docker socket disable")
-            time.sleep(1)  # Simulate disable time
-            print("✓ Docker socket disabled successfully")
-            return True
-
-        # Normal mode
-        if not self.check_privileges():
-            print("Attempting to disable socket anyway...")
-
-        commands = self._get_service_commands()
-        success, output = self._run_command(commands['socket_disable'])
-
-        if success:
-            print("✓ Docker socket disabled successfully")
-        else:
-            print(f"Error disabling Docker socket: {output}")
-            print("You can use --demo mode to see simulated output")
-
-        return success
+        return self._do_action(*_SERVICE_ACTIONS['disable_socket'])
 
     def list_containers(self) -> Tuple[bool, Optional[str]]:
         """List all Docker containers.
@@ -535,96 +750,53 @@ class DockerServiceManager:
         """
         # If in demo mode, show simulated containers
         if self.demo_mode:
-            print("Connecting to Docker... (Demo Mode)")
+            logger.info("Connecting to Docker... (Demo Mode)")
 
-            # Create sample containers for demonstration
-            table_data = [
-                ["abc123", "demo-webserver", "\033[92mrunning\033[0m", "2023-01-01 09:00:00", "nginx:latest"],
-                ["def456", "demo-database", "\033[92mrunning\033[0m", "2023-01-01 09:01:15", "mysql:8.0"],
-                ["ghi789", "demo-redis", "\033[93mrestarting\033[0m", "2023-01-01 09:02:30", "redis:alpine"],
-                ["jkl012", "demo-backup", "\033[91mexited\033[0m", "2023-01-01 09:03:45", "alpine:latest"]
-            ]
-
-            # Display the table
-            headers = ["ID", "Name", "Status", "Created", "Image"]
-            if TABULATE_AVAILABLE:
-                print(tabulate(table_data, headers=headers, tablefmt="pretty"))
-            else:
-                print("CONTAINER ID | NAME | STATUS | CREATED | IMAGE")
-                print("-" * 80)
-                for row in table_data:
-                    print(" | ".join(row))
+            # Display sample containers for demonstration
+            _print_container_table(_DEMO_CONTAINERS)
 
             return True, None
 
         # Normal mode - try to connect to real Docker
-        if not DOCKER_AVAILABLE:
-            print("Error: Docker Python SDK not installed.")
-            print("Install with: pip install docker")
-            print("Or run with --demo mode to see simulated output")
+        if _load_docker() is None:
+            logger.error("Error: Docker Python SDK not installed.")
+            logger.info("Install with: pip install docker\nOr run with --demo mode to see simulated output")
             return False, "docker_not_installed"
 
         try:
-            print("Connecting to Docker...")
-            client = docker.from_env()
-            containers = client.containers.list(all=True)
+            logger.info("Connecting to Docker...")
+            client = self.get_docker_client()
+            # A single low-level API call returns every container as a plain dict,
+            # avoiding per-container image lookups
+            containers = self._cached('containers', lambda: client.api.containers(all=True))
 
             if not containers:
                 print("No containers found.")
                 return True, None
 
-            # Prepare table data
+            # Prepare table data, binding loop helpers to locals
             table_data = []
+            append = table_data.append
+            format_timestamp = _format_timestamp
+            status_colors = _STATUS_COLORS.get
             for container in containers:
-                # Format container created time - handle different timestamp formats
-                created_timestamp = container.attrs['Created']
-                # Check if created_timestamp is a string (ISO format) or integer (Unix timestamp)
-                if isinstance(created_timestamp, str):
-                    # Parse ISO format timestamp
-                    from datetime import datetime
-                    import dateutil.parser
-                    try:
-                        created = dateutil.parser.parse(created_timestamp)
-                    except Exception:
-                        created = datetime.now()  # Fallback
-                else:
-                    # Handle as Unix timestamp
-                    created = datetime.fromtimestamp(created_timestamp)
-                created_str = created.strftime('%Y-%m-%d %H:%M:%S')
-
-                # Get status with color
-                status = container.status
-                if status == 'running':
-                    status_display = f"\033[92m{status}\033[0m"  # Green for running
-                elif status == 'exited':
-                    status_display = f"\033[91m{status}\033[0m"  # Red for exited
-                else:
-                    status_display = f"\033[93m{status}\033[0m"  # Yellow for others
-
-                # Add row to table
-                table_data.append([
-                    container.short_id, 
-                    container.name, 
-                    status_display,
-                    created_str, 
-                    container.image.tags[0] if container.image.tags else "none"
+                status = container['State']
+                names = container.get('Names') or ('',)
+                append([
+                    container['Id'][:12],
+                    names[0].lstrip('/'),
+                    status_colors(status) or f"\033[93m{status}\033[0m",
+                    format_timestamp(container['Created']),
+                    container.get('Image') or "none"
                 ])
 
             # Display the table
-            headers = ["ID", "Name", "Status", "Created", "Image"]
-            if TABULATE_AVAILABLE:
-                print(tabulate(table_data, headers=headers, tablefmt="pretty"))
-            else:
-                print("CONTAINER ID | NAME | STATUS | CREATED | IMAGE")
-                print("-" * 80)
-                for row in table_data:
-                    print(" | ".join(row))
+            _print_container_table(table_data)
 
             return True, None
         except DockerException as e:
-            print(f"Error connecting to Docker: {e}")
-            print("Make sure Docker service is running.")
-            print("Or try running with --demo mode for demonstration")
+            logger.error("Error connecting to Docker: %s", e)
+            logger.info("Make sure Docker service is running.\nOr try running with --demo mode for demonstration")
 
             # Check if the error indicates service not running
             if "connect to the Docker daemon" in str(e) or "Is the docker daemon running" in str(e):
@@ -632,7 +804,7 @@ class DockerServiceManager:
 
             return False, "docker_not_installed"
         except Exception as e:
-            print(f"Error listing containers: {e}")
+            logger.error("Error listing containers: %s", e)
             return False, None
 
     def check_docker_info(self) -> Tuple[bool, Optional[str]]:
@@ -643,113 +815,27 @@ class DockerServiceManager:
         """
         # If in demo mode, show simulated Docker info
         if self.demo_mode:
-            print("Connecting to Docker... (Demo Mode)")
-
-            # Prepare demo data for basic info
-            basic_info = [
-                ["Docker Version", "20.10.12"],
-                ["OS/Arch", "Linux/x86_64"],
-                ["Kernel Version", "5.4.0-81-generic"],
-                ["Containers", "4"],
-                ["Images", "12"],
-                ["CPUs", "8"],
-                ["Memory", "16.00 GB"]
-            ]
-
-            print("\n=== Docker System Information (Demo Mode) ===")
-            if TABULATE_AVAILABLE:
-                print(tabulate(basic_info, tablefmt="plain"))
-            else:
-                for key, value in basic_info:
-                    print(f"{key}: {value}")
-
-            # Print storage driver info
-            print("\n=== Storage Driver ===")
-            driver_info = [
-                ["Driver", "overlay2"],
-                ["Root Dir", "/var/lib/docker"]
-            ]
-            if TABULATE_AVAILABLE:
-                print(tabulate(driver_info, tablefmt="plain"))
-            else:
-                for key, value in driver_info:
-                    print(f"{key}: {value}")
-
-            # Print networking info
-            print("\n=== Network ===")
-            net_info = [
-                ["bridge", "Bridge network driver"],
-                ["host", "Host network driver"],
-                ["overlay", "Overlay network driver"],
-                ["macvlan", "Macvlan network driver"]
-            ]
-            if TABULATE_AVAILABLE:
-                print(tabulate(net_info, tablefmt="plain"))
-            else:
-                for key, value in net_info:
-                    print(f"{key}: {value}")
-
+            logger.info("Connecting to Docker... (Demo Mode)")
+            _print_info_sections(_DEMO_INFO_SECTIONS)
             return True, None
 
         # Normal mode - try to connect to real Docker
-        if not DOCKER_AVAILABLE:
-            print("Error: Docker Python SDK not installed.")
-            print("Install with: pip install docker")
-            print("Or run with --demo mode to see simulated output")
+        if _load_docker() is None:
+            logger.error("Error: Docker Python SDK not installed.")
+            logger.info("Install with: pip install docker\nOr run with --demo mode to see simulated output")
             return False, "docker_not_installed"
 
         try:
-            print("Connecting to Docker...")
-            client = docker.from_env()
-            info = client.info()
-
-            # Prepare table for basic info
-            basic_info = [
-                ["Docker Version", info.get('ServerVersion', 'Unknown')],
-                ["OS/Arch", f"{info.get('OperatingSystem', 'Unknown')}/{info.get('Architecture', 'Unknown')}"],
-                ["Kernel Version", info.get('KernelVersion', 'Unknown')],
-                ["Containers", str(info.get('Containers', 'Unknown'))],
-                ["Images", str(info.get('Images', 'Unknown'))],
-                ["CPUs", str(info.get('NCPU', 'Unknown'))],
-                ["Memory", f"{info.get('MemTotal', 0) / (1024*1024*1024):.2f} GB"]
-            ]
-
-            print("\n=== Docker System Information ===")
-            if TABULATE_AVAILABLE:
-                print(tabulate(basic_info, tablefmt="plain"))
-            else:
-                for key, value in basic_info:
-                    print(f"{key}: {value}")
-
-            # Print storage driver info
-            print("\n=== Storage Driver ===")
-            driver_info = [
-                ["Driver", info.get('Driver', 'Unknown')],
-                ["Root Dir", info.get('DockerRootDir', 'Unknown')]
-            ]
-            if TABULATE_AVAILABLE:
-                print(tabulate(driver_info, tablefmt="plain"))
-            else:
-                for key, value in driver_info:
-                    print(f"{key}: {value}")
-
-            # Print networking info
-            print("\n=== Network ===")
-            net_info = []
-            for net_name, net_data in info.get('Plugins', {}).get('Network', {}).items():
-                net_info.append([net_name, str(net_data)])
+            logger.info("Connecting to Docker...")
+            client = self.get_docker_client()
+            info = self._cached('info', client.info)
 
-            if TABULATE_AVAILABLE:
-                print(tabulate(net_info, tablefmt="plain"))
-            else:
-                for name, details in net_info:
-                    print(f"{name}: {details}")
+            _print_info_sections(_docker_info_sections(info))
 
             return True, None
         except DockerException as e:
-            print(f"Error connecting to Docker: {e}")
-            print("Make sure Docker service is running.")
-            print("Or try running with --demo mode for demonstration")
+            logger.error("Error connecting to Docker: %s", e)
+            logger.info("Make sure Docker service is running.\nOr try running with --demo mode for demonstration")
 
             # Check if the error indicates service not running
             if "connect to the Docker daemon" in str(e) or "Is the docker daemon running" in str(e):
@@ -757,5 +843,5 @@ class DockerServiceManager:
 
             return False, "docker_not_installed"
         except Exception as e:
-            print(f"Error getting Docker info: {e}")
+            logger.error("Error getting Docker info: %s", e)
             return False, None
\ No newline at end of file
@@ -687,6 +687,17 @@ class TemplateManager:
         """
         return self.templates
         
+    def render_templates_listing(self) -> str:
+        """Build the listing of available templates without printing it.
+        
+        Returns:
+            Listing text with one entry per template, ending with a newline
+        """
+        return "".join(
+            f"{COLORS['CYAN']}{template_id}{COLORS['RESET']}: {template.name}\n  {template.description}\n\n"
+            for template_id, template in self.templates.items()
+        )
+        
     def list_templates(self) -> bool:
         """List all available templates.
         
@@ -694,11 +705,7 @@ class TemplateManager:
             True (always succeeds)
         """
         print_section("Available Environment Templates")
-        
-        for template_id, template in self.templates.items():
-            print(f"{COLORS['CYAN']}{template_id}{COLORS['RESET']}: {template.name}")
-            print(f"  {template.description}")
-            print()
+        sys.stdout.write(self.render_templates_listing())
             
         return True
         
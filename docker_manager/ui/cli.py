@@ -2,99 +2,70 @@
 Command-line interface for Docker service manager.
 """
 import argparse
+import importlib.util
+import logging
 import sys
 import os
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 
 from ..core.service_manager import DockerServiceManager
-from ..core.health_report import HealthReport
-from ..templates.environment_templates import TemplateManager
 from ..utils.display import show_banner
 from .. import __version__
 
-def setup_argparse() -> argparse.ArgumentParser:
-    """Set up command line argument parsing.
-    
-    Returns:
-        Configured ArgumentParser instance
-    """
-    parser = argparse.ArgumentParser(description="Cross-platform Docker service management tool")
-    
-    # Global arguments that apply to all commands
-    parser.add_argument('--demo', action='store_true', help='Enable demo mode with simulated Docker responses')
-    parser.add_argument('--interactive', '-i', action='store_true', help='Run in interactive mode with menu interface')
-    parser.add_argument('--tui', action='store_true', help='Run in Terminal User Interface (TUI) mode with advanced visuals')
-    parser.add_argument('--version', '-v', action='store_true', help='Show Docker Manager version and exit')
-    parser.add_argument('--emoji', '-e', action='store_true', help='Enable emoji indicators in output')
-    
-    # Create subparsers for commands
-    subparsers = parser.add_subparsers(dest='command', help='Commands')
-    
-    # Service management subcommand
-    service_parser = subparsers.add_parser('service', help='Docker service management')
+def _build_service_parser(service_parser: argparse.ArgumentParser) -> None:
+    """Add service management subcommands."""
     service_subparsers = service_parser.add_subparsers(dest='service_command', help='Service Commands')
     
     # Service status command
-    status_parser = service_subparsers.add_parser('status', help='Check Docker service status')
+    service_subparsers.add_parser('status', help='Check Docker service status')
     
     # Service start command
-    start_parser = service_subparsers.add_parser('start', help='Start Docker service')
+    service_subparsers.add_parser('start', help='Start Docker service')
     
     # Service stop command
-    stop_parser = service_subparsers.add_parser('stop', help='Stop Docker service')
+    service_subparsers.add_parser('stop', help='Stop Docker service')
     
     # Service restart command
-    restart_parser = service_subparsers.add_parser('restart', help='Restart Docker service')
+    service_subparsers.add_parser('restart', help='Restart Docker service')
     
     # Service enable command
-    enable_parser = service_subparsers.add_parser('enable', help='Enable Docker service to start at boot')
+    service_subparsers.add_parser('enable', help='Enable Docker service to start at boot')
     
     # Service disable command
-    disable_parser = service_subparsers.add_parser('disable', help='Disable Docker service from starting at boot')
-    
-    # Socket management subcommand
-    socket_parser = subparsers.add_parser('socket', help='Docker socket management')
+    service_subparsers.add_parser('disable', help='Disable Docker service from starting at boot')
+
+def _build_socket_parser(socket_parser: argparse.ArgumentParser) -> None:
+    """Add socket management subcommands."""
     socket_subparsers = socket_parser.add_subparsers(dest='socket_command', help='Socket Commands')
     
     # Socket status command
-    socket_status_parser = socket_subparsers.add_parser('status', help='Check Docker socket status')
+    socket_subparsers.add_parser('status', help='Check Docker socket status')
     
     # Socket start command
-    socket_start_parser = socket_subparsers.add_parser('start', help='Start Docker socket')
+    socket_subparsers.add_parser('start', help='Start Docker socket')
     
     # Socket stop command
-    socket_stop_parser = socket_subparsers.add_parser('stop', help='Stop Docker socket')
+    socket_subparsers.add_parser('stop', help='Stop Docker socket')
     
     # Socket enable command
-    socket_enable_parser = socket_subparsers.add_parser('enable', help='Enable Docker socket to start at boot')
+    socket_subparsers.add_parser('enable', help='Enable Docker socket to start at boot')
     
     # Socket disable command
-    socket_disable_parser = socket_subparsers.add_parser('disable', help='Disable Docker socket from starting at boot')
-    
-    # Container management subcommand
-    containers_parser = subparsers.add_parser('containers', help='List Docker containers')
-    
-    # Container logs subcommand
-    logs_parser = subparsers.add_parser('logs', help='View container logs')
+    socket_subparsers.add_parser('disable', help='Disable Docker socket from starting at boot')
+
+def _build_logs_parser(logs_parser: argparse.ArgumentParser) -> None:
+    """Add container logs arguments."""
     logs_parser.add_argument('container_id', help='Container ID or name')
     logs_parser.add_argument('--tail', '-n', type=int, default=100, help='Number of lines to show from end of logs (default: 100)')
     logs_parser.add_argument('--follow', '-f', action='store_true', help='Follow log output (similar to tail -f)')
-    
-    # System information subcommand
-    info_parser = subparsers.add_parser('info', help='Show Docker system information')
-    
-    # Health report subcommand
-    health_parser = subparsers.add_parser('health', help='Generate system health report with visual metrics')
-    
-    # Version command
-    version_parser = subparsers.add_parser('version', help='Show Docker Manager version')
-    
-    # Template commands
-    template_parser = subparsers.add_parser('template', help='Development environment templates')
+
+def _build_template_parser(template_parser: argparse.ArgumentParser) -> None:
+    """Add development environment template subcommands."""
     template_subparsers = template_parser.add_subparsers(dest='template_command', help='Template commands')
     
     # List templates
-    list_templates_parser = template_subparsers.add_parser('list', help='List available templates')
+    template_subparsers.add_parser('list', help='List available templates')
     
     # Create environment from template
     create_template_parser = template_subparsers.add_parser('create', help='Create environment from template')
@@ -105,9 +76,127 @@ def setup_argparse() -> argparse.ArgumentParser:
     launch_template_parser = template_subparsers.add_parser('launch', help='Launch environment from template')
     launch_template_parser.add_argument('template_id', help='Template ID (e.g., lamp, mean, wordpress)')
     launch_template_parser.add_argument('--directory', '-d', default='.', help='Environment directory (default: current directory)')
+
+# Top-level commands: name -> (help, builder for its arguments and subcommands)
+COMMANDS = {
+    'service': ('Docker service management', _build_service_parser),
+    'socket': ('Docker socket management', _build_socket_parser),
+    'containers': ('List Docker containers', None),
+    'logs': ('View container logs', _build_logs_parser),
+    'info': ('Show Docker system information', None),
+    'health': ('Generate system health report with visual metrics', None),
+    'version': ('Show Docker Manager version', None),
+    'template': ('Development environment templates', _build_template_parser),
+}
+
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """Find the command name in the arguments.
+    
+    All global options are flags, so the first non-option argument is the command.
+    """
+    for arg in argv:
+        if not arg.startswith('-'):
+            return arg
+    return None
+
+def setup_argparse(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """Set up command line argument parsing.
+    
+    Every command is registered so it appears in the help output, but only the
+    requested command's arguments and subcommands are built. Parsers are cached
+    per requested command, so callers must not modify the returned parser.
+    
+    Args:
+        argv: Arguments that will be parsed (defaults to sys.argv[1:])
+    
+    Returns:
+        Configured ArgumentParser instance
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    return _build_parser(_requested_command(argv))
+
+@lru_cache(maxsize=None)
+def _build_parser(requested: Optional[str]) -> argparse.ArgumentParser:
+    """Build the argument parser with subcommands for the requested command."""
+    parser = argparse.ArgumentParser(description="Cross-platform Docker service management tool")
+    
+    # Global arguments that apply to all commands
+    parser.add_argument('--demo', action='store_true', help='Enable demo mode with simulated Docker responses')
+    parser.add_argument('--interactive', '-i', action='store_true', help='Run in interactive mode with menu interface')
+    parser.add_argument('--tui', action='store_true', help='Run in Terminal User Interface (TUI) mode with advanced visuals')
+    parser.add_argument('--version', '-v', action='store_true', help='Show Docker Manager version and exit')
+    parser.add_argument('--emoji', '-e', action='store_true', help='Enable emoji indicators in output')
+    
+    # Create subparsers for commands
+    subparsers = parser.add_subparsers(dest='command', help='Commands')
+    for name, (help_text, builder) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if builder is not None and name == requested:
+            builder(command_parser)
     
     return parser
 
+def _create_template(template_manager: Any, args: argparse.Namespace) -> bool:
+    """Create an environment from a template and explain how to launch it."""
+    success = template_manager.create_environment(
+        template_id=args.template_id,
+        target_dir=args.directory
+    )
+    if success:
+        print(f"Environment created successfully in {args.directory}")
+        print(f"To launch the environment, run:")
+        print(f"  cd {args.directory} && docker-compose up -d")
+    return success
+
+def _launch_template(template_manager: Any, args: argparse.Namespace) -> bool:
+    """Launch an environment created from a template."""
+    return template_manager.launch_environment(
+        template_id=args.template_id,
+        target_dir=args.directory
+    )
+
+# Subcommand name -> handler called with the object that runs it
+SERVICE_CMDS = {
+    'status': DockerServiceManager.get_status,
+    'start': DockerServiceManager.start_service,
+    'stop': DockerServiceManager.stop_service,
+    'restart': DockerServiceManager.restart_service,
+    'enable': DockerServiceManager.enable_service,
+    'disable': DockerServiceManager.disable_service,
+}
+
+SOCKET_CMDS = {
+    'status': DockerServiceManager.get_socket_status,
+    'start': DockerServiceManager.start_socket,
+    'stop': DockerServiceManager.stop_socket,
+    'enable': DockerServiceManager.enable_socket,
+    'disable': DockerServiceManager.disable_socket,
+}
+
+# Template handlers also receive the parsed arguments
+TEMPLATE_CMDS = {
+    'list': lambda template_manager, args: template_manager.list_templates(),
+    'create': _create_template,
+    'launch': _launch_template,
+}
+
+def _usage(command: str) -> int:
+    """Report a missing subcommand and return the error exit code."""
+    print(f"Error: Please specify a {command} command")
+    print(f"Run 'docker_service_manager.py {command} -h' for help")
+    return 1
+
+def configure_logging() -> None:
+    """Show service manager progress and error messages on stdout."""
+    logger = logging.getLogger('docker_manager.core.service_manager')
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
 def process_args(args: argparse.Namespace) -> int:
     """Process command line arguments and execute requested commands.
     
@@ -124,9 +213,16 @@ def process_args(args: argparse.Namespace) -> int:
     
     # If TUI mode is enabled, start Terminal User Interface
     if args.tui:
-        from .tui.main_simple import run_simple_tui
-        run_simple_tui(demo_mode=args.demo)
-        return 0
+        if importlib.util.find_spec('py_cui') is not None:
+            from .tui.main_simple import run_simple_tui
+            run_simple_tui(demo_mode=args.demo)
+            return 0
+        # Without py-cui, fall back to the menu interface below
+        print("Warning: py-cui package not found; starting interactive mode instead.")
+        print("Install with: pip install py-cui")
+        args.interactive = True
+        
+    configure_logging()
         
     # If interactive mode is enabled, start interactive console
     if args.interactive:
@@ -135,45 +231,21 @@ def process_args(args: argparse.Namespace) -> int:
         console.run()
         return 0
     
-    # Create service manager instance
-    manager = DockerServiceManager(demo_mode=args.demo)
-    
-    # Handle commands
+    # Handle commands; the service manager is only created for commands that use it
     if args.command == 'service':
-        if args.service_command == 'status':
-            success = manager.get_status()
-        elif args.service_command == 'start':
-            success = manager.start_service()
-        elif args.service_command == 'stop':
-            success = manager.stop_service()
-        elif args.service_command == 'restart':
-            success = manager.restart_service()
-        elif args.service_command == 'enable':
-            success = manager.enable_service()
-        elif args.service_command == 'disable':
-            success = manager.disable_service()
-        else:
-            print("Error: Please specify a service command")
-            print("Run 'docker_service_manager.py service -h' for help")
-            return 1
+        handler = SERVICE_CMDS.get(args.service_command)
+        if handler is None:
+            return _usage('service')
+        success = handler(DockerServiceManager(demo_mode=args.demo))
     
     elif args.command == 'socket':
-        if args.socket_command == 'status':
-            success = manager.get_socket_status()
-        elif args.socket_command == 'start':
-            success = manager.start_socket()
-        elif args.socket_command == 'stop':
-            success = manager.stop_socket()
-        elif args.socket_command == 'enable':
-            success = manager.enable_socket()
-        elif args.socket_command == 'disable':
-            success = manager.disable_socket()
-        else:
-            print("Error: Please specify a socket command")
-            print("Run 'docker_service_manager.py socket -h' for help")
-            return 1
+        handler = SOCKET_CMDS.get(args.socket_command)
+        if handler is None:
+            return _usage('socket')
+        success = handler(DockerServiceManager(demo_mode=args.demo))
     
     elif args.command == 'containers':
+        manager = DockerServiceManager(demo_mode=args.demo)
         success = manager.list_containers()
     
     elif args.command == 'logs':
@@ -186,36 +258,20 @@ def process_args(args: argparse.Namespace) -> int:
         )
     
     elif args.command == 'info':
+        manager = DockerServiceManager(demo_mode=args.demo)
         success = manager.check_docker_info()
     
     elif args.command == 'health':
+        from ..core.health_report import HealthReport
         health_reporter = HealthReport(demo_mode=args.demo)
         success = health_reporter.generate_report()
     
     elif args.command == 'template':
-        # Create template manager instance
-        template_manager = TemplateManager(demo_mode=args.demo)
-        
-        if args.template_command == 'list':
-            success = template_manager.list_templates()
-        elif args.template_command == 'create':
-            success = template_manager.create_environment(
-                template_id=args.template_id,
-                target_dir=args.directory
-            )
-            if success:
-                print(f"Environment created successfully in {args.directory}")
-                print(f"To launch the environment, run:")
-                print(f"  cd {args.directory} && docker-compose up -d")
-        elif args.template_command == 'launch':
-            success = template_manager.launch_environment(
-                template_id=args.template_id,
-                target_dir=args.directory
-            )
-        else:
-            print("Error: Please specify a template command")
-            print("Run 'docker_service_manager.py template -h' for help")
-            return 1
+        handler = TEMPLATE_CMDS.get(args.template_command)
+        if handler is None:
+            return _usage('template')
+        from ..templates.environment_templates import TemplateManager
+        success = handler(TemplateManager(demo_mode=args.demo), args)
     
     elif args.command == 'version':
         print(f"Docker Service Manager v{__version__}")
@@ -4,19 +4,141 @@ Interactive console UI for Docker service manager.
 import os
 import sys
 import time
-from typing import List, Dict, Callable, Any, Optional
+from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Callable, Any, NamedTuple, Optional, Sequence, Tuple
 
 from ..core.service_manager import DockerServiceManager
-from ..core.health_report import HealthReport
-from ..core.container_visualization import ContainerVisualizer
-from ..templates.environment_templates import TemplateManager
-from ..utils.display import COLORS, get_terminal_size, show_banner, print_status, print_section
+from ..utils.display import (
+    COLORS, buffered_stdout, cached_terminal_size, format_banner, format_section, print_status, print_section,
+    install_resize_handler, restore_resize_handler
+)
 from .onboarding import OnboardingManager
-from ..ai.recommendation import ContainerRecommendationEngine
+
+# Cursor home, clear screen and clear scrollback, as emitted by `clear`
+_ANSI_CLEAR = "\x1b[H\x1b[2J\x1b[3J"
+
+# Switch to and back from the alternate screen, which restores the original screen
+_ALT_SCREEN_ENTER = "\x1b[?1049h\x1b[H"
+_ALT_SCREEN_EXIT = "\x1b[?1049l"
+
+_SPINNER_FRAMES = "|/-\\"
+_SPINNER_INTERVAL = 0.08
+
+# Pre-rendered "[PRIORITY]" badges for recommendations
+_PRIORITY_COLORS = {"HIGH": COLORS["RED"], "MEDIUM": COLORS["YELLOW"], "LOW": COLORS["GREEN"]}
+_DEFAULT_PRIORITY_COLOR = COLORS["RESET"]
+_PRIORITY_BADGES = {
+    priority: f"[{color}{priority}{COLORS['RESET']}]" for priority, color in _PRIORITY_COLORS.items()
+}
+
+_HISTORY_CHART_WIDTH = 40
+
+# History timestamps are "%Y-%m-%d %H:%M", so every row has the same width
+_HISTORY_TIME_WIDTH = 16
+_HISTORY_ROW_PAD = " " * (_HISTORY_TIME_WIDTH + 3)
+
+
+@lru_cache(maxsize=256)
+def _format_history_time(timestamp: float) -> str:
+    """Format a history entry timestamp; entries repeat on every visit, so cache them."""
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(timestamp))
+
+def _parse_count(value: str) -> Optional[int]:
+    """Parse a non-negative line count, returning None if the value is not a number."""
+    # isdecimal() only accepts characters int() can parse, so no exception is needed
+    return int(value) if value.isdecimal() else None
+
+# Prompt fields for viewing logs: (name, prompt, default, parser)
+_LOG_PROMPT_FIELDS = (
+    ("container_id", "Enter container ID or name: ", None, str),
+    ("tail", "Number of lines to show (default: 100): ", 100, _parse_count),
+    ("follow", "Follow logs? (y/N): ", False, lambda value: value.lower() == 'y'),
+)
+
+# Console mode flag that makes Windows 10+ consoles interpret ANSI escape sequences
+_ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+_STD_OUTPUT_HANDLE = -11
+
+def _enable_windows_vt_mode() -> bool:
+    """Turn on ANSI escape sequence processing for the Windows console.
+    
+    Returns:
+        True if the console now understands ANSI sequences, False otherwise
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(_STD_OUTPUT_HANDLE)
+        mode = wintypes.DWORD()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except (ImportError, AttributeError, OSError):
+        return False
+
+class Option(NamedTuple):
+    """A menu option: the key to press, its description and the action it runs."""
+    key: str
+    desc: str
+    action: Callable[[], None]
+
+_LARGE_SYSTEM_TIPS = (
+    "1. Your system has substantial resources available.\n"
+    "2. Consider scaling up applications to utilize available resources.\n"
+    "3. Use Docker's restart policies for automatic recovery.\n"
+    "4. Implement health checks for better container reliability."
+)
 
 class InteractiveConsole:
     """Interactive console interface for Docker service management."""
     
+    # Optimization tips by resource profile; None holds the generic tips
+    _PROFILE_TIPS = {
+        "minimal": (
+            "1. Your system is resource-constrained. Consider adding more resources.\n"
+            "2. Use lightweight container images like Alpine where possible.\n"
+            "3. Set strict resource limits to prevent container resource contention.\n"
+            "4. Consider removing unused or idle containers to free up resources."
+        ),
+        "balanced": (
+            "1. Your system has adequate resources for your current workload.\n"
+            "2. Monitor high-usage containers and adjust their limits as needed.\n"
+            "3. Group related containers on the same network for better performance.\n"
+            "4. Consider Docker Compose for easier resource management."
+        ),
+        "performance": _LARGE_SYSTEM_TIPS,
+        "cpu-optimized": _LARGE_SYSTEM_TIPS,
+        "memory-optimized": _LARGE_SYSTEM_TIPS,
+        None: (
+            "1. Set appropriate memory limits for containers.\n"
+            "2. Use CPU quotas for CPU-intensive applications.\n"
+            "3. Implement container orchestration for better resource allocation.\n"
+            "4. Monitor container performance regularly."
+        ),
+    }
+    
+    # Onboarding help topic covered by each menu
+    _MENU_TO_TOPIC = {
+        "service": "service",
+        "socket": "socket",
+        "container": "containers",
+        "templates": "templates",
+        "info": "system",
+    }
+    
+    _TEMPLATE_FILES_CREATED = (
+        "\nFiles created:\n"
+        "  - {target_dir}/docker-compose.yml\n"
+        "  - {target_dir}/.env\n"
+        "  - {target_dir}/README.md\n"
+        "\nTo use this template, navigate to the directory and run:\n"
+        "  cd {target_dir}\n"
+        "  docker-compose up -d\n"
+    )
+    
     def __init__(self, demo_mode: bool = False):
         """Initialize interactive console.
         
@@ -24,101 +146,192 @@ class InteractiveConsole:
             demo_mode: Whether to use demo mode for Docker operations
         """
         self.manager = DockerServiceManager(demo_mode=demo_mode)
-        self.template_manager = TemplateManager(demo_mode=demo_mode)
         self.onboarding = OnboardingManager(demo_mode=demo_mode)
-        self.recommendation_engine = ContainerRecommendationEngine(demo_mode=demo_mode)
+        self._template_manager = None
+        self._recommendation_engine = None
+        self._cached_analysis = None
+        self._cached_analysis_ts = 0.0
+        self._last_health_report = None  # HealthReport kept for saving
+        self._templates_listing: Optional[str] = None
+        self._templates_rendered: Optional[str] = None
+        self._profiles_listing: Optional[str] = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
         self.demo_mode = demo_mode
         self.running = True
         self.current_menu = "main"
         self.menus = self._create_menus()
+        self._menu_frames: Dict[tuple, str] = {}
+        
+        # Classic Windows consoles only understand ANSI sequences once VT processing is on
+        ansi_supported = (os.name != 'nt' or 'WT_SESSION' in os.environ or 'ANSICON' in os.environ
+                          or _enable_windows_vt_mode())
+        self._ansi_clear = _ANSI_CLEAR if ansi_supported else None
+        self._alt_screen = ansi_supported and sys.stdout.isatty() and os.environ.get('TERM') != 'dumb'
+
+    @property
+    def template_manager(self):
+        """Template manager, created on first use."""
+        if self._template_manager is None:
+            from ..templates.environment_templates import TemplateManager
+            self._template_manager = TemplateManager(demo_mode=self.demo_mode)
+        return self._template_manager
+        
+    @property
+    def recommendation_engine(self):
+        """Recommendation engine, created on first use since it collects health metrics."""
+        if self._recommendation_engine is None:
+            from ..ai.recommendation import ContainerRecommendationEngine
+            self._recommendation_engine = ContainerRecommendationEngine(
+                demo_mode=self.demo_mode, service_manager=self.manager
+            )
+        return self._recommendation_engine
+
+    def _analysis(self, max_age: float = 30.0) -> Dict[str, Any]:
+        """Run the container analysis, reusing a recent result.
+        
+        Args:
+            max_age: Seconds for which a previous analysis is reused
+            
+        Returns:
+            Result of the recommendation engine's analyze_and_recommend()
+        """
+        now = time.monotonic()
+        if self._cached_analysis is None or now - self._cached_analysis_ts > max_age:
+            self._cached_analysis = self._run_with_spinner(self.recommendation_engine.analyze_and_recommend)
+            self._cached_analysis_ts = now
+        return self._cached_analysis
+        
+    def _run_with_spinner(self, func: Callable[[], Any]) -> Any:
+        """Run a function on the worker thread while animating a spinner.
+        
+        Args:
+            func: Function to run
+            
+        Returns:
+            The function's result; its exceptions are re-raised here
+        """
+        future = self._executor.submit(func)
+        
+        # Only animate on a terminal so redirected output stays clean
+        if sys.stdout.isatty():
+            frame = 0
+            while not future.done():
+                sys.stdout.write(f"\r{_SPINNER_FRAMES[frame % len(_SPINNER_FRAMES)]} Working...")
+                sys.stdout.flush()
+                frame += 1
+                time.sleep(_SPINNER_INTERVAL)
+            sys.stdout.write("\r" + " " * 12 + "\r")
+            
+        return future.result()
 
     def _create_menus(self) -> Dict[str, Dict[str, Any]]:
         """Create menu structure with options and actions.
         
         Returns:
-            Dictionary of menus with their options and associated actions
+            Dictionary of menus with their options, an action lookup by key
+            and the set of keys accepted at their prompt
         """
-        return {
+        menus = {
             "main": {
                 "title": "Main Menu",
                 "options": [
-                    {"key": "1", "desc": "Service Management", "action": lambda: self._change_menu("service")},
-                    {"key": "2", "desc": "Socket Management", "action": lambda: self._change_menu("socket")},
-                    {"key": "3", "desc": "Container Management", "action": lambda: self._change_menu("container")},
-                    {"key": "4", "desc": "Templates", "action": lambda: self._change_menu("templates")},
-                    {"key": "5", "desc": "System Information", "action": lambda: self._change_menu("info")},
-                    {"key": "6", "desc": "Generate Health Report", "action": self._generate_health_report},
-                    {"key": "7", "desc": "AI Recommendations", "action": lambda: self._change_menu("ai_recommendations")},
-                    {"key": "q", "desc": "Quit", "action": self._quit}
+                    Option("1", "Service Management", lambda: self._change_menu("service")),
+                    Option("2", "Socket Management", lambda: self._change_menu("socket")),
+                    Option("3", "Container Management", lambda: self._change_menu("container")),
+                    Option("4", "Templates", lambda: self._change_menu("templates")),
+                    Option("5", "System Information", lambda: self._change_menu("info")),
+                    Option("6", "Generate Health Report", self._generate_health_report),
+                    Option("7", "AI Recommendations", lambda: self._change_menu("ai_recommendations")),
+                    Option("q", "Quit", self._quit)
                 ]
             },
             "service": {
                 "title": "Service Management",
                 "options": [
-                    {"key": "1", "desc": "Check Service Status", "action": self._check_service_status},
-                    {"key": "2", "desc": "Start Service", "action": self._start_service},
-                    {"key": "3", "desc": "Stop Service", "action": self._stop_service},
-                    {"key": "4", "desc": "Restart Service", "action": self._restart_service},
-                    {"key": "5", "desc": "Enable Service at Boot", "action": self._enable_service},
-                    {"key": "6", "desc": "Disable Service at Boot", "action": self._disable_service},
-                    {"key": "b", "desc": "Back to Main Menu", "action": lambda: self._change_menu("main")}
+                    Option("1", "Check Service Status", self._check_service_status),
+                    Option("2", "Start Service", self._start_service),
+                    Option("3", "Stop Service", self._stop_service),
+                    Option("4", "Restart Service", self._restart_service),
+                    Option("5", "Enable Service at Boot", self._enable_service),
+                    Option("6", "Disable Service at Boot", self._disable_service),
+                    Option("b", "Back to Main Menu", lambda: self._change_menu("main"))
                 ]
             },
             "socket": {
                 "title": "Socket Management",
                 "options": [
-                    {"key": "1", "desc": "Check Socket Status", "action": self._check_socket_status},
-                    {"key": "2", "desc": "Start Socket", "action": self._start_socket},
-                    {"key": "3", "desc": "Stop Socket", "action": self._stop_socket},
-                    {"key": "4", "desc": "Enable Socket at Boot", "action": self._enable_socket},
-                    {"key": "5", "desc": "Disable Socket at Boot", "action": self._disable_socket},
-                    {"key": "b", "desc": "Back to Main Menu", "action": lambda: self._change_menu("main")}
+                    Option("1", "Check Socket Status", self._check_socket_status),
+                    Option("2", "Start Socket", self._start_socket),
+                    Option("3", "Stop Socket", self._stop_socket),
+                    Option("4", "Enable Socket at Boot", self._enable_socket),
+                    Option("5", "Disable Socket at Boot", self._disable_socket),
+                    Option("b", "Back to Main Menu", lambda: self._change_menu("main"))
                 ]
             },
             "container": {
                 "title": "Container Management",
                 "options": [
-                    {"key": "1", "desc": "List Containers", "action": self._list_containers},
-                    {"key": "2", "desc": "View Container Logs", "action": self._view_container_logs},
-                    {"key": "3", "desc": "Visualize Container Lifecycle", "action": self._visualize_containers},
-                    {"key": "b", "desc": "Back to Main Menu", "action": lambda: self._change_menu("main")}
+                    Option("1", "List Containers", self._list_containers),
+                    Option("2", "View Container Logs", self._view_container_logs),
+                    Option("3", "Visualize Container Lifecycle", self._visualize_containers),
+                    Option("b", "Back to Main Menu", lambda: self._change_menu("main"))
                 ]
             },
             "info": {
                 "title": "System Information",
                 "options": [
-                    {"key": "1", "desc": "Show Docker Info", "action": self._show_docker_info},
-                    {"key": "2", "desc": "Check Admin Privileges", "action": self._check_privileges},
-                    {"key": "3", "desc": "Generate Health Report", "action": self._generate_health_report},
-                    {"key": "4", "desc": "Save Health Report", "action": self._save_health_report},
-                    {"key": "b", "desc": "Back to Main Menu", "action": lambda: self._change_menu("main")}
+                    Option("1", "Show Docker Info", self._show_docker_info),
+                    Option("2", "Check Admin Privileges", self._check_privileges),
+                    Option("3", "Generate Health Report", self._generate_health_report),
+                    Option("4", "Save Health Report", self._save_health_report),
+                    Option("b", "Back to Main Menu", lambda: self._change_menu("main"))
                 ]
             },
             "templates": {
                 "title": "Development Templates",
                 "options": [
-                    {"key": "1", "desc": "List Available Templates", "action": self._list_templates},
-                    {"key": "2", "desc": "Create Environment", "action": self._create_environment},
-                    {"key": "3", "desc": "Launch Environment", "action": self._launch_environment},
-                    {"key": "b", "desc": "Back to Main Menu", "action": lambda: self._change_menu("main")}
+                    Option("1", "List Available Templates", self._list_templates),
+                    Option("2", "Create Environment", self._create_environment),
+                    Option("3", "Launch Environment", self._launch_environment),
+                    Option("b", "Back to Main Menu", lambda: self._change_menu("main"))
                 ]
             },
             "ai_recommendations": {
                 "title": "AI Recommendations",
                 "options": [
-                    {"key": "1", "desc": "Analyze Containers", "action": self._analyze_containers},
-                    {"key": "2", "desc": "Get Container Configuration Recommendations", "action": self._get_container_recommendations},
-                    {"key": "3", "desc": "View Resource Optimization Tips", "action": self._view_resource_optimization},
-                    {"key": "4", "desc": "Generate Optimized Template", "action": self._generate_optimized_template},
-                    {"key": "5", "desc": "Show Historical Analysis", "action": self._show_historical_analysis},
-                    {"key": "b", "desc": "Back to Main Menu", "action": lambda: self._change_menu("main")}
+                    Option("1", "Analyze Containers", self._analyze_containers),
+                    Option("2", "Get Container Configuration Recommendations", self._get_container_recommendations),
+                    Option("3", "View Resource Optimization Tips", self._view_resource_optimization),
+                    Option("4", "Generate Optimized Template", self._generate_optimized_template),
+                    Option("5", "Show Historical Analysis", self._show_historical_analysis),
+                    Option("r", "Refresh Analysis", self._refresh_analysis),
+                    Option("b", "Back to Main Menu", lambda: self._change_menu("main"))
                 ]
             }
         }
         
+        # Pre-render option lines; submenus list their own "b" option, so only
+        # the help keys are added to the accepted keys
+        for menu in menus.values():
+            options = menu["options"]
+            menu["option_lines"] = [f"{COLORS['CYAN']}{option.key}{COLORS['RESET']} - {option.desc}" for option in options]
+            menu["actions"] = {option.key: option.action for option in options}
+            # Usage names for suggestions, e.g. "Check Service Status" -> "check_service_status"
+            menu["action_names"] = {option.key: option.desc.lower().replace(" ", "_") for option in options}
+            menu["keys"] = frozenset(option.key for option in options) | {'?', 'h'}
+        
+        return menus
+        
     def _clear_screen(self) -> None:
-        """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear the terminal screen.
+        
+        Writes the ANSI clear sequence directly where supported, leaving the
+        flush to the following frame write, and only falls back to `cls`.
+        """
+        if self._ansi_clear is None:
+            os.system('cls')
+        else:
+            sys.stdout.write(self._ansi_clear)
         
     def _change_menu(self, menu_name: str) -> None:
         """Change to a different menu.
@@ -133,31 +346,50 @@ class InteractiveConsole:
             self.onboarding.show_first_time_section_help(menu_name)
         else:
             print(f"Error: Menu '{menu_name}' not found")
-            input("Press Enter to continue...")
+            self._pause("Press Enter to continue...")
             
     def _display_menu(self) -> None:
-        """Display the current menu with options."""
+        """Display the current menu with options as a single write."""
+        # Menus are static, so frames are rendered once per menu and terminal width
+        key = (self.current_menu, cached_terminal_size()[0])
+        frame = self._menu_frames.get(key)
+        if frame is None:
+            frame = self._menu_frames[key] = self._render_menu(self.current_menu)
+        
         self._clear_screen()
-        show_banner()
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+        
+    def _render_menu(self, menu_name: str) -> str:
+        """Build the full text of a menu screen.
+        
+        Args:
+            menu_name: Name of the menu to render
+            
+        Returns:
+            Menu text ending with a newline
+        """
+        lines = [format_banner()]
         
         # Display demo mode indicator if enabled
         if self.demo_mode:
-            print(f"\n{COLORS['YELLOW']}[DEMO MODE]{COLORS['RESET']} - Operations are simulated")
+            lines.append(f"\n{COLORS['YELLOW']}[DEMO MODE]{COLORS['RESET']} - Operations are simulated")
             
-        menu = self.menus[self.current_menu]
-        print_section(menu["title"])
+        menu = self.menus[menu_name]
+        lines.append(format_section(menu["title"]))
         
         # Display options
-        for option in menu["options"]:
-            print(f"{COLORS['CYAN']}{option['key']}{COLORS['RESET']} - {option['desc']}")
+        lines.extend(menu["option_lines"])
             
         # Add back option if not in main menu
-        if self.current_menu != "main":
-            print(f"{COLORS['CYAN']}b{COLORS['RESET']} - Back to Main Menu")
+        if menu_name != "main":
+            lines.append(f"{COLORS['CYAN']}b{COLORS['RESET']} - Back to Main Menu")
             
         # Add help indicators at the bottom
-        print(f"\n{COLORS['CYAN']}?{COLORS['RESET']} - Show help for this menu")
-        print(f"{COLORS['CYAN']}h{COLORS['RESET']} - Browse all help topics")
+        lines.append(f"\n{COLORS['CYAN']}?{COLORS['RESET']} - Show help for this menu")
+        lines.append(f"{COLORS['CYAN']}h{COLORS['RESET']} - Browse all help topics")
+        
+        return "\n".join(lines) + "\n"
             
     def _get_input(self) -> str:
         """Get user input for menu selection.
@@ -165,33 +397,45 @@ class InteractiveConsole:
         Returns:
             User's selection
         """
-        valid_keys = [option["key"] for option in self.menus[self.current_menu]["options"]]
-        
-        # Add help keys
-        valid_keys.extend(['?', 'h'])
-        
-        # Add back option if not in main menu
-        if self.current_menu != "main":
-            valid_keys.append('b')
-        
         while True:
             choice = input(f"\n{COLORS['BOLD']}Select an option (? for help):{COLORS['RESET']} ").lower()
             
             # Handle help commands
             if choice == '?':
-                self.onboarding.show_contextual_help(self.current_menu)
-                self._display_menu()
+                self._show_help(lambda: self.onboarding.show_contextual_help(self.current_menu))
                 continue
             elif choice == 'h':
-                self.onboarding.show_all_help_topics()
-                self._display_menu()
+                self._show_help(self.onboarding.show_all_help_topics)
                 continue
                 
-            if choice in valid_keys:
+            if choice in self.menus[self.current_menu]["keys"]:
                 return choice
                 
             print(f"{COLORS['RED']}Invalid option. Please try again.{COLORS['RESET']}")
             
+    def _show_help(self, show_help: Callable[[], None]) -> None:
+        """Show help, then return to the menu.
+        
+        On capable terminals help is shown on the alternate screen, so leaving
+        it brings the menu back without redrawing it; otherwise the menu is
+        redrawn in full.
+        
+        Args:
+            show_help: Function that displays the help
+        """
+        if not self._alt_screen:
+            show_help()
+            self._display_menu()
+            return
+            
+        sys.stdout.write(_ALT_SCREEN_ENTER)
+        sys.stdout.flush()
+        try:
+            show_help()
+        finally:
+            sys.stdout.write(_ALT_SCREEN_EXIT)
+            sys.stdout.flush()
+            
     def _process_action(self, choice: str) -> None:
         """Process the selected menu action.
         
@@ -213,14 +457,77 @@ class InteractiveConsole:
             return
         
         # Handle regular menu options
-        for option in self.menus[self.current_menu]["options"]:
-            if option["key"] == choice:
-                option["action"]()
-                break
+        action = self.menus[self.current_menu]["actions"].get(choice)
+        if action:
+            action()
                 
+    def _prompt_multi(self, fields: Sequence[Tuple[str, str, Any, Callable[[str], Any]]]) -> Dict[str, Any]:
+        """Ask for several values in turn, or read them all from one line.
+        
+        When stdin is not a terminal, the first answer may give every value as
+        `name=value` pairs separated by semicolons, so scripted runs need a
+        single line. Empty or invalid answers use the field's default, and
+        prompting stops at a required field (default None) left empty.
+        
+        Args:
+            fields: Tuples of (name, prompt, default, parser)
+            
+        Returns:
+            Dictionary of parsed values by field name
+        """
+        values = {}
+        for index, (name, prompt, default, parser) in enumerate(fields):
+            answer = input(prompt)
+            if index == 0 and '=' in answer and not sys.stdin.isatty():
+                pairs = {
+                    key.strip(): value.strip()
+                    for key, value in (pair.split('=', 1) for pair in answer.split(';') if '=' in pair)
+                }
+                return {
+                    field_name: self._parse_answer(pairs.get(field_name, ''), field_name, field_default, field_parser)
+                    for field_name, _, field_default, field_parser in fields
+                }
+            values[name] = self._parse_answer(answer, name, default, parser)
+            if values[name] is None:
+                break
+        return values
+        
+    def _parse_answer(self, answer: str, name: str, default: Any, parser: Callable[[str], Any]) -> Any:
+        """Parse a prompt answer, falling back to the default if empty or invalid.
+        
+        Parsers signal invalid input by returning None.
+        """
+        if not answer:
+            return default
+        value = parser(answer)
+        if value is None:
+            print(f"Invalid {name.replace('_', ' ')}. Using default ({default}).")
+            return default
+        return value
+            
+    def _pause(self, message: str = "\nPress Enter to continue...") -> None:
+        """Show a prompt, flushing any buffered output, and wait for Enter.
+        
+        Args:
+            message: Prompt to show
+        """
+        sys.stdout.write(message)
+        sys.stdout.flush()
+        sys.stdin.readline()
+        
+    def _emit(self, lines: List[str]) -> None:
+        """Write a screen's lines to stdout in a single call.
+        
+        Args:
+            lines: Lines to write, without trailing newlines
+        """
+        sys.stdout.write("\n".join(lines) + "\n")
+        
     def _quit(self) -> None:
         """Quit the interactive console."""
         self.running = False
+        self._executor.shutdown(wait=False)
+        self.onboarding.flush()
         print("\nThank you for using Docker Service Manager!")
         
     def _handle_action_result(self, success: bool, action_name: str, error_code: Optional[str] = None) -> None:
@@ -240,7 +547,7 @@ class InteractiveConsole:
             if error_code:
                 self.onboarding.show_error_help(error_code)
             
-        input("\nPress Enter to continue...")
+        self._pause()
         
     # Service management actions
     def _check_service_status(self) -> None:
@@ -255,37 +562,37 @@ class InteractiveConsole:
         if not success and error_code:
             self.onboarding.show_error_help(error_code)
         
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _start_service(self) -> None:
         """Start Docker service."""
         print_section("Starting Docker Service")
         success = self.manager.start_service()
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _stop_service(self) -> None:
         """Stop Docker service."""
         print_section("Stopping Docker Service")
         success = self.manager.stop_service()
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _restart_service(self) -> None:
         """Restart Docker service."""
         print_section("Restarting Docker Service")
         success = self.manager.restart_service()
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _enable_service(self) -> None:
         """Enable Docker service at boot."""
         print_section("Enabling Docker Service")
         success = self.manager.enable_service()
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _disable_service(self) -> None:
         """Disable Docker service at boot."""
         print_section("Disabling Docker Service")
         success = self.manager.disable_service()
-        input("\nPress Enter to continue...")
+        self._pause()
         
     # Socket management actions
     def _check_socket_status(self) -> None:
@@ -300,31 +607,31 @@ class InteractiveConsole:
         if not success and error_code:
             self.onboarding.show_error_help(error_code)
             
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _start_socket(self) -> None:
         """Start Docker socket."""
         print_section("Starting Docker Socket")
         success = self.manager.start_socket()
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _stop_socket(self) -> None:
         """Stop Docker socket."""
         print_section("Stopping Docker Socket")
         success = self.manager.stop_socket()
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _enable_socket(self) -> None:
         """Enable Docker socket at boot."""
         print_section("Enabling Docker Socket")
         success = self.manager.enable_socket()
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _disable_socket(self) -> None:
         """Disable Docker socket at boot."""
         print_section("Disabling Docker Socket")
         success = self.manager.disable_socket()
-        input("\nPress Enter to continue...")
+        self._pause()
         
     # Container management actions
     def _list_containers(self) -> None:
@@ -339,7 +646,7 @@ class InteractiveConsole:
         if not success and error_code:
             self.onboarding.show_error_help(error_code)
             
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _view_container_logs(self) -> None:
         """View logs for a specific container."""
@@ -347,36 +654,19 @@ class InteractiveConsole:
         
         print_section("View Container Logs")
         
-        # Ask for container ID
-        container_id = input("Enter container ID or name: ")
-        if not container_id:
+        # Ask for container ID, number of lines and whether to follow
+        params = self._prompt_multi(_LOG_PROMPT_FIELDS)
+        if not params["container_id"]:
             print("No container ID provided. Returning to menu.")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
-            
-        # Ask for number of lines to show
-        tail_input = input("Number of lines to show (default: 100): ")
-        tail = 100  # Default
-        if tail_input:
-            try:
-                tail = int(tail_input)
-            except ValueError:
-                print("Invalid number. Using default (100 lines).")
-                
-        # Ask whether to follow logs
-        follow_input = input("Follow logs? (y/N): ").lower()
-        follow = follow_input == 'y'
         
         # Get container logs
         logs_handler = ContainerLogs(demo_mode=self.demo_mode)
         print("\nFetching logs...\n")
-        success = logs_handler.get_container_logs(
-            container_id=container_id,
-            tail=tail,
-            follow=follow
-        )
+        success = logs_handler.get_container_logs(**params)
         
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _visualize_containers(self) -> None:
         """Visualize container lifecycle with animations."""
@@ -389,10 +679,11 @@ class InteractiveConsole:
             except ImportError:
                 print("The 'blessed' library is required for visualization.")
                 print("You can install it with: pip install blessed")
-                input("\nPress Enter to continue...")
+                self._pause()
                 return
                 
             # Initialize the visualizer
+            from ..core.container_visualization import ContainerVisualizer
             visualizer = ContainerVisualizer(demo_mode=self.demo_mode)
             
             # Show visualization
@@ -404,7 +695,7 @@ class InteractiveConsole:
             # Track usage for onboarding system
             self.onboarding.maybe_show_suggestion("container", "visualize")
             
-            input("Press Enter to start visualization...")
+            self._pause("Press Enter to start visualization...")
             
             # Try to run the full visualization
             success = visualizer.show_visualization()
@@ -417,7 +708,7 @@ class InteractiveConsole:
         except Exception as e:
             print(f"Error in visualization: {e}")
             
-        input("\nPress Enter to return to menu...")
+        self._pause("\nPress Enter to return to menu...")
         
     # System information actions
     def _show_docker_info(self) -> None:
@@ -432,34 +723,43 @@ class InteractiveConsole:
         if not success and error_code:
             self.onboarding.show_error_help(error_code)
             
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _check_privileges(self) -> None:
         """Check administrative privileges."""
         print_section("Administrative Privileges")
         success = self.manager.check_privileges()
-        input("\nPress Enter to continue...")
+        self._pause()
         
     # Template management actions
     def _list_templates(self) -> None:
         """List available environment templates."""
         print_section("Available Templates")
         success = self.template_manager.list_templates()
-        input("\nPress Enter to continue...")
+        self._pause()
+        
+    def _get_templates_listing(self) -> str:
+        """Get the environment template listing, rendering it on first use.
+        
+        Returns:
+            Listing text under its section title, ending with a newline
+        """
+        if self._templates_rendered is None:
+            self._templates_rendered = self.template_manager.render_templates_listing()
+        return format_section("Available Environment Templates") + "\n" + self._templates_rendered
         
     def _create_environment(self) -> None:
         """Create an environment from a template."""
         print_section("Create Environment")
         
         # List available templates
-        print("Available templates:\n")
-        self.template_manager.list_templates()
+        sys.stdout.write("Available templates:\n\n" + self._get_templates_listing())
         
         # Ask for template ID
         template_id = input("\nEnter template ID (e.g., lamp, mean, wordpress): ")
         if not template_id:
             print("No template ID provided. Returning to menu.")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
             
         # Ask for target directory
@@ -477,21 +777,20 @@ class InteractiveConsole:
         else:
             print_status("Failed to create environment", "error", demo_mode=self.demo_mode)
             
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _launch_environment(self) -> None:
         """Launch an environment from a template."""
         print_section("Launch Environment")
         
         # List available templates
-        print("Available templates:\n")
-        self.template_manager.list_templates()
+        sys.stdout.write("Available templates:\n\n" + self._get_templates_listing())
         
         # Ask for template ID
         template_id = input("\nEnter template ID (e.g., lamp, mean, wordpress): ")
         if not template_id:
             print("No template ID provided. Returning to menu.")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
             
         # Ask for target directory
@@ -508,7 +807,7 @@ class InteractiveConsole:
         else:
             print_status("Failed to launch environment", "error", demo_mode=self.demo_mode)
             
-        input("\nPress Enter to continue...")
+        self._pause()
         
     # Health report actions
     def _generate_health_report(self) -> None:
@@ -516,6 +815,7 @@ class InteractiveConsole:
         print_section("Docker System Health Report")
         
         # Initialize health report
+        from ..core.health_report import HealthReport
         health_report = HealthReport(demo_mode=self.demo_mode)
         
         # Generate and display the report
@@ -532,17 +832,17 @@ class InteractiveConsole:
         # Store report instance for potential saving
         self._last_health_report = health_report
         
-        input("\nPress Enter to continue...")
+        self._pause()
         
     def _save_health_report(self) -> None:
         """Save the last generated health report to a file."""
         print_section("Save Health Report")
         
         # Check if a report has been generated
-        if not hasattr(self, '_last_health_report'):
+        if self._last_health_report is None:
             print("No health report has been generated yet.")
             print("Please generate a health report first.")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
             
         # Ask for filename
@@ -560,7 +860,7 @@ class InteractiveConsole:
         else:
             print_status("Failed to save health report", "error", demo_mode=self.demo_mode)
             
-        input("\nPress Enter to continue...")
+        self._pause()
         
     # AI recommendation actions
     def _analyze_containers(self) -> None:
@@ -572,32 +872,32 @@ class InteractiveConsole:
         
         try:
             # Run analysis
-            results = self.recommendation_engine.analyze_and_recommend()
+            results = self._analysis()
             
             # Display analysis summary
             container_analysis = results.get("analysis", {}).get("container_analysis", {})
             system_metrics = results.get("analysis", {}).get("system_metrics", {})
-            
-            # System metrics summary
-            print_section("System Metrics")
-            print(f"CPU Usage: {system_metrics.get('cpu_usage', 0):.1f}%")
-            print(f"Memory Usage: {system_metrics.get('memory_usage', 0):.1f}%")
-            print(f"Disk Usage: {system_metrics.get('disk_usage', 0):.1f}%")
-            print()
-            
-            # Container summary
-            print_section("Container Summary")
-            print(f"Total Containers: {container_analysis.get('total_containers', 0)}")
-            print(f"Running Containers: {container_analysis.get('running_containers', 0)}")
-            print(f"Stopped Containers: {container_analysis.get('stopped_containers', 0)}")
-            print()
-            
-            # Resource usage
             resource_usage = container_analysis.get("resource_usage", {})
-            print_section("Resource Usage")
-            print(f"Average Memory Usage: {resource_usage.get('average_memory_usage', 0):.1f} MB")
-            print(f"Average CPU Usage: {resource_usage.get('average_cpu_usage', 0):.1f}%")
-            print()
+            
+            lines = [
+                # System metrics summary
+                format_section("System Metrics"),
+                f"CPU Usage: {system_metrics.get('cpu_usage', 0):.1f}%",
+                f"Memory Usage: {system_metrics.get('memory_usage', 0):.1f}%",
+                f"Disk Usage: {system_metrics.get('disk_usage', 0):.1f}%",
+                "",
+                # Container summary
+                format_section("Container Summary"),
+                f"Total Containers: {container_analysis.get('total_containers', 0)}",
+                f"Running Containers: {container_analysis.get('running_containers', 0)}",
+                f"Stopped Containers: {container_analysis.get('stopped_containers', 0)}",
+                "",
+                # Resource usage
+                format_section("Resource Usage"),
+                f"Average Memory Usage: {resource_usage.get('average_memory_usage', 0):.1f} MB",
+                f"Average CPU Usage: {resource_usage.get('average_cpu_usage', 0):.1f}%",
+                "",
+            ]
             
             # Display key insights
             insights = []
@@ -625,25 +925,26 @@ class InteractiveConsole:
             
             # Print insights
             if insights:
-                print_section("Key Insights")
-                for insight in insights:
-                    print(insight)
-                print()
+                lines.append(format_section("Key Insights"))
+                lines.extend(insights)
+                lines.append("")
             
             # Print recommendations count
             recommendations = results.get("recommendations", [])
-            print_section("Recommendations")
+            lines.append(format_section("Recommendations"))
             
             if recommendations:
-                print(f"Found {len(recommendations)} recommendations to optimize your Docker environment.")
-                print("Use 'Get Container Configuration Recommendations' for detailed recommendations.")
+                lines.append(f"Found {len(recommendations)} recommendations to optimize your Docker environment.")
+                lines.append("Use 'Get Container Configuration Recommendations' for detailed recommendations.")
             else:
-                print("No recommendations found. Your Docker environment appears to be well-configured.")
+                lines.append("No recommendations found. Your Docker environment appears to be well-configured.")
+            
+            self._emit(lines)
             
         except Exception as e:
             print_status(f"Error during analysis: {e}", "error", demo_mode=self.demo_mode)
         
-        input("\nPress Enter to continue...")
+        self._pause()
     
     def _get_container_recommendations(self) -> None:
         """Get detailed container configuration recommendations."""
@@ -654,55 +955,51 @@ class InteractiveConsole:
         
         try:
             # Run analysis
-            results = self.recommendation_engine.analyze_and_recommend()
+            results = self._analysis()
             recommendations = results.get("recommendations", [])
             
             if not recommendations:
                 print("No recommendations found. Your container configurations appear optimal.")
-                input("\nPress Enter to continue...")
+                self._pause()
                 return
             
             # Group recommendations by type
-            recommendations_by_type = {}
+            recommendations_by_type = defaultdict(list)
             for rec in recommendations:
-                rec_type = rec.get("type", "general")
-                if rec_type not in recommendations_by_type:
-                    recommendations_by_type[rec_type] = []
-                recommendations_by_type[rec_type].append(rec)
-            
-            # Display recommendations by type
-            for rec_type, recs in recommendations_by_type.items():
-                print_section(f"{rec_type.title()} Recommendations")
-                
-                for i, rec in enumerate(recs, 1):
-                    priority = rec.get("priority", "medium").upper()
-                    priority_color = {
-                        "HIGH": COLORS["RED"],
-                        "MEDIUM": COLORS["YELLOW"],
-                        "LOW": COLORS["GREEN"]
-                    }.get(priority, COLORS["RESET"])
-                    
-                    print(f"{i}. [{priority_color}{priority}{COLORS['RESET']}] {rec.get('title', 'Recommendation')}")
-                    print(f"   {rec.get('description', '')}")
-                    
-                    # Display actions
-                    actions = rec.get("actions", [])
-                    if actions:
-                        print("\n   Suggested actions:")
-                        for j, action in enumerate(actions, 1):
-                            print(f"   {j}. {action}")
-                    
-                    # Display affected containers if any
-                    affected = rec.get("affected_containers", [])
-                    if affected:
-                        print(f"\n   Affected containers: {', '.join(affected)}")
+                recommendations_by_type[rec.get("type", "general")].append(rec)
+            
+            # Display recommendations by type, flushing once at the end
+            with buffered_stdout():
+                for rec_type, recs in recommendations_by_type.items():
+                    print_section(f"{rec_type.title()} Recommendations")
                     
-                    print()
+                    for i, rec in enumerate(recs, 1):
+                        priority = rec.get("priority", "medium").upper()
+                        badge = _PRIORITY_BADGES.get(priority)
+                        if badge is None:
+                            badge = f"[{_DEFAULT_PRIORITY_COLOR}{priority}{COLORS['RESET']}]"
+                        
+                        print(f"{i}. {badge} {rec.get('title', 'Recommendation')}")
+                        print(f"   {rec.get('description', '')}")
+                        
+                        # Display actions
+                        actions = rec.get("actions", [])
+                        if actions:
+                            print("\n   Suggested actions:")
+                            for j, action in enumerate(actions, 1):
+                                print(f"   {j}. {action}")
+                        
+                        # Display affected containers if any
+                        affected = rec.get("affected_containers", [])
+                        if affected:
+                            print(f"\n   Affected containers: {', '.join(affected)}")
+                        
+                        print()
             
         except Exception as e:
             print_status(f"Error generating recommendations: {e}", "error", demo_mode=self.demo_mode)
         
-        input("\nPress Enter to continue...")
+        self._pause()
     
     def _view_resource_optimization(self) -> None:
         """View resource optimization tips."""
@@ -713,55 +1010,40 @@ class InteractiveConsole:
         
         try:
             # Run analysis
-            results = self.recommendation_engine.analyze_and_recommend()
+            results = self._analysis()
             resource_recommendations = results.get("resource_recommendations", {})
             
             # Display current resource profile
             profile = resource_recommendations.get("resource_profile", "unknown")
             profile_details = resource_recommendations.get("profile_details", {})
             
-            print_section("Current Resource Profile")
-            print(f"Profile: {profile.upper()}")
-            print(f"Description: {profile_details.get('description', 'Unknown')}")
-            print()
-            
-            # Display resource recommendations
-            print_section("Resource Recommendations")
-            print(f"Recommended CPU: {resource_recommendations.get('recommended_cpu', 0)} cores")
-            print(f"Recommended Memory: {resource_recommendations.get('recommended_memory', '0m')}")
-            print(f"Recommended Memory Reservation: {resource_recommendations.get('recommended_memory_reservation', '0m')}")
-            print(f"Available Memory: {resource_recommendations.get('available_memory', '0m')}")
-            print()
-            
-            # Display optimization tips
-            print_section("Optimization Tips")
-            
-            # Based on profile, provide specific tips
-            if profile == "minimal":
-                print("1. Your system is resource-constrained. Consider adding more resources.")
-                print("2. Use lightweight container images like Alpine where possible.")
-                print("3. Set strict resource limits to prevent container resource contention.")
-                print("4. Consider removing unused or idle containers to free up resources.")
-            elif profile == "balanced":
-                print("1. Your system has adequate resources for your current workload.")
-                print("2. Monitor high-usage containers and adjust their limits as needed.")
-                print("3. Group related containers on the same network for better performance.")
-                print("4. Consider Docker Compose for easier resource management.")
-            elif profile == "performance" or profile == "cpu-optimized" or profile == "memory-optimized":
-                print("1. Your system has substantial resources available.")
-                print("2. Consider scaling up applications to utilize available resources.")
-                print("3. Use Docker's restart policies for automatic recovery.")
-                print("4. Implement health checks for better container reliability.")
-            else:
-                print("1. Set appropriate memory limits for containers.")
-                print("2. Use CPU quotas for CPU-intensive applications.")
-                print("3. Implement container orchestration for better resource allocation.")
-                print("4. Monitor container performance regularly.")
+            self._emit([
+                format_section("Current Resource Profile"),
+                f"Profile: {profile.upper()}",
+                f"Description: {profile_details.get('description', 'Unknown')}",
+                "",
+                # Display resource recommendations
+                format_section("Resource Recommendations"),
+                f"Recommended CPU: {resource_recommendations.get('recommended_cpu', 0)} cores",
+                f"Recommended Memory: {resource_recommendations.get('recommended_memory', '0m')}",
+                f"Recommended Memory Reservation: {resource_recommendations.get('recommended_memory_reservation', '0m')}",
+                f"Available Memory: {resource_recommendations.get('available_memory', '0m')}",
+                "",
+                # Display optimization tips based on the profile
+                format_section("Optimization Tips"),
+                self._PROFILE_TIPS.get(profile, self._PROFILE_TIPS[None]),
+            ])
             
         except Exception as e:
             print_status(f"Error generating resource optimization tips: {e}", "error", demo_mode=self.demo_mode)
         
-        input("\nPress Enter to continue...")
+        self._pause()
+    
+    def _refresh_analysis(self) -> None:
+        """Discard the reused analysis so the next view analyzes again."""
+        self._cached_analysis = None
+        print_status("Analysis results cleared; the next view will run a fresh analysis", "ok", demo_mode=self.demo_mode)
+        self._pause()
     
     def _generate_optimized_template(self) -> None:
         """Generate an optimized container template."""
@@ -770,16 +1052,19 @@ class InteractiveConsole:
         # Show available templates
         templates = self.recommendation_engine.APPLICATION_TEMPLATES
         
-        print("Available template types:")
-        for template_id, template in templates.items():
-            print(f"  {template_id}: {template.get('name', 'Unknown')}")
-        print()
+        if self._templates_listing is None:
+            self._templates_listing = "\n".join(
+                ["Available template types:"]
+                + [f"  {template_id}: {template.get('name', 'Unknown')}" for template_id, template in templates.items()]
+                + [""]
+            )
+        self._emit([self._templates_listing])
         
         # Ask for template type
         template_id = input("Enter template type (e.g., web_server, database): ")
         if not template_id or template_id not in templates:
             print(f"Invalid template type. Please choose from: {', '.join(templates.keys())}")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
         
         # Ask for target directory
@@ -800,9 +1085,12 @@ class InteractiveConsole:
         
         # Get custom resource profile
         profiles = self.recommendation_engine.RESOURCE_PROFILES
-        print("\nAvailable resource profiles:")
-        for profile_id, profile in profiles.items():
-            print(f"  {profile_id}: {profile.get('description', 'Unknown')}")
+        if self._profiles_listing is None:
+            self._profiles_listing = "\n".join(
+                ["\nAvailable resource profiles:"]
+                + [f"  {profile_id}: {profile.get('description', 'Unknown')}" for profile_id, profile in profiles.items()]
+            )
+        self._emit([self._profiles_listing])
         
         custom_profile = input(f"\nResource profile (default: {template.get('resource_profile', 'balanced')}): ")
         if custom_profile and custom_profile in profiles:
@@ -818,144 +1106,126 @@ class InteractiveConsole:
         
         if success:
             print_status(f"Template generated successfully in {target_dir}", "ok", demo_mode=self.demo_mode)
-            print(f"\nFiles created:")
-            print(f"  - {target_dir}/docker-compose.yml")
-            print(f"  - {target_dir}/.env")
-            print(f"  - {target_dir}/README.md")
-            print("\nTo use this template, navigate to the directory and run:")
-            print(f"  cd {target_dir}")
-            print("  docker-compose up -d")
+            sys.stdout.write(self._TEMPLATE_FILES_CREATED.format(target_dir=target_dir))
         else:
             print_status(f"Failed to generate template: {error}", "error", demo_mode=self.demo_mode)
         
-        input("\nPress Enter to continue...")
+        self._pause()
     
     def _show_historical_analysis(self) -> None:
         """Show historical container and system analysis."""
         print_section("Historical Analysis")
         
-        # Check if we have historical data
-        container_history = self.recommendation_engine.container_history
-        system_metrics_history = self.recommendation_engine.system_metrics_history
+        # Check if we have historical data, limiting display to the last 10 entries
+        container_history, system_metrics_history = self.recommendation_engine.history_tail(10)
         
         if not container_history or not system_metrics_history:
             print("No historical data available yet. Run a few analyses to collect data.")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
         
-        # Limit display to last 10 entries
-        container_history = container_history[-10:]
-        system_metrics_history = system_metrics_history[-10:]
-        
         # Display container history
-        print_section("Container Count History")
-        
-        # Create a simple ASCII chart
-        max_containers = max([entry.get("container_count", 0) for entry in container_history])
-        chart_width = 40
-        
-        for entry in container_history:
-            timestamp = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.get("timestamp", 0)))
-            container_count = entry.get("container_count", 0)
-            running_count = entry.get("running_count", 0)
-            
-            # Calculate bar lengths
-            if max_containers > 0:
-                container_bar = int((container_count / max_containers) * chart_width)
-                running_bar = int((running_count / max_containers) * chart_width)
-            else:
-                container_bar = 0
-                running_bar = 0
-            
-            # Print chart bars
-            print(f"{timestamp} | ", end="")
-            print(f"Total: {container_count} " + "█" * container_bar)
-            print(" " * (timestamp.__len__() + 3), end="")
-            print(f"Running: {running_count} " + "█" * running_bar)
-            print()
+        lines = [format_section("Container Count History")]
+        
+        # Create a simple ASCII chart, scaling bars with integer arithmetic
+        rows = [
+            (_format_history_time(entry.get("timestamp", 0)), entry.get("container_count", 0), entry.get("running_count", 0))
+            for entry in container_history
+        ]
+        max_containers = max(container_count for _, container_count, _ in rows)
+        
+        if max_containers == 0:
+            # Every bar would be empty
+            lines.append("No container activity recorded.")
+            lines.append("")
+        else:
+            for timestamp, container_count, running_count in rows:
+                container_bar = container_count * _HISTORY_CHART_WIDTH // max_containers
+                running_bar = running_count * _HISTORY_CHART_WIDTH // max_containers
+                lines.append(f"{timestamp} | Total: {container_count} " + "█" * container_bar)
+                lines.append(f"{_HISTORY_ROW_PAD}Running: {running_count} " + "█" * running_bar)
+                lines.append("")
         
         # Display system metrics history
-        print_section("System Metrics History")
+        lines.append(format_section("System Metrics History"))
         
         for entry in system_metrics_history:
-            timestamp = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.get("timestamp", 0)))
+            timestamp = _format_history_time(entry.get("timestamp", 0))
             cpu = entry.get("cpu_usage", 0)
             memory = entry.get("memory_usage", 0)
             disk = entry.get("disk_usage", 0)
             
-            print(f"{timestamp} | CPU: {cpu:.1f}% | Memory: {memory:.1f}% | Disk: {disk:.1f}%")
+            lines.append(f"{timestamp} | CPU: {cpu:.1f}% | Memory: {memory:.1f}% | Disk: {disk:.1f}%")
         
         # Display summary
-        print_section("Analysis Summary")
+        lines.append(format_section("Analysis Summary"))
         
         # Calculate trends
-        if len(container_history) > 1:
-            container_trend = container_history[-1].get("container_count", 0) - container_history[0].get("container_count", 0)
-            running_trend = container_history[-1].get("running_count", 0) - container_history[0].get("running_count", 0)
+        if len(rows) > 1:
+            _, first_count, first_running = rows[0]
+            _, last_count, last_running = rows[-1]
+            container_trend = last_count - first_count
+            running_trend = last_running - first_running
             
             if container_trend > 0:
-                print(f"Container count is increasing (+{container_trend})")
+                lines.append(f"Container count is increasing (+{container_trend})")
             elif container_trend < 0:
-                print(f"Container count is decreasing ({container_trend})")
+                lines.append(f"Container count is decreasing ({container_trend})")
             else:
-                print("Container count is stable")
+                lines.append("Container count is stable")
                 
             if running_trend > 0:
-                print(f"Running container count is increasing (+{running_trend})")
+                lines.append(f"Running container count is increasing (+{running_trend})")
             elif running_trend < 0:
-                print(f"Running container count is decreasing ({running_trend})")
+                lines.append(f"Running container count is decreasing ({running_trend})")
             else:
-                print("Running container count is stable")
+                lines.append("Running container count is stable")
         
         if len(system_metrics_history) > 1:
-            cpu_trend = system_metrics_history[-1].get("cpu_usage", 0) - system_metrics_history[0].get("cpu_usage", 0)
-            memory_trend = system_metrics_history[-1].get("memory_usage", 0) - system_metrics_history[0].get("memory_usage", 0)
-            disk_trend = system_metrics_history[-1].get("disk_usage", 0) - system_metrics_history[0].get("disk_usage", 0)
+            first, last = system_metrics_history[0], system_metrics_history[-1]
+            cpu_trend = last.get("cpu_usage", 0) - first.get("cpu_usage", 0)
+            memory_trend = last.get("memory_usage", 0) - first.get("memory_usage", 0)
+            disk_trend = last.get("disk_usage", 0) - first.get("disk_usage", 0)
             
-            print(f"CPU usage trend: {'+' if cpu_trend > 0 else ''}{cpu_trend:.1f}%")
-            print(f"Memory usage trend: {'+' if memory_trend > 0 else ''}{memory_trend:.1f}%")
-            print(f"Disk usage trend: {'+' if disk_trend > 0 else ''}{disk_trend:.1f}%")
+            lines.append(f"CPU usage trend: {'+' if cpu_trend > 0 else ''}{cpu_trend:.1f}%")
+            lines.append(f"Memory usage trend: {'+' if memory_trend > 0 else ''}{memory_trend:.1f}%")
+            lines.append(f"Disk usage trend: {'+' if disk_trend > 0 else ''}{disk_trend:.1f}%")
         
-        input("\nPress Enter to continue...")
+        self._emit(lines)
+        
+        self._pause()
     
     def run(self) -> None:
         """Main loop for interactive console."""
-        # Show welcome message for first-time users
-        self.onboarding.show_welcome()
-        
-        # First-time help for main menu if applicable
-        self.onboarding.show_first_time_section_help("main")
-        
-        while self.running:
-            self._display_menu()
-            choice = self._get_input()
-            
-            # Skip suggestions for navigation actions
-            if choice not in ['q', 'b', '?', 'h']:
-                # Extract the action name from the menu option
-                action = None
-                for option in self.menus[self.current_menu]["options"]:
-                    if option["key"] == choice:
-                        # Convert "Check Service Status" to "check_service_status"
-                        action = option["desc"].lower().replace(" ", "_")
-                        
-                        # Mark topic as viewed if we're showing help for it
-                        if self.current_menu == "service":
-                            self.onboarding.mark_topic_completed("service")
-                        elif self.current_menu == "socket":
-                            self.onboarding.mark_topic_completed("socket")
-                        elif self.current_menu == "container":
-                            self.onboarding.mark_topic_completed("containers")
-                        elif self.current_menu == "templates":
-                            self.onboarding.mark_topic_completed("templates")
-                        elif self.current_menu == "info":
-                            self.onboarding.mark_topic_completed("system")
-                        
-                        break
-                        
-                # Only show suggestions for actual actions (not navigation)
-                if action:
-                    self.onboarding.maybe_show_suggestion(self.current_menu, action)
+        # Cache the terminal size while the console runs; the handler is removed
+        # again so a TUI started afterwards gets the default SIGWINCH disposition
+        install_resize_handler()
+        try:
+            # Show welcome message for first-time users
+            self.onboarding.show_welcome()
+            
+            # First-time help for main menu if applicable
+            self.onboarding.show_first_time_section_help("main")
             
-            # Process the selected action
-            self._process_action(choice)
\ No newline at end of file
+            while self.running:
+                self._display_menu()
+                choice = self._get_input()
+                
+                # Skip suggestions for navigation actions
+                if choice not in ['q', 'b', '?', 'h']:
+                    # Look up the action name for the menu option
+                    action = self.menus[self.current_menu]["action_names"].get(choice)
+                    if action:
+                        # Mark topic as viewed if we're showing help for it
+                        topic = self._MENU_TO_TOPIC.get(self.current_menu)
+                        if topic:
+                            self.onboarding.mark_topic_completed(topic)
+                            
+                    # Only show suggestions for actual actions (not navigation)
+                    if action:
+                        self.onboarding.maybe_show_suggestion(self.current_menu, action)
+                
+                # Process the selected action
+                self._process_action(choice)
+        finally:
+            restore_resize_handler()
\ No newline at end of file
@@ -6,12 +6,135 @@ to help them learn how to use the Docker Service Manager.
 """
 
 import os
+import copy
 import json
 import time
-from typing import Optional, List, Dict, Any
+import atexit
+from typing import Optional, List, Dict, Any, Tuple, Callable
 
 from ..utils.display import print_status, print_section
 
+# Use orjson for the config file when it is installed; both serializers produce UTF-8 bytes
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data).encode()
+    _loads = json.loads
+
+# Explicit buffer size for config file reads, so it does not depend on the filesystem's block size
+_CONFIG_BUFFER_SIZE = 64 * 1024
+
+# A tip is shown the first time an action is used in a session, then on every Nth use
+_SUGGESTION_INTERVAL = 5
+
+# Parsed config files: path -> ((mtime_ns, size) when read, configuration)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Welcome text shown the first time a section is opened: section -> (title, message)
+_SECTION_HELP = {
+    "service": (
+        "Service Management",
+        "This section allows you to control the Docker service (daemon).\n"
+        "Start by checking the service status to see if Docker is running."
+    ),
+    "socket": (
+        "Socket Management",
+        "This section allows you to control the Docker socket.\n"
+        "The socket is how applications communicate with Docker."
+    ),
+    "container": (
+        "Container Management",
+        "This section allows you to manage Docker containers.\n"
+        "Try listing containers to see what's currently running."
+    ),
+    "templates": (
+        "Environment Templates",
+        "This section helps you create development environments.\n"
+        "Start by listing available templates to see what's available."
+    ),
+    "info": (
+        "System Information",
+        "This section provides information about your Docker installation.\n"
+        "Check Docker Info to see system-wide details."
+    )
+}
+
+# Help for common errors: error code -> (title, message)
+_ERROR_HELP = {
+    "service_not_running": (
+        "Docker Service Not Running",
+        "The Docker daemon service isn't running. Try the following:\n\n"
+        "1. Start the service with 'docker_service_manager.py service start'\n"
+        "2. Check if Docker is installed correctly\n"
+        "3. Verify you have sufficient permissions (try running with sudo)"
+    ),
+    "socket_not_available": (
+        "Docker Socket Not Available",
+        "The Docker socket is not accessible. This usually means:\n\n"
+        "1. The Docker service is not running\n"
+        "2. The socket has incorrect permissions\n"
+        "3. You don't have permission to access the socket\n\n"
+        "Try starting both the service and socket, or add your user to the 'docker' group."
+    ),
+    "permission_denied": (
+        "Permission Denied",
+        "You don't have sufficient permissions to perform this operation.\n\n"
+        "On Linux: Use sudo or add your user to the 'docker' group\n"
+        "On Windows: Run as Administrator\n"
+        "On macOS: You may need to enter your password"
+    ),
+    "docker_not_installed": (
+        "Docker Not Installed or Not Found",
+        "Docker doesn't appear to be installed or can't be found in your PATH.\n\n"
+        "1. Install Docker from https://docs.docker.com/get-docker/\n"
+        "2. Ensure Docker is in your PATH environment variable\n"
+        "3. You can use --demo mode to explore this tool without Docker"
+    ),
+    "container_not_found": (
+        "Container Not Found",
+        "The specified container ID or name couldn't be found.\n\n"
+        "1. Check that the container exists with 'docker_service_manager.py containers'\n"
+        "2. Verify you're using the correct container ID or name\n"
+        "3. The container may have been removed or may not be running"
+    ),
+    "template_not_found": (
+        "Template Not Found",
+        "The specified environment template couldn't be found.\n\n"
+        "Available templates are:\n"
+        "- lamp: LAMP Stack (Linux, Apache, MySQL, PHP)\n"
+        "- mean: MEAN Stack (MongoDB, Express, Angular, Node.js)\n"
+        "- wordpress: WordPress development environment"
+    )
+}
+
+# Contexts that have a help topic: context -> topic
+_CONTEXT_MAP = {
+    "main_menu": "main",
+    "service_menu": "service",
+    "socket_menu": "socket",
+    "container_menu": "containers",
+    "templates_menu": "templates",
+    "system_menu": "system",
+    "check_privileges": "privileges"
+}
+
+# Help browser menu; the keys match the handlers in OnboardingManager._help_browser_topics
+_HELP_BROWSER_MENU = (
+    "Available topics:\n"
+    "1 - Docker Service Management\n"
+    "2 - Docker Socket Management\n"
+    "3 - Container Management\n"
+    "4 - Environment Templates\n"
+    "5 - System Information\n"
+    "6 - Administrative Privileges\n"
+    "7 - Demo Mode\n"
+    "8 - System Health Report\n"
+    "0 - Return to previous menu"
+)
+
 
 class OnboardingManager:
     """Handles onboarding for new users of Docker Service Manager."""
@@ -19,6 +142,37 @@ class OnboardingManager:
     CONFIG_DIR = os.path.expanduser("~/.docker_manager")
     CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
     
+    # Tips shown after an action: "<context>_<action>" -> (help topic that makes the tip unnecessary, tip)
+    _SUGGESTIONS = {
+        # Service management suggestions
+        "service_status": ("service", "Tip: Docker service status shows if the daemon is running."),
+        "service_start": ("service", "Tip: After starting the service, try 'status' to verify it's running."),
+        "service_stop": ("service", "Tip: Stopping the service will disconnect all containers."),
+        "service_restart": ("service", "Tip: Restarting is useful when Docker seems unresponsive."),
+        "service_enable": ("service", "Tip: Enabling the service makes Docker start automatically at boot."),
+        "service_disable": ("service", "Tip: Disabling prevents Docker from starting at boot."),
+        
+        # Socket management suggestions
+        "socket_status": ("socket", "Tip: The Docker socket is how tools communicate with Docker."),
+        "socket_start": ("socket", "Tip: Starting the socket allows Docker clients to connect."),
+        
+        # Container management suggestions
+        "container_list": ("containers", "Tip: You can view logs for a specific container using the 'logs' command."),
+        "container_logs": ("containers", "Tip: Container logs are helpful for troubleshooting issues."),
+        "container_visualize": ("containers", "Tip: The container visualization shows real-time state transitions with animation."),
+        
+        # Template suggestions
+        "templates_list": ("templates", "Tip: Templates help you quickly set up development environments."),
+        "templates_create": ("templates", "Tip: Creating an environment generates all necessary configuration files."),
+        "templates_launch": ("templates", "Tip: Launching starts all containers defined in the template."),
+        
+        # System information suggestions
+        "info_docker": ("system", "Tip: Docker info shows system-wide information about your Docker setup."),
+        "check_privileges": ("privileges", "Tip: Many Docker operations require administrative privileges."),
+        "health_report": ("system", "Tip: Health reports provide detailed performance metrics and resource usage."),
+        "save_report": ("system", "Tip: Save reports to track system health over time or for troubleshooting."),
+    }
+    
     def __init__(self, demo_mode: bool = False):
         """Initialize the onboarding system.
         
@@ -28,7 +182,30 @@ class OnboardingManager:
         self.demo_mode = demo_mode
         self.config = self._load_config()
         self.first_run = self.config.get("first_run", True)
-        self.completed_topics = self.config.get("completed_topics", [])
+        # Kept as sets for membership tests and written back as sorted lists
+        self.completed_topics = set(self.config.get("completed_topics", []))
+        self._visited_sections = set(self.config.get("visited_sections", []))
+        
+        # Changes are kept in memory and written out together by flush()
+        self._dirty = False
+        self._config_dir_ready = False
+        self._last_saved_snapshot: Optional[bytes] = None
+        atexit.register(self.flush)
+        
+        # Uses of each (context, action) this session, to space out repeated tips
+        self._action_counts: Dict[Tuple[str, str], int] = {}
+        
+        # Help browser selection -> topic handler
+        self._help_browser_topics: Dict[str, Callable[[], None]] = {
+            "1": self._show_service_help,
+            "2": self._show_socket_help,
+            "3": self._show_containers_help,
+            "4": self._show_templates_help,
+            "5": self._show_system_help,
+            "6": self._show_privileges_help,
+            "7": self._show_demo_mode_help,
+            "8": self._show_health_report_help,
+        }
         
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default.
@@ -36,12 +213,21 @@ class OnboardingManager:
         Returns:
             Configuration dictionary
         """
-        if os.path.exists(self.CONFIG_FILE):
-            try:
-                with open(self.CONFIG_FILE, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        try:
+            # Open directly instead of checking for the file first; a missing file raises
+            with open(self.CONFIG_FILE, 'rb', buffering=_CONFIG_BUFFER_SIZE) as f:
+                # Reuse the parsed file unless it has changed since it was read
+                stat = os.fstat(f.fileno())
+                signature = (stat.st_mtime_ns, stat.st_size)
+                cached = _CONFIG_CACHE.get(self.CONFIG_FILE)
+                if cached is not None and cached[0] == signature:
+                    return copy.deepcopy(cached[1])
+                config = _loads(f.read())
+            _CONFIG_CACHE[self.CONFIG_FILE] = (signature, copy.deepcopy(config))
+            return config
+        except (OSError, ValueError):
+            # Missing or unreadable file, or invalid JSON
+            pass
         
         # Default configuration
         return {
@@ -53,22 +239,84 @@ class OnboardingManager:
     def _save_config(self) -> bool:
         """Save configuration to file.
         
+        Nothing is written if the configuration is unchanged since the last save.
+        
         Returns:
             True if successful, False otherwise
         """
+        self.config["completed_topics"] = sorted(self.completed_topics)
+        self.config["visited_sections"] = sorted(self._visited_sections)
+        
+        # Compare without the timestamp, which would otherwise differ on every save
+        snapshot = _dumps({key: value for key, value in self.config.items() if key != "last_used"})
+        if snapshot == self._last_saved_snapshot:
+            return True
+        
         try:
             # Ensure directory exists
-            os.makedirs(self.CONFIG_DIR, exist_ok=True)
+            if not self._config_dir_ready:
+                os.makedirs(self.CONFIG_DIR, exist_ok=True)
+                self._config_dir_ready = True
             
             # Update last used timestamp
             self.config["last_used"] = time.time()
             
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f)
+            self._write_atomic(_dumps(self.config))
+            self._last_saved_snapshot = snapshot
+            
+            # Later loads can use what was just written instead of reading it back
+            stat = os.stat(self.CONFIG_FILE)
+            _CONFIG_CACHE[self.CONFIG_FILE] = ((stat.st_mtime_ns, stat.st_size), copy.deepcopy(self.config))
             return True
         except IOError:
             return False
     
+    def _write_atomic(self, payload: bytes) -> None:
+        """Replace the config file with new contents in a single step.
+        
+        The data is written to a temporary file next to the config and renamed over
+        it, so an interrupted write never leaves a truncated config behind.
+        
+        Args:
+            payload: Serialized configuration
+        """
+        tmp_file = self.CONFIG_FILE + ".tmp"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o600)
+        try:
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.CONFIG_FILE)
+        except OSError:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
+        
+    def _mark_dirty(self) -> None:
+        """Record that the configuration has changed and needs to be written by flush()."""
+        self._dirty = True
+        
+    def flush(self) -> bool:
+        """Write any pending configuration changes to file.
+        
+        Called automatically on exit, so a burst of changes is saved in one write.
+        
+        Returns:
+            True if there was nothing to write or the write succeeded, False otherwise
+        """
+        if not self._dirty:
+            return True
+        if not self._save_config():
+            return False
+        self._dirty = False
+        return True
+    
     def mark_topic_completed(self, topic: str) -> None:
         """Mark a help topic as completed.
         
@@ -76,15 +324,14 @@ class OnboardingManager:
             topic: Topic identifier
         """
         if topic not in self.completed_topics:
-            self.completed_topics.append(topic)
-            self.config["completed_topics"] = self.completed_topics
-            self._save_config()
+            self.completed_topics.add(topic)
+            self._mark_dirty()
     
     def mark_first_run_complete(self) -> None:
         """Mark first run as complete."""
         self.first_run = False
         self.config["first_run"] = False
-        self._save_config()
+        self._mark_dirty()
     
     def is_topic_completed(self, topic: str) -> bool:
         """Check if a help topic has been completed.
@@ -107,12 +354,10 @@ class OnboardingManager:
             True if this is the first time, False otherwise
         """
         section_key = f"visited_{section}"
-        visited = self.config.get("visited_sections", [])
         
-        if section_key not in visited:
-            visited.append(section_key)
-            self.config["visited_sections"] = visited
-            self._save_config()
+        if section_key not in self._visited_sections:
+            self._visited_sections.add(section_key)
+            self._mark_dirty()
             return True
             
         return False
@@ -129,36 +374,8 @@ class OnboardingManager:
         if not self.is_first_time_in_section(section):
             return False
             
-        section_help = {
-            "service": (
-                "Service Management",
-                "This section allows you to control the Docker service (daemon).\n"
-                "Start by checking the service status to see if Docker is running."
-            ),
-            "socket": (
-                "Socket Management",
-                "This section allows you to control the Docker socket.\n"
-                "The socket is how applications communicate with Docker."
-            ),
-            "container": (
-                "Container Management",
-                "This section allows you to manage Docker containers.\n"
-                "Try listing containers to see what's currently running."
-            ),
-            "templates": (
-                "Environment Templates",
-                "This section helps you create development environments.\n"
-                "Start by listing available templates to see what's available."
-            ),
-            "info": (
-                "System Information",
-                "This section provides information about your Docker installation.\n"
-                "Check Docker Info to see system-wide details."
-            )
-        }
-        
-        if section in section_help:
-            title, message = section_help[section]
+        if section in _SECTION_HELP:
+            title, message = _SECTION_HELP[section]
             print_section(f"Welcome to {title}")
             print(message)
             print("\nType '?' for more detailed help on this section.")
@@ -229,19 +446,8 @@ class OnboardingManager:
         Args:
             context: Current context (menu, command, etc.)
         """
-        # Map contexts to help topics
-        context_map = {
-            "main_menu": "main",
-            "service_menu": "service",
-            "socket_menu": "socket",
-            "container_menu": "containers",
-            "templates_menu": "templates",
-            "system_menu": "system",
-            "check_privileges": "privileges"
-        }
-        
-        if context in context_map:
-            self.show_topic(context_map[context])
+        if context in _CONTEXT_MAP:
+            self.show_topic(_CONTEXT_MAP[context])
     
     def _show_service_help(self) -> None:
         """Show help for Docker service management."""
@@ -371,55 +577,8 @@ class OnboardingManager:
         Returns:
             True if help was shown, False if no help available for this error
         """
-        error_help = {
-            "service_not_running": (
-                "Docker Service Not Running",
-                "The Docker daemon service isn't running. Try the following:\n\n"
-                "1. Start the service with 'docker_service_manager.py service start'\n"
-                "2. Check if Docker is installed correctly\n"
-                "3. Verify you have sufficient permissions (try running with sudo)"
-            ),
-            "socket_not_available": (
-                "Docker Socket Not Available",
-                "The Docker socket is not accessible. This usually means:\n\n"
-                "1. The Docker service is not running\n"
-                "2. The socket has incorrect permissions\n"
-                "3. You don't have permission to access the socket\n\n"
-                "Try starting both the service and socket, or add your user to the 'docker' group."
-            ),
-            "permission_denied": (
-                "Permission Denied",
-                "You don't have sufficient permissions to perform this operation.\n\n"
-                "On Linux: Use sudo or add your user to the 'docker' group\n"
-                "On Windows: Run as Administrator\n"
-                "On macOS: You may need to enter your password"
-            ),
-            "docker_not_installed": (
-                "Docker Not Installed or Not Found",
-                "Docker doesn't appear to be installed or can't be found in your PATH.\n\n"
-                "1. Install Docker from https://docs.docker.com/get-docker/\n"
-                "2. Ensure Docker is in your PATH environment variable\n"
-                "3. You can use --demo mode to explore this tool without Docker"
-            ),
-            "container_not_found": (
-                "Container Not Found",
-                "The specified container ID or name couldn't be found.\n\n"
-                "1. Check that the container exists with 'docker_service_manager.py containers'\n"
-                "2. Verify you're using the correct container ID or name\n"
-                "3. The container may have been removed or may not be running"
-            ),
-            "template_not_found": (
-                "Template Not Found",
-                "The specified environment template couldn't be found.\n\n"
-                "Available templates are:\n"
-                "- lamp: LAMP Stack (Linux, Apache, MySQL, PHP)\n"
-                "- mean: MEAN Stack (MongoDB, Express, Angular, Node.js)\n"
-                "- wordpress: WordPress development environment"
-            )
-        }
-        
-        if error_code in error_help:
-            title, message = error_help[error_code]
+        if error_code in _ERROR_HELP:
+            title, message = _ERROR_HELP[error_code]
             print_section(f"Error Help: {title}")
             print(message)
             print()
@@ -432,39 +591,17 @@ class OnboardingManager:
         """Show a browser for all available help topics."""
         while True:
             print_section("Help Topics")
-            print("Available topics:")
-            print("1 - Docker Service Management")
-            print("2 - Docker Socket Management")
-            print("3 - Container Management")
-            print("4 - Environment Templates")
-            print("5 - System Information")
-            print("6 - Administrative Privileges")
-            print("7 - Demo Mode")
-            print("8 - System Health Report")
-            print("0 - Return to previous menu")
+            print(_HELP_BROWSER_MENU)
             
             choice = input("Select a topic (0-8): ").strip()
             
             if choice == "0":
                 break
-            elif choice == "1":
-                self._show_service_help()
-            elif choice == "2":
-                self._show_socket_help()
-            elif choice == "3":
-                self._show_containers_help()
-            elif choice == "4":
-                self._show_templates_help()
-            elif choice == "5":
-                self._show_system_help()
-            elif choice == "6":
-                self._show_privileges_help()
-            elif choice == "7":
-                self._show_demo_mode_help()
-            elif choice == "8":
-                self._show_health_report_help()
-            else:
+            handler = self._help_browser_topics.get(choice)
+            if handler is None:
                 print_status("Invalid selection", "error")
+                continue
+            handler()
                 
     def show_all_help_topics(self) -> None:
         """Show all available help topics in a browser."""
@@ -483,106 +620,35 @@ class OnboardingManager:
         # If action is None, no suggestion can be shown
         if action is None:
             return (False, "")
-        # Define suggestions for common tasks
-        suggestions = {
-            # Service management suggestions
-            "service_status": (
-                not self.is_topic_completed("service"),
-                "Tip: Docker service status shows if the daemon is running."
-            ),
-            "service_start": (
-                not self.is_topic_completed("service"),
-                "Tip: After starting the service, try 'status' to verify it's running."
-            ),
-            "service_stop": (
-                not self.is_topic_completed("service"),
-                "Tip: Stopping the service will disconnect all containers."
-            ),
-            "service_restart": (
-                not self.is_topic_completed("service"),
-                "Tip: Restarting is useful when Docker seems unresponsive."
-            ),
-            "service_enable": (
-                not self.is_topic_completed("service"),
-                "Tip: Enabling the service makes Docker start automatically at boot."
-            ),
-            "service_disable": (
-                not self.is_topic_completed("service"),
-                "Tip: Disabling prevents Docker from starting at boot."
-            ),
-            
-            # Socket management suggestions
-            "socket_status": (
-                not self.is_topic_completed("socket"),
-                "Tip: The Docker socket is how tools communicate with Docker."
-            ),
-            "socket_start": (
-                not self.is_topic_completed("socket"),
-                "Tip: Starting the socket allows Docker clients to connect."
-            ),
-            
-            # Container management suggestions
-            "container_list": (
-                not self.is_topic_completed("containers"),
-                "Tip: You can view logs for a specific container using the 'logs' command."
-            ),
-            "container_logs": (
-                not self.is_topic_completed("containers"),
-                "Tip: Container logs are helpful for troubleshooting issues."
-            ),
-            "container_visualize": (
-                not self.is_topic_completed("containers"),
-                "Tip: The container visualization shows real-time state transitions with animation."
-            ),
-            
-            # Template suggestions
-            "templates_list": (
-                not self.is_topic_completed("templates"),
-                "Tip: Templates help you quickly set up development environments."
-            ),
-            "templates_create": (
-                not self.is_topic_completed("templates"),
-                "Tip: Creating an environment generates all necessary configuration files."
-            ),
-            "templates_launch": (
-                not self.is_topic_completed("templates"),
-                "Tip: Launching starts all containers defined in the template."
-            ),
-            
-            # System information suggestions
-            "info_docker": (
-                not self.is_topic_completed("system"),
-                "Tip: Docker info shows system-wide information about your Docker setup."
-            ),
-            "check_privileges": (
-                not self.is_topic_completed("privileges"),
-                "Tip: Many Docker operations require administrative privileges."
-            ),
-            "health_report": (
-                not self.is_topic_completed("system"),
-                "Tip: Health reports provide detailed performance metrics and resource usage."
-            ),
-            "save_report": (
-                not self.is_topic_completed("system"),
-                "Tip: Save reports to track system health over time or for troubleshooting."
-            )
-        }
         
-        # Create context_action key
-        context_action = f"{context}_{action}"
+        # Count the action, and only consider a tip on its first use and every Nth use after
+        key = (context, action)
+        count = self._action_counts.get(key, 0) + 1
+        self._action_counts[key] = count
+        if (count - 1) % _SUGGESTION_INTERVAL:
+            return (False, "")
+        
+        entry = self._SUGGESTIONS.get(f"{context}_{action}")
+        if entry is None:
+            return (False, "")
         
-        if context_action in suggestions:
-            should_show, message = suggestions[context_action]
-            if should_show:
-                print_status(message, "info", demo_mode=self.demo_mode)
-                return (True, message)
+        # Skip the tip once the user has read the matching help topic
+        topic, message = entry
+        if not self.is_topic_completed(topic):
+            print_status(message, "info", demo_mode=self.demo_mode)
+            return (True, message)
                 
         return (False, "")
 
 
+# Shared managers created by get_onboarding: demo_mode -> instance
+_INSTANCES: Dict[bool, OnboardingManager] = {}
+
 # Helper function for easy access
 def get_onboarding(demo_mode: bool = False) -> OnboardingManager:
-    """Get an OnboardingManager instance.
+    """Get the shared OnboardingManager instance for a mode.
+    
+    The instance is created on first use, so the configuration is only loaded once.
     
     Args:
         demo_mode: Whether to use demo mode with simulated responses
@@ -590,4 +656,7 @@ def get_onboarding(demo_mode: bool = False) -> OnboardingManager:
     Returns:
         OnboardingManager instance
     """
-    return OnboardingManager(demo_mode=demo_mode)
\ No newline at end of file
+    manager = _INSTANCES.get(demo_mode)
+    if manager is None:
+        manager = _INSTANCES[demo_mode] = OnboardingManager(demo_mode=demo_mode)
+    return manager
@@ -3,4 +3,20 @@ Terminal User Interface (TUI) components for Docker service management.
 
 This package contains classes and functions for creating an
 interactive terminal user interface using py-cui.
-"""
\ No newline at end of file
+"""
+
+import logging
+
+
+def configure_tui_logging() -> None:
+    """Keep package log messages off the screen while a TUI is running.
+
+    Without a handler of their own, service manager warnings and errors reach
+    stderr through logging's last-resort handler, and a basicConfig() call made
+    by another module would print every INFO line. Either would draw over the
+    curses screen, so the package logger discards its records instead.
+    """
+    logger = logging.getLogger('docker_manager')
+    if not any(isinstance(handler, logging.NullHandler) for handler in logger.handlers):
+        logger.addHandler(logging.NullHandler())
+    logger.propagate = False
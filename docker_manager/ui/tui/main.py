@@ -31,6 +31,7 @@ from ...utils.display import print_status
 from ...utils.system import get_system_info, check_admin_privileges
 from ...templates.environment_templates import TemplateManager
 from ...ai.recommendation import ContainerRecommendationEngine
+from . import configure_tui_logging
 
 # Status emoji indicators
 EMOJI_STATUS = {
@@ -66,6 +67,21 @@ EMOJI_STATUS = {
 class DockerTUI:
     """Terminal User Interface for Docker Service Manager using py-cui."""
 
+    # Menu entries: (label, service manager method, popup subject, past-tense action)
+    SERVICE_ACTIONS = (
+        ("Start Service", "start_service", "Service", "started"),
+        ("Stop Service", "stop_service", "Service", "stopped"),
+        ("Restart Service", "restart_service", "Service", "restarted"),
+        ("Enable Service at Boot", "enable_service", "Service", "enabled at boot"),
+        ("Disable Service at Boot", "disable_service", "Service", "disabled at boot"),
+    )
+    SOCKET_ACTIONS = (
+        ("Start Socket", "start_socket", "Socket", "started"),
+        ("Stop Socket", "stop_socket", "Socket", "stopped"),
+        ("Enable Socket at Boot", "enable_socket", "Socket", "enabled at boot"),
+        ("Disable Socket at Boot", "disable_socket", "Socket", "disabled at boot"),
+    )
+
     def __init__(self, root: py_cui.PyCUI, demo_mode: bool = False):
         """Initialize Docker TUI.
 
@@ -94,7 +110,8 @@ class DockerTUI:
         # Create health report widget
         self._create_health_report_widget()
 
-        self.service_manager = DockerServiceManager(demo_mode=demo_mode)
+        # py-cui owns the screen, so the manager must not print status output
+        self.service_manager = DockerServiceManager(demo_mode=demo_mode, quiet=True)
         self.health_report = HealthReport(demo_mode=demo_mode)
         self.container_visualizer = ContainerVisualizer(demo_mode=demo_mode)
         self.template_manager = TemplateManager(demo_mode=demo_mode)
@@ -194,25 +211,14 @@ class DockerTUI:
         self.service_actions = self.root.add_scroll_menu(
             "Service Actions", 3, 0, row_span=2, column_span=3, padx=1, pady=0
         )
-        self.service_actions.add_item_list([
-            "Start Service",
-            "Stop Service",
-            "Restart Service",
-            "Enable Service at Boot",
-            "Disable Service at Boot"
-        ])
+        self.service_actions.add_item_list([label for label, *_ in self.SERVICE_ACTIONS])
         self.service_actions.add_key_command(py_cui.keys.KEY_ENTER, self._handle_service_action)
 
         # Socket actions
         self.socket_actions = self.root.add_scroll_menu(
             "Socket Actions", 3, 3, row_span=2, column_span=3, padx=1, pady=0
         )
-        self.socket_actions.add_item_list([
-            "Start Socket",
-            "Stop Socket",
-            "Enable Socket at Boot",
-            "Disable Socket at Boot"
-        ])
+        self.socket_actions.add_item_list([label for label, *_ in self.SOCKET_ACTIONS])
         self.socket_actions.add_key_command(py_cui.keys.KEY_ENTER, self._handle_socket_action)
 
 
@@ -554,13 +560,14 @@ class DockerTUI:
 
     def _update_containers_tab(self):
         """Update Containers tab widgets."""
-        # Update container list
-        self.container_list.clear()
-
+        # Update container list in one call
+        items = []
         for container in self.containers:
             status = container.get('status', 'unknown')
             emoji = EMOJI_STATUS.get(status, EMOJI_STATUS['unknown'])
-            self.container_list.add_item(f"{emoji} {container.get('name', 'Unknown')} - {status}")
+            items.append(f"{emoji} {container.get('name', 'Unknown')} - {status}")
+        self.container_list.clear()
+        self.container_list.add_item_list(items)
 
         # Update visualization widget with ASCII art representation
         vis_text = self._generate_container_visualization()
@@ -1387,42 +1394,26 @@ class DockerTUI:
             self.visualization_widget.set_text('\n'.join(details))
             self.visualization_widget.set_title(f"{EMOJI_STATUS.get(container.get('status', 'unknown'), EMOJI_STATUS['unknown'])} Container Details")
 
+    def _dispatch(self, actions: Tuple[Tuple[str, str, str, str], ...], selected_action: Optional[int]):
+        """Run the service manager action selected in a menu and show the result.
+
+        Args:
+            actions: Menu entries the selection refers to
+            selected_action: Index of the selected menu entry
+        """
+        if selected_action is None or not 0 <= selected_action < len(actions):
+            return
+        _, method, subject, action = actions[selected_action]
+        success = getattr(self.service_manager, method)()
+        self._show_status_popup(subject, action, success)
+
     def _handle_service_action(self):
         """Handle service action selection."""
-        selected_action = self.service_actions.get_selected_item_index()
-
-        if selected_action == 0:  # Start Service
-            success = self.service_manager.start_service()
-            self._show_status_popup("Service", "started", success)
-        elif selected_action == 1:  # Stop Service
-            success = self.service_manager.stop_service()
-            self._show_status_popup("Service", "stopped", success)
-        elif selected_action == 2:  # Restart Service
-            success = self.service_manager.restart_service()
-            self._show_status_popup("Service", "restarted", success)
-        elif selected_action == 3:  # Enable Service at Boot
-            success = self.service_manager.enable_service()
-            self._show_status_popup("Service", "enabled at boot", success)
-        elif selected_action == 4:  # Disable Service at Boot
-            success = self.service_manager.disable_service()
-            self._show_status_popup("Service", "disabled at boot", success)
+        self._dispatch(self.SERVICE_ACTIONS, self.service_actions.get_selected_item_index())
 
     def _handle_socket_action(self):
         """Handle socket action selection."""
-        selected_action = self.socket_actions.get_selected_item_index()
-
-        if selected_action == 0:  # Start Socket
-            success = self.service_manager.start_socket()
-            self._show_status_popup("Socket", "started", success)
-        elif selected_action == 1:  # Stop Socket
-            success = self.service_manager.stop_socket()
-            self._show_status_popup("Socket", "stopped", success)
-        elif selected_action == 2:  # Enable Socket at Boot
-            success = self.service_manager.enable_socket()
-            self._show_status_popup("Socket", "enabled at boot", success)
-        elif selected_action == 3:  # Disable Socket at Boot
-            success = self.service_manager.disable_socket()
-            self._show_status_popup("Socket", "disabled at boot", success)
+        self._dispatch(self.SOCKET_ACTIONS, self.socket_actions.get_selected_item_index())
 
     def _handle_template_action(self):
         """Handle template action selection."""
@@ -1483,6 +1474,8 @@ def run_tui(demo_mode: bool = False):
     Args:
         demo_mode: Whether to use demo mode with simulated responses
     """
+    configure_tui_logging()
+
     # Create the py_cui window with 5 rows and 6 columns
     # - Row 0: Navigation menu
     # - Rows 1-4: Content area
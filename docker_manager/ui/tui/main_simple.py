@@ -10,25 +10,18 @@ import os
 import sys
 import time
 import json
+import queue
 import threading
 import datetime
-from typing import Dict, List, Any, Optional, Callable, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Callable, Set, Tuple
 
-import py_cui
-import psutil
-try:
-    import docker
-    from docker.errors import DockerException
-    DOCKER_AVAILABLE = True
-except ImportError:
-    DOCKER_AVAILABLE = False
-
-from ...core.service_manager import DockerServiceManager
-from ...core.health_report import HealthReport
-from ...core.container_visualization import ContainerVisualizer
-from ...utils.display import print_status
 from ...utils.system import get_system_info, check_admin_privileges
-from ...templates.environment_templates import TemplateManager
+from . import configure_tui_logging
+
+# py-cui and the managers are imported when the TUI starts, not when this module is imported
+if TYPE_CHECKING:
+    import py_cui
 
 # Status indicators
 STATUS_INDICATORS = {
@@ -45,37 +38,132 @@ STATUS_INDICATORS = {
     "unknown": "[UNKNOWN]",
 }
 
+# Seconds to wait before a requested refresh, so a burst of actions causes a single refresh
+REFRESH_DEBOUNCE = 0.2
+
+# Minimum seconds between status panel repaints (at most 5 per second)
+STATUS_PANEL_INTERVAL = 0.2
+
+# Most queued widget updates applied per redraw, so the UI thread stays responsive
+UI_QUEUE_BATCH = 50
+
+# Sample containers shown in demo mode
+_DEMO_CONTAINERS = (
+    {"id": "abc123", "name": "web-server", "status": "running", "image": "nginx:latest"},
+    {"id": "def456", "name": "database", "status": "running", "image": "postgres:13"},
+    {"id": "ghi789", "name": "cache", "status": "exited", "image": "redis:alpine"},
+    {"id": "jkl012", "name": "api", "status": "paused", "image": "node:14"},
+    {"id": "mno345", "name": "worker", "status": "restarting", "image": "python:3.9"},
+)
+
 class DockerSimpleTUI:
     """Simple Terminal User Interface for Docker Service Manager using py-cui."""
     
-    def __init__(self, root: py_cui.PyCUI, demo_mode: bool = False):
+    # Service Actions menu entries: (label, service manager method, loading, success and failure messages)
+    SERVICE_ACTIONS = (
+        ("Start Docker Service", "start_service", "Starting Docker service...",
+         "Successfully started Docker service", "Failed to start Docker service"),
+        ("Stop Docker Service", "stop_service", "Stopping Docker service...",
+         "Successfully stopped Docker service", "Failed to stop Docker service"),
+        ("Restart Docker Service", "restart_service", "Restarting Docker service...",
+         "Successfully restarted Docker service", "Failed to restart Docker service"),
+        ("Enable Docker Service", "enable_service", "Enabling Docker service at boot...",
+         "Successfully enabled Docker service at boot", "Failed to enable Docker service at boot"),
+        ("Disable Docker Service", "disable_service", "Disabling Docker service at boot...",
+         "Successfully disabled Docker service at boot", "Failed to disable Docker service at boot"),
+    )
+    
+    def __init__(self, root: "py_cui.PyCUI", demo_mode: bool = False):
         """Initialize the Docker TUI.
         
         Args:
             root: The py-cui root window
             demo_mode: Whether to use demo mode with simulated responses
         """
+        from ...core.service_manager import DockerServiceManager
+        
         self.root = root
         self.demo_mode = demo_mode
-        self.service_manager = DockerServiceManager(demo_mode=demo_mode)
-        self.health_report = HealthReport(demo_mode=demo_mode)
-        self.container_visualizer = ContainerVisualizer(demo_mode=demo_mode)
-        self.template_manager = TemplateManager(demo_mode=demo_mode)
+        # py-cui owns the screen, so the manager must not print status output
+        self.service_manager = DockerServiceManager(demo_mode=demo_mode, quiet=True)
+        self._health_report = None
+        self._container_visualizer = None
+        self._template_manager = None
         
-        self.containers = []
+        # Demo containers are copied once so demo actions can change their status
+        self.containers = [dict(container) for container in _DEMO_CONTAINERS] if demo_mode else []
+        # Entries and container IDs currently shown in the container list
+        self._last_container_signature: Optional[Tuple[str, ...]] = None
+        self._shown_container_ids: List[str] = []
         self.is_admin = check_admin_privileges()
         
+        # py-cui widgets are not thread-safe: other threads queue their widget updates,
+        # and the UI thread applies them on each redraw
+        self._ui_thread = threading.current_thread()
+        self._ui_queue: "queue.SimpleQueue[Tuple[Callable[..., Any], tuple]]" = queue.SimpleQueue()
+        self.root.set_on_draw_update_func(self._drain_ui_queue)
+        self.root.set_refresh_timeout(STATUS_PANEL_INTERVAL)
+        
         # Create the UI layout
         self._create_ui()
         
+        # Service operations run on a persistent worker pool instead of the UI thread
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tui-io")
+        self._inflight: Set[str] = set()  # Keys of operations still running
+        self._inflight_lock = threading.Lock()
+        
+        # Refresh requested after an action; rescheduling replaces a pending one
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._refresh_lock = threading.Lock()
+        
+        # Status panel text for each service state; the demo flag is fixed for the session
+        self._status_summaries = {
+            running: f"Docker Service: {'Running' if running else 'Stopped'} | "
+                     f"Demo Mode: {'ON' if self.demo_mode else 'OFF'}"
+            for running in (True, False)
+        }
+        self._system_summary: Optional[str] = None
+        
+        # Status panel repaints are throttled; a trailing repaint shows the latest text
+        self._panel_text = ""
+        self._panel_timer: Optional[threading.Timer] = None
+        self._last_panel_update = 0.0
+        self._panel_lock = threading.Lock()
+        
         # Start background refresh thread
-        self.stop_refresh = False
+        self._stop_event = threading.Event()
         self.refresh_thread = threading.Thread(target=self._background_refresh)
         self.refresh_thread.daemon = True
         self.refresh_thread.start()
         
+    @property
+    def health_report(self):
+        """Health report generator, created on first use."""
+        if self._health_report is None:
+            from ...core.health_report import HealthReport
+            self._health_report = HealthReport(demo_mode=self.demo_mode)
+        return self._health_report
+    
+    @property
+    def container_visualizer(self):
+        """Container visualizer, created on first use."""
+        if self._container_visualizer is None:
+            from ...core.container_visualization import ContainerVisualizer
+            self._container_visualizer = ContainerVisualizer(demo_mode=self.demo_mode)
+        return self._container_visualizer
+    
+    @property
+    def template_manager(self):
+        """Template manager, created on first use."""
+        if self._template_manager is None:
+            from ...templates.environment_templates import TemplateManager
+            self._template_manager = TemplateManager(demo_mode=self.demo_mode)
+        return self._template_manager
+    
     def _create_ui(self):
         """Create the TUI layout and widgets."""
+        import py_cui
+        
         # Define titles for later use
         status_title = "Docker Status"
         system_title = "System Information"
@@ -106,16 +194,9 @@ class DockerSimpleTUI:
         self.action_menu = self.root.add_scroll_menu(
             service_actions_title, 2, 2, row_span=1, column_span=2, padx=1, pady=0
         )
-        service_actions = [
-            "Start Docker Service",
-            "Stop Docker Service",
-            "Restart Docker Service",
-            "Enable Docker Service",
-            "Disable Docker Service",
-            "Generate Health Report"
-        ]
-        for action in service_actions:
-            self.action_menu.add_item(action)
+        self.action_menu.add_item_list(
+            [label for label, *_ in self.SERVICE_ACTIONS] + ["Generate Health Report"]
+        )
         self.action_menu.add_key_command(py_cui.keys.KEY_ENTER, self._perform_action)
         
         # Container Actions
@@ -152,13 +233,35 @@ class DockerSimpleTUI:
         
     def _background_refresh(self):
         """Background thread to refresh the UI data periodically."""
-        while not self.stop_refresh:
+        while not self._stop_event.is_set():
             try:
                 self._refresh_data()
-                time.sleep(3)  # Refresh every 3 seconds
+                self._stop_event.wait(3)  # Refresh every 3 seconds, waking early on stop
             except Exception as e:
                 self.log_message(f"Error refreshing data: {e}")
-                time.sleep(5)  # Wait longer on error
+                self._stop_event.wait(5)  # Wait longer on error
+    
+    def _schedule_refresh(self, delay: float = REFRESH_DEBOUNCE):
+        """Refresh UI data after a short delay, replacing any refresh already scheduled.
+        
+        Args:
+            delay: Seconds to wait before refreshing
+        """
+        with self._refresh_lock:
+            if self._stop_event.is_set():
+                return
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+            self._refresh_timer = threading.Timer(delay, self._run_scheduled_refresh)
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+    
+    def _run_scheduled_refresh(self):
+        """Run a refresh scheduled by _schedule_refresh."""
+        with self._refresh_lock:
+            if self._refresh_timer is threading.current_thread():
+                self._refresh_timer = None
+        self._refresh_data()
     
     def _refresh_data(self):
         """Refresh UI data."""
@@ -169,53 +272,174 @@ class DockerSimpleTUI:
             try:
                 # Create a short summary of system info for display
                 sys_summary = f"OS: {system_info.get('os', 'Unknown')} | CPU: {system_info.get('cpu', 'Unknown')}"
-                self.system_box.set_text(sys_summary)
+                if sys_summary != self._system_summary:
+                    self._system_summary = sys_summary
+                    self._call_in_ui(self.system_box.set_text, sys_summary)
             except Exception as e:
                 self.log_message(f"Error updating system info: {e}")
             
             try:
-                # Get Docker service status
+                # Get Docker service status; the service manager caches it and drops it after an action
                 service_status, _ = self.service_manager.get_status()
                 socket_status, _ = self.service_manager.get_socket_status()
                 
                 # Create a simplified status display
-                status_summary = f"Docker Service: {'Running' if service_status else 'Stopped'} | " \
-                                 f"Demo Mode: {'ON' if self.demo_mode else 'OFF'}"
-                self.status_box.set_text(status_summary)
+                self._update_status_panel(self._status_summaries[bool(service_status)])
             except Exception as e:
                 self.log_message(f"Error updating Docker status: {e}")
             
             # Update container list
             if service_status or self.demo_mode:
-                # For demo mode, generate sample containers
-                if self.demo_mode:
-                    self.containers = [
-                        {"id": "abc123", "name": "web-server", "status": "running", "image": "nginx:latest"},
-                        {"id": "def456", "name": "database", "status": "running", "image": "postgres:13"},
-                        {"id": "ghi789", "name": "cache", "status": "exited", "image": "redis:alpine"},
-                        {"id": "jkl012", "name": "api", "status": "paused", "image": "node:14"},
-                        {"id": "mno345", "name": "worker", "status": "restarting", "image": "python:3.9"}
-                    ]
+                # Demo mode keeps the sample containers set up at startup
+                if not self.demo_mode:
+                    # Refreshes run off the UI thread, so query Docker directly
+                    try:
+                        self.containers = self._list_containers()
+                    except Exception as e:
+                        self.log_message(f"Error listing containers: {e}")
                 
                 # Update container list UI
-                self.container_list.clear()
+                items = []
+                ids = []
                 for container in self.containers:
                     status = container.get('status', 'unknown')
                     indicator = STATUS_INDICATORS.get(status, STATUS_INDICATORS['unknown'])
-                    self.container_list.add_item(f"{indicator} {container.get('name', 'Unknown')} [{container.get('id', '')[:8]}]")
+                    items.append(f"{indicator} {container.get('name', 'Unknown')} [{container.get('id', '')[:8]}]")
+                    ids.append(container.get('id', ''))
             else:
-                self.container_list.clear()
-                self.container_list.add_item("Docker service is not running")
+                items = ["Docker service is not running"]
+                ids = []
+            self._call_in_ui(self._show_container_items, items, ids)
                 
         except Exception as e:
             self.log_message(f"Error updating UI: {e}")
     
+    def _list_containers(self) -> List[Dict[str, str]]:
+        """List all containers with a single Docker API call.
+        
+        The sparse listing only uses the fields returned by the list endpoint,
+        which avoids an inspect request per container.
+        
+        Returns:
+            List of container dictionaries with id, name, status and image
+        """
+        client = self.service_manager.get_docker_client()
+        containers = []
+        for container in client.containers.list(all=True, sparse=True):
+            attrs = container.attrs
+            names = attrs.get('Names') or ['']
+            containers.append({
+                "id": container.id,
+                "name": names[0].lstrip('/'),
+                "status": attrs.get('State', 'unknown'),
+                "image": attrs.get('Image', 'Unknown'),
+            })
+        return containers
+    
+    def _show_container_items(self, items: List[str], ids: List[str]):
+        """Replace the entries of the container list.
+        
+        Nothing is redrawn when the entries are unchanged, so the scroll position
+        and selection survive refreshes. Otherwise the selected container is
+        selected again if it is still listed.
+        
+        Args:
+            items: Entries to display
+            ids: ID of the container shown by each entry
+        """
+        signature = tuple(items)
+        if signature == self._last_container_signature:
+            return
+        
+        selected_index = self.container_list.get_selected_item_index()
+        selected_id = None
+        if selected_index is not None and 0 <= selected_index < len(self._shown_container_ids):
+            selected_id = self._shown_container_ids[selected_index]
+        
+        self.container_list.clear()
+        self.container_list.add_item_list(items)
+        self._last_container_signature = signature
+        self._shown_container_ids = ids
+        
+        if selected_id in ids:
+            self.container_list.set_selected_item_index(ids.index(selected_id))
+    
+    def _call_in_ui(self, func: Callable[..., Any], *args: Any):
+        """Run a widget update on the UI thread.
+        
+        Called on the UI thread, the update runs immediately; otherwise it is
+        queued and applied on the next redraw.
+        
+        Args:
+            func: Widget method or other callable that touches widgets
+            *args: Arguments for func
+        """
+        if threading.current_thread() is self._ui_thread:
+            func(*args)
+        else:
+            self._ui_queue.put((func, args))
+    
+    def _drain_ui_queue(self):
+        """Apply queued widget updates; called by py-cui on every redraw."""
+        for _ in range(UI_QUEUE_BATCH):
+            try:
+                func, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            func(*args)
+    
+    def _update_status_panel(self, text: str):
+        """Show text in the status panel, repainting at most every STATUS_PANEL_INTERVAL seconds.
+        
+        Updates that arrive too soon are deferred to a single trailing repaint,
+        so the panel always ends up showing the latest text. Text that is
+        already displayed is not repainted.
+        
+        Args:
+            text: Status text to display
+        """
+        with self._panel_lock:
+            if self._panel_timer is None and text == self._panel_text:
+                return
+            self._panel_text = text
+            if self._panel_timer is not None:
+                return
+            wait = self._last_panel_update + STATUS_PANEL_INTERVAL - time.monotonic()
+            if wait > 0:
+                self._panel_timer = threading.Timer(wait, self._flush_status_panel)
+                self._panel_timer.daemon = True
+                self._panel_timer.start()
+                return
+        self._flush_status_panel()
+    
+    def _flush_status_panel(self):
+        """Repaint the status panel with the latest text."""
+        with self._panel_lock:
+            self._panel_timer = None
+            self._last_panel_update = time.monotonic()
+            text = self._panel_text
+        self._call_in_ui(self.status_box.set_text, text)
+    
+    def _selected_container(self) -> Optional[Dict[str, str]]:
+        """Get the container selected in the container list.
+        
+        The selection is resolved through the IDs of the displayed entries, since
+        the refresh thread may already have replaced self.containers.
+        
+        Returns:
+            The selected container, or None if no container entry is selected
+        """
+        selected_index = self.container_list.get_selected_item_index()
+        if selected_index is None or not 0 <= selected_index < len(self._shown_container_ids):
+            return None
+        container_id = self._shown_container_ids[selected_index]
+        return next((c for c in self.containers if c.get('id', '') == container_id), None)
+    
     def _select_container(self):
         """Handle container selection."""
-        selected_index = self.container_list.get_selected_item_index()
+        container = self._selected_container()
         
-        if selected_index is not None and 0 <= selected_index < len(self.containers):
-            container = self.containers[selected_index]
+        if container is not None:
             container_info = [
                 f"ID: {container.get('id', 'Unknown')}",
                 f"Name: {container.get('name', 'Unknown')}",
@@ -224,50 +448,79 @@ class DockerSimpleTUI:
             ]
             self.log_message('\n'.join(container_info))
     
+    def _run_async(self, op_key: str, loading_message: str, operation: Callable[[], bool],
+                   success_message: Optional[str], failure_message: str):
+        """Run an operation on the worker pool and report its result in the log.
+        
+        The UI data is refreshed once the operation finishes. Requests for an
+        operation that is still running are ignored.
+        
+        Args:
+            op_key: Identifies the operation, to reject duplicates while it runs
+            loading_message: Message to log when the operation starts
+            operation: Callable returning True on success
+            success_message: Message to log on success, or None if the operation logs its own
+            failure_message: Message to log on failure
+        """
+        with self._inflight_lock:
+            if op_key in self._inflight:
+                self.log_message("Operation already in progress")
+                return
+            self._inflight.add(op_key)
+        self.log_message(loading_message)
+        
+        def on_done(future: Future):
+            with self._inflight_lock:
+                self._inflight.discard(op_key)
+            try:
+                success = future.result()
+            except Exception as e:
+                self.log_message(f"{failure_message}: {e}")
+            else:
+                if not success:
+                    self.log_message(failure_message)
+                elif success_message is not None:
+                    self.log_message(success_message)
+            self._schedule_refresh()
+        
+        self._executor.submit(operation).add_done_callback(on_done)
+    
+    def _generate_health_report(self) -> bool:
+        """Generate a health report and save it to a file.
+        
+        Returns:
+            True if the report was generated, False otherwise
+        """
+        if not self.health_report.generate_report():
+            return False
+        self.log_message("Health report generated successfully")
+        report_path = self.health_report.save_report("health_report.json")
+        if report_path:
+            self.log_message(f"Report saved to {report_path}")
+        return True
+    
     def _perform_action(self):
         """Perform a service action."""
         selected_index = self.action_menu.get_selected_item_index()
         
-        if selected_index == 0:  # Start Docker Service
-            success = self.service_manager.start_service()
-            self.log_message(f"{'Successfully started' if success else 'Failed to start'} Docker service")
-        elif selected_index == 1:  # Stop Docker Service
-            success = self.service_manager.stop_service()
-            self.log_message(f"{'Successfully stopped' if success else 'Failed to stop'} Docker service")
-        elif selected_index == 2:  # Restart Docker Service
-            success = self.service_manager.restart_service()
-            self.log_message(f"{'Successfully restarted' if success else 'Failed to restart'} Docker service")
-        elif selected_index == 3:  # Enable Docker Service
-            success = self.service_manager.enable_service()
-            self.log_message(f"{'Successfully enabled' if success else 'Failed to enable'} Docker service at boot")
-        elif selected_index == 4:  # Disable Docker Service
-            success = self.service_manager.disable_service()
-            self.log_message(f"{'Successfully disabled' if success else 'Failed to disable'} Docker service at boot")
-        elif selected_index == 5:  # Generate Health Report
-            self.log_message("Generating health report...")
-            success = self.health_report.generate_report()
-            if success:
-                self.log_message("Health report generated successfully")
-                report_path = self.health_report.save_report("health_report.json")
-                if report_path:
-                    self.log_message(f"Report saved to {report_path}")
-            else:
-                self.log_message("Failed to generate health report")
-        
-        # Refresh data after action
-        self._refresh_data()
+        if selected_index is None:
+            return
+        if selected_index < len(self.SERVICE_ACTIONS):
+            _, method, loading, success, failure = self.SERVICE_ACTIONS[selected_index]
+            self._run_async(method, loading, getattr(self.service_manager, method), success, failure)
+        elif selected_index == len(self.SERVICE_ACTIONS):  # Generate Health Report
+            self._run_async("health_report", "Generating health report...", self._generate_health_report,
+                            None, "Failed to generate health report")
     
     def _perform_container_action(self):
         """Perform a container action."""
-        selected_container_index = self.container_list.get_selected_item_index()
+        container = self._selected_container()
         selected_action_index = self.container_actions.get_selected_item_index()
         
-        if selected_container_index is None or selected_container_index >= len(self.containers):
+        if container is None:
             self.log_message("Please select a container first")
             return
         
-        container = self.containers[selected_container_index]
-        
         if selected_action_index == 0:  # View Logs
             self.log_message(f"Showing logs for container {container.get('name', 'Unknown')}")
             if self.demo_mode:
@@ -319,14 +572,14 @@ class DockerSimpleTUI:
                 self.log_message('\n' + visualization)
         
         # Refresh data after action
-        self._refresh_data()
+        self._schedule_refresh()
     
     def log_message(self, message: str):
         """Add a message to the log box."""
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         
         # Append the new message to the log box
-        self.log_box.set_text(f"[{timestamp}] {message}")
+        self._call_in_ui(self.log_box.set_text, f"[{timestamp}] {message}")
     
     def _generate_ascii_visualization(self):
         """Generate a simple ASCII visualization of containers.
@@ -392,8 +645,21 @@ class DockerSimpleTUI:
         return "\n".join(lines)
         
     def stop(self):
-        """Stop the TUI gracefully."""
-        self.stop_refresh = True
+        """Stop the TUI gracefully.
+        
+        Pending refreshes and queued operations are cancelled; an operation that
+        is already running finishes in the background without touching the UI.
+        """
+        self._stop_event.set()
+        with self._refresh_lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+        with self._panel_lock:
+            if self._panel_timer is not None:
+                self._panel_timer.cancel()
+                self._panel_timer = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
         if self.refresh_thread.is_alive():
             self.refresh_thread.join(timeout=1.0)
 
@@ -404,6 +670,10 @@ def run_simple_tui(demo_mode: bool = False):
     Args:
         demo_mode: Whether to use demo mode with simulated responses
     """
+    import py_cui
+    
+    configure_tui_logging()
+    
     # Create the py_cui window - use smaller size for better compatibility
     root = py_cui.PyCUI(5, 4)
     
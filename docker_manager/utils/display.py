@@ -3,7 +3,11 @@ Display utilities for Docker service manager.
 """
 import os
 import shutil
-from typing import List, Tuple, Optional, Any, Dict
+import signal
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Tuple, Optional, Any, Dict, Iterator
 
 # ANSI color codes
 COLORS = {
@@ -28,9 +32,66 @@ def get_terminal_size() -> Tuple[int, int]:
         # Default values if can't determine
         return 80, 24
 
-def show_banner() -> None:
-    """Display tool banner."""
-    terminal_width, _ = get_terminal_size()
+# Set while the SIGWINCH handler is installed, so the cached size is dropped on resize
+_resize_handler_installed = False
+_previous_resize_handler: Any = None
+
+@lru_cache(maxsize=1)
+def _cached_size() -> Tuple[int, int]:
+    """Get terminal width and height once per resize."""
+    return get_terminal_size()
+
+def cached_terminal_size() -> Tuple[int, int]:
+    """Get terminal width and height, cached while the resize handler is installed."""
+    if _resize_handler_installed:
+        return _cached_size()
+    # Without resize notifications the size cannot be cached safely
+    return get_terminal_size()
+
+def _on_resize(signum, frame) -> None:
+    """Drop the cached terminal size, then run any previously installed handler."""
+    _cached_size.cache_clear()
+    if callable(_previous_resize_handler):
+        _previous_resize_handler(signum, frame)
+
+def install_resize_handler() -> bool:
+    """Install a SIGWINCH handler that invalidates the cached terminal size.
+    
+    Not done at import time: curses only handles resizes itself when SIGWINCH
+    has its default disposition, so the TUIs must start without this handler.
+    
+    Returns:
+        True if the handler was installed
+    """
+    global _resize_handler_installed, _previous_resize_handler
+    if _resize_handler_installed or not hasattr(signal, "SIGWINCH"):
+        return _resize_handler_installed
+    try:
+        previous = signal.signal(signal.SIGWINCH, _on_resize)
+    except ValueError:
+        # Signal handlers can only be installed from the main thread
+        return False
+    _previous_resize_handler = previous
+    _cached_size.cache_clear()
+    _resize_handler_installed = True
+    return True
+
+def restore_resize_handler() -> None:
+    """Reinstate the SIGWINCH handler replaced by install_resize_handler()."""
+    global _resize_handler_installed, _previous_resize_handler
+    if not _resize_handler_installed:
+        return
+    signal.signal(signal.SIGWINCH, _previous_resize_handler if _previous_resize_handler is not None else signal.SIG_DFL)
+    _previous_resize_handler = None
+    _resize_handler_installed = False
+
+def format_banner() -> str:
+    """Build the tool banner followed by a full-width rule.
+    
+    Returns:
+        Banner text without a trailing newline
+    """
+    terminal_width, _ = cached_terminal_size()
     banner = f"""
     {COLORS["BOLD"]}____             __                __  ___                                 
    / __ \____  _____/ /_____  _____   /  |/  /___ _____  ____ _____ ____  _____
@@ -40,8 +101,11 @@ def show_banner() -> None:
                                                              /____/             
  Service Manager v1.0 - Cross-platform Docker daemon control{COLORS["RESET"]}"""
     
-    print(banner)
-    print("=" * terminal_width)
+    return f"{banner}\n{'=' * terminal_width}"
+
+def show_banner() -> None:
+    """Display tool banner."""
+    print(format_banner())
     
 def print_status(message: str, status: str, *, demo_mode: bool = False) -> None:
     """Print a status message with color-coded status indicator.
@@ -102,13 +166,44 @@ def print_table(headers: List[str], rows: List[List[Any]]) -> None:
         row_formatted = " | ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
         print(row_formatted)
 
+def format_section(title: str) -> str:
+    """Build a section title with formatting.
+    
+    Args:
+        title: Section title
+    
+    Returns:
+        Section text, starting with a blank line and without a trailing newline
+    """
+    return _section_text(title, cached_terminal_size()[0])
+
+@lru_cache(maxsize=128)
+def _section_text(title: str, terminal_width: int) -> str:
+    """Build section text for a terminal width; titles are mostly constants, so cache them."""
+    return f"\n{COLORS['BOLD']}=== {title} ==={COLORS['RESET']}\n{'-' * min(len(title) + 8, terminal_width)}"
+
 def print_section(title: str) -> None:
     """Print a section title with formatting.
     
     Args:
         title: Section title
     """
-    terminal_width, _ = get_terminal_size()
-    print()
-    print(f"{COLORS['BOLD']}=== {title} ==={COLORS['RESET']}")
-    print("-" * min(len(title) + 8, terminal_width))
\ No newline at end of file
+    print(format_section(title))
+
+@contextmanager
+def buffered_stdout() -> Iterator[None]:
+    """Turn off stdout line buffering and flush once on exit.
+    
+    On a terminal every print() normally flushes; inside this block output is
+    collected in the stream's buffer so a screen of prints costs one write.
+    """
+    line_buffering = getattr(sys.stdout, "line_buffering", False)
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if line_buffering and reconfigure:
+        reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        if line_buffering and reconfigure:
+            reconfigure(line_buffering=True)
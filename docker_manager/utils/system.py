@@ -4,24 +4,15 @@ System utilities for Docker service manager.
 import os
 import sys
 import platform
+import importlib.util
 import subprocess
 from typing import List, Tuple, Optional, Any, Dict
 
 def check_requirements() -> bool:
     """Check if required dependencies are installed."""
-    # Check for Docker SDK
-    try:
-        import docker
-        docker_available = True
-    except ImportError:
-        docker_available = False
-    
-    # Check for tabulate
-    try:
-        import tabulate
-        tabulate_available = True
-    except ImportError:
-        tabulate_available = False
+    # Look the packages up without importing them; they are imported on first use
+    docker_available = importlib.util.find_spec('docker') is not None
+    tabulate_available = importlib.util.find_spec('tabulate') is not None
     
     # Report on requirements
     if not docker_available:
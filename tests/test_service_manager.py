@@ -1,10 +1,12 @@
 
+import io
 import unittest
 from unittest.mock import patch, MagicMock
 import platform
 import docker
-from docker_manager.core.service_manager import DockerServiceManager
+from docker_manager.core.service_manager import DockerServiceManager, _echo_commands
 from docker_manager.core.health_report import HealthReport
+from docker_manager.ui.interactive import InteractiveConsole, _LOG_PROMPT_FIELDS
 
 class TestDockerServiceManager(unittest.TestCase):
     def setUp(self):
@@ -21,6 +23,24 @@ class TestDockerServiceManager(unittest.TestCase):
         success, output = self.manager.list_containers()
         self.assertTrue(success)
 
+    def test_status_cache(self):
+        probe = MagicMock(side_effect=[(True, 'active'), (True, 'inactive')])
+        self.assertEqual(self.manager._cached('status', probe), (True, 'active'))
+        self.assertEqual(self.manager._cached('status', probe), (True, 'active'))
+        self.manager.invalidate_cache()
+        self.assertEqual(self.manager._cached('status', probe), (True, 'inactive'))
+        self.assertEqual(probe.call_count, 2)
+
+    def test_wait_skips_placeholder_commands(self):
+        # Undetected Linux has no is_active key and only echo placeholders
+        self.manager._commands = _echo_commands('Docker service not detected')
+        with patch.object(self.manager, '_run_command') as run, \
+                patch('docker_manager.core.service_manager.time.sleep') as sleep:
+            self.assertFalse(self.manager._wait_until_active('status'))
+            self.assertFalse(self.manager._wait_until_active('socket_status'))
+        run.assert_not_called()
+        sleep.assert_not_called()
+
 class TestHealthReport(unittest.TestCase):
     def setUp(self):
         self.health_report = HealthReport(demo_mode=True)
@@ -33,5 +53,30 @@ class TestHealthReport(unittest.TestCase):
         self.health_report.generate_report()
         self.assertIn('recommendations', self.health_report.report_data)
 
+    def test_recommendations_memoized(self):
+        report = self.health_report
+        with patch.object(report, '_check_system_metrics',
+                          wraps=report._check_system_metrics) as check:
+            report.generate_report()
+            report.generate_report()
+            self.assertEqual(check.call_count, 1)
+            self.assertEqual(report._last_recs[0], report.report_data['recommendations'])
+
+            report.report_data['system'].setdefault('cpu', {})['percent'] = 95
+            report._generate_recommendations()
+            self.assertEqual(check.call_count, 2)
+            self.assertIn('cpu', [r['component'] for r in report.report_data['recommendations']])
+
+class TestInteractiveConsole(unittest.TestCase):
+    def test_prompt_multi_scripted_line(self):
+        # _prompt_multi only needs _parse_answer, so skip the console setup
+        console = InteractiveConsole.__new__(InteractiveConsole)
+        line = ' container_id = web ; tail = 50 ; follow = y'
+        with patch('builtins.input', return_value=line) as prompt, \
+                patch('sys.stdin', io.StringIO()):
+            values = console._prompt_multi(_LOG_PROMPT_FIELDS)
+        self.assertEqual(values, {'container_id': 'web', 'tail': 50, 'follow': True})
+        prompt.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main()